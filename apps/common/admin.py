@@ -1 +1,61 @@
-# Register your models here.
+from django.contrib.admin import (
+    DateFieldListFilter,
+    ModelAdmin,
+    # Methods
+    action,
+    register,
+)
+from django.utils import timezone
+
+from apps.common.models import BackgroundJob, BackgroundJobStatusChoices
+
+
+# * <<-------------------------------------*** Background Job Admin ***-------------------------------------->>
+@register(BackgroundJob)
+class BackgroundJobAdmin(ModelAdmin):
+    list_display = (
+        "id",
+        "task",
+        "status",
+        "attempts",
+        "max_attempts",
+        "run_after",
+        "locked_by",
+        "finished_at",
+        "created_at",
+    )
+    list_display_links = (
+        "id",
+        "task",
+    )
+    list_filter = (
+        "status",
+        "task",
+        ("created_at", DateFieldListFilter),
+    )
+    search_fields = (
+        "id",
+        "task",
+    )
+    readonly_fields = (
+        "attempts",
+        "locked_by",
+        "locked_at",
+        "finished_at",
+        "last_error",
+        "created_at",
+        "updated_at",
+    )
+    ordering = ("-id",)
+    list_per_page = 50
+    actions = ("retry_jobs",)
+
+    @action(description="Retry the selected failed jobs")
+    def retry_jobs(self, request, queryset):
+        retried = queryset.filter(status=BackgroundJobStatusChoices.FAILED).update(
+            status=BackgroundJobStatusChoices.PENDING,
+            attempts=0,
+            run_after=timezone.now(),
+            finished_at=None,
+        )
+        self.message_user(request, f"{retried} jobs queued again")
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
+
+    def ready(self):
+        # Register the signal receivers
+        from apps.common.signals.media_blob_signal import connect_media_blob_signals
+
+        connect_media_blob_signals()
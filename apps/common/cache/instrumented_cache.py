@@ -0,0 +1,32 @@
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from apps.common.functions.request_metrics import record_cache_lookup
+
+
+# * <<-------------------------------------*** Instrumented Cache ***-------------------------------------->>
+class InstrumentedCacheMixin:
+    """
+    Counts the hits and misses of ``get`` towards the request timing metrics.
+    """
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, self._missing_key, version=version)
+        if value is self._missing_key:
+            record_cache_lookup(misses=1)
+            return default
+        record_cache_lookup(hits=1)
+        return value
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    # get_many() of the base backend goes through get(), already counted
+    pass
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = super().get_many(keys, version=version)
+        record_cache_lookup(hits=len(values), misses=len(keys) - len(values))
+        return values
@@ -125,6 +125,25 @@ class ParameterAPIDocumentation:
             examples=[OpenApiExample("Offset Example", value=0)],
         )
 
+    @staticmethod
+    def get_cursor_parameter():
+        return OpenApiParameter(
+            name="cursor",
+            type=str,
+            description="Opaque cursor from the next or previous link of a keyset page",
+            examples=[OpenApiExample("Cursor Example", value="eyJrIjo5OSwiaSI6OTl9")],
+        )
+
+    @staticmethod
+    def get_count_parameter():
+        return OpenApiParameter(
+            name="count",
+            type=str,
+            enum=["exact", "estimate", "none"],
+            description="Total count mode: exact COUNT(*), planner estimate or none",
+            examples=[OpenApiExample("Count Example", value="estimate")],
+        )
+
     @staticmethod
     def get_field_list_parameter(
         fields_list: str = "id,",
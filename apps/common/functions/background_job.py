@@ -0,0 +1,174 @@
+import os
+import socket
+import traceback
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from loguru import logger
+
+from apps.common.models import BackgroundJob, BackgroundJobStatusChoices
+from apps.common.routers.replica_router import use_primary
+
+
+def get_task_path(func) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def get_worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+
+def enqueue_background_job(
+    func,
+    *,
+    delay: float = 0,
+    max_attempts: int | None = None,
+    using: str | None = None,
+    **payload,
+) -> BackgroundJob:
+    """
+    Queues ``func(**payload)`` to run in a background worker.
+
+    Call it inside the transaction that writes the data the job works on;
+    the job becomes visible to workers when that transaction commits.
+
+    Args:
+        func: A module level function, stored by its dotted path.
+        delay (float): Seconds before the job may run.
+        max_attempts (int | None): Runs before the job is failed, ``BACKGROUND_JOB_MAX_ATTEMPTS`` by default.
+        using (str | None): The database alias of the enqueueing transaction.
+        **payload: JSON serializable keyword arguments of ``func``.
+
+    Returns:
+        BackgroundJob: The pending job.
+    """
+    job = BackgroundJob.objects.using(using).create(
+        task=get_task_path(func),
+        payload=payload,
+        max_attempts=max_attempts or settings.BACKGROUND_JOB_MAX_ATTEMPTS,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+    if settings.BACKGROUND_JOBS_EAGER:
+        transaction.on_commit(partial(run_background_job, job.id), using=using)
+    return job
+
+
+def get_claimable_jobs_q(now) -> Q:
+    lease_expired_at = now - timedelta(seconds=settings.BACKGROUND_JOB_LEASE_TIMEOUT)
+    return Q(status=BackgroundJobStatusChoices.PENDING, run_after__lte=now) | Q(
+        status=BackgroundJobStatusChoices.RUNNING, locked_at__lt=lease_expired_at
+    )
+
+
+def claim_background_jobs(limit: int, worker_name: str | None = None) -> list[int]:
+    """
+    Claims up to ``limit`` due jobs, including the ones of crashed workers.
+
+    Every claim is a conditional ``UPDATE`` of one row, so concurrent workers
+    never run the same job twice, on PostgreSQL and SQLite alike.
+
+    Returns:
+        list[int]: The ids of the claimed jobs.
+    """
+    now = timezone.now()
+    claimable_q = get_claimable_jobs_q(now)
+    worker_name = worker_name or get_worker_name()
+
+    claimed = []
+    for job_id in (
+        BackgroundJob.objects.filter(claimable_q)
+        .order_by("run_after", "id")
+        .values_list("id", flat=True)[: limit * 2]
+    ):
+        if len(claimed) == limit:
+            break
+        if BackgroundJob.objects.filter(claimable_q, id=job_id).update(
+            status=BackgroundJobStatusChoices.RUNNING,
+            attempts=F("attempts") + 1,
+            locked_by=worker_name,
+            locked_at=now,
+            updated_at=now,
+        ):
+            claimed.append(job_id)
+    return claimed
+
+
+def run_background_job(job_id: int) -> str:
+    """
+    Runs a job and records its outcome.
+
+    A failed job is retried with an exponential backoff until it reaches its
+    ``max_attempts``, the traceback of the last failure is kept in ``last_error``.
+
+    Returns:
+        str: The job status after the run.
+    """
+    job = BackgroundJob.objects.get(id=job_id)
+    if job.status != BackgroundJobStatusChoices.RUNNING:
+        # Run eagerly, not claimed by a worker
+        job.attempts += 1
+
+    try:
+        # The job was queued right after its data was written, a replica may not have it yet
+        with use_primary():
+            import_string(job.task)(**job.payload)
+    except Exception as e:
+        logger.error(f"ERROR(run_background_job):---->> {job.task} {e}")
+        now = timezone.now()
+        if job.attempts < job.max_attempts:
+            status = BackgroundJobStatusChoices.PENDING
+            retry_delay = settings.BACKGROUND_JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+            run_after = now + timedelta(seconds=retry_delay)
+            finished_at = None
+        else:
+            status = BackgroundJobStatusChoices.FAILED
+            run_after = job.run_after
+            finished_at = now
+        BackgroundJob.objects.filter(id=job.id).update(
+            status=status,
+            attempts=job.attempts,
+            run_after=run_after,
+            finished_at=finished_at,
+            last_error=traceback.format_exc(),
+            locked_by=None,
+            locked_at=None,
+            updated_at=now,
+        )
+        return status
+
+    now = timezone.now()
+    BackgroundJob.objects.filter(id=job.id).update(
+        status=BackgroundJobStatusChoices.SUCCEEDED,
+        attempts=job.attempts,
+        finished_at=now,
+        locked_by=None,
+        locked_at=None,
+        updated_at=now,
+    )
+    return BackgroundJobStatusChoices.SUCCEEDED
+
+
+def get_background_job_counts() -> dict[str, int]:
+    """
+    Returns the number of pending, running and failed jobs, the queue depth.
+
+    Succeeded jobs are left out, counting them would scan the whole history.
+    """
+    statuses = [
+        BackgroundJobStatusChoices.PENDING,
+        BackgroundJobStatusChoices.RUNNING,
+        BackgroundJobStatusChoices.FAILED,
+    ]
+    counts = dict.fromkeys(statuses, 0)
+    counts.update(
+        BackgroundJob.objects.filter(status__in=statuses)
+        .values_list("status")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return counts
@@ -1,4 +1,4 @@
-from datetime import datetime
+import datetime
 
 
 def get_generated_barcode(product_id: str) -> str:
@@ -1,25 +1,274 @@
 import datetime
+import os
+import threading
+from collections.abc import Callable
 
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    IntegrityError,
+    connections,
+    transaction,
+)
 from django.db.models import Model
+from django.db.models.functions import Length
 
+from apps.common.models import CustomIdSequence
 
-def get_generated_custom_id(
+CUSTOM_ID_BLOCK_SIZE = 100
+CUSTOM_ID_COUNTER_WIDTH = 4
+CUSTOM_ID_DATE_FORMAT = "%d%m%y"
+
+
+class CustomIdAllocator:
+    """
+    Hands out custom ID counters from blocks reserved in the CustomIdSequence table.
+
+    Each worker process reserves ``block_size`` counters per ``<prefix><ddmmyy>`` key
+    with a single UPDATE and serves them from memory afterwards, so generating an ID
+    costs no query until the block runs out. Reservations are atomic row updates, so
+    parallel workers never receive overlapping counters. Where a reservation cannot be
+    committed on its own, only the requested counters are reserved and nothing is cached.
+    """
+
+    def __init__(
+        self,
+        block_size: int = CUSTOM_ID_BLOCK_SIZE,
+        using: str = DEFAULT_DB_ALIAS,
+    ):
+        self.block_size = block_size
+        self.using = using
+        self.reset()
+
+        # A forked worker must never reuse the counters reserved by its parent
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.reset)
+
+    def reset(self) -> None:
+        """
+        Drops every reserved block held by this process.
+        """
+        # prefix -> (date_part, next_counter, last_counter)
+        self._blocks: dict[str, tuple[str, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def allocate(
+        self,
+        id_prefix: str,
+        date_part: str,
+        count: int = 1,
+        seed: Callable[[], int] | None = None,
+    ) -> list[int]:
+        """
+        Returns ``count`` unused counters for the given prefix and date.
+
+        Args:
+            id_prefix (str): The ID prefix, i.e. "PRO".
+            date_part (str): The formatted date the counters belong to.
+            count (int): The number of counters to hand out.
+            seed (Callable[[], int] | None): Returns the highest counter already in use.
+                Only called when the sequence row for the key does not exist yet.
+
+        Returns:
+            list[int]: The allocated counters in ascending order.
+        """
+        counters: list[int] = []
+
+        with self._lock:
+            block_date, next_counter, last_counter = self._blocks.get(
+                id_prefix, (date_part, 1, 0)
+            )
+            if block_date != date_part:
+                # A new day starts a new sequence, the old block is useless now
+                next_counter, last_counter = 1, 0
+
+            while len(counters) < count:
+                if next_counter > last_counter and not self.can_reserve_independently():
+                    # The reservation would roll back with the caller's transaction while
+                    # a cached block outlives it, so reserve exactly what is needed
+                    remaining = count - len(counters)
+                    last_reserved = self._reserve_block(
+                        sequence_key=f"{id_prefix}{date_part}",
+                        block_size=remaining,
+                        floor=last_counter,
+                        seed=seed,
+                    )
+                    counters.extend(
+                        range(last_reserved - remaining + 1, last_reserved + 1)
+                    )
+                    next_counter, last_counter = 1, 0
+                    break
+
+                if next_counter > last_counter:
+                    block_size = max(self.block_size, count - len(counters))
+                    last_counter = self._reserve_block(
+                        sequence_key=f"{id_prefix}{date_part}",
+                        block_size=block_size,
+                        floor=last_counter,
+                        seed=seed,
+                    )
+                    next_counter = last_counter - block_size + 1
+
+                take = min(count - len(counters), last_counter - next_counter + 1)
+                counters.extend(range(next_counter, next_counter + take))
+                next_counter += take
+
+            self._blocks[id_prefix] = (date_part, next_counter, last_counter)
+
+        return counters
+
+    def can_reserve_independently(self) -> bool:
+        """
+        Tells if a reservation is committed whatever the caller's transaction does.
+
+        Inside an atomic block the reservation runs on a private connection, except
+        on SQLite, whose single writer lock the caller's transaction already holds.
+        """
+        connection = connections[self.using]
+        return not connection.in_atomic_block or connection.vendor != "sqlite"
+
+    def _reserve_block(
+        self,
+        sequence_key: str,
+        block_size: int,
+        floor: int,
+        seed: Callable[[], int] | None,
+    ) -> int:
+        """
+        Reserves the next block for a key and returns its last counter.
+
+        ``floor`` is the last counter this process already holds, which keeps a block
+        from being handed out twice when the reserving transaction is rolled back.
+        """
+        connection = connections[self.using]
+
+        for attempt in range(3):
+            try:
+                if connection.in_atomic_block and connection.vendor != "sqlite":
+                    # Reserve on a private connection so the block is committed even if
+                    # the caller's transaction rolls back afterwards.
+                    return self._reserve_on_private_connection(
+                        sequence_key, block_size, floor, seed
+                    )
+
+                with transaction.atomic(using=self.using):
+                    return self._reserve_on_connection(
+                        connection, sequence_key, block_size, floor, seed
+                    )
+
+            except IntegrityError:
+                # Another worker created the sequence row first, update it instead
+                if attempt == 2:
+                    raise
+
+    def _reserve_on_private_connection(
+        self,
+        sequence_key: str,
+        block_size: int,
+        floor: int,
+        seed: Callable[[], int] | None,
+    ) -> int:
+        reserve_connection = connections.create_connection(self.using)
+        try:
+            reserve_connection.set_autocommit(False)
+            try:
+                last_counter = self._reserve_on_connection(
+                    reserve_connection, sequence_key, block_size, floor, seed
+                )
+                reserve_connection.commit()
+            except Exception:
+                reserve_connection.rollback()
+                raise
+
+            return last_counter
+
+        finally:
+            reserve_connection.close()
+
+    @staticmethod
+    def _reserve_on_connection(
+        connection,
+        sequence_key: str,
+        block_size: int,
+        floor: int,
+        seed: Callable[[], int] | None,
+    ) -> int:
+        table = connection.ops.quote_name(CustomIdSequence._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} "
+                "SET last_value = CASE WHEN last_value < %s THEN %s ELSE last_value END + %s "
+                "WHERE sequence_key = %s",
+                [floor, floor, block_size, sequence_key],
+            )
+            if cursor.rowcount:
+                cursor.execute(
+                    f"SELECT last_value FROM {table} WHERE sequence_key = %s",
+                    [sequence_key],
+                )
+                return cursor.fetchone()[0]
+
+            # First reservation for this key, start after the IDs that already exist
+            last_counter = max(floor, seed() if seed else 0) + block_size
+            cursor.execute(
+                f"INSERT INTO {table} (sequence_key, last_value) VALUES (%s, %s)",
+                [sequence_key, last_counter],
+            )
+            return last_counter
+
+
+# Process wide allocator shared by every model that generates custom IDs
+custom_id_allocator = CustomIdAllocator()
+
+
+def get_latest_custom_id_counter(
+    id_prefix: str,
+    formatted_date: str,
+    field: str,
+    model_class: type[Model],
+) -> int:
+    """
+    Returns the highest counter stored in ``field`` for the given prefix and date.
+
+    Counters are not zero padded past four digits, so the latest ID is the longest one
+    and, among equally long IDs, the greatest one.
+    """
+    latest_value = (
+        model_class._default_manager.filter(
+            **{f"{field}__startswith": f"{id_prefix}{formatted_date}"}
+        )
+        .order_by(Length(field).desc(), f"-{field}")
+        .values_list(field, flat=True)
+        .first()
+    )
+    if not latest_value:
+        return 0
+
+    try:
+        return int(latest_value[len(id_prefix) + len(formatted_date) :])
+    except ValueError:
+        return 0  # Fallback if the latest ID's counter isn't a valid number
+
+
+def get_generated_custom_ids(
     id_prefix: str,
     field: str,
     model_class: type[Model],
+    count: int,
     *args,
     **kwargs,
-) -> str:
+) -> list[str]:
     """
-    Generates a custom order place ID with a prefix, date, and incremented counter.
+    Generates ``count`` custom IDs with a prefix, date, and an incremented counter.
 
     Args:
         id_prefix (str): The prefix to prepend to the ID (e.g., 'INV').
-        field (str): The model field to order by and extract the last counter value.
+        field (str): The model field that stores the generated ID.
         model_class (Type[Model]): The Django model class.
+        count (int): The number of IDs to generate.
 
     Returns:
-        str: The generated custom order ID.
+        list[str]: The generated custom IDs, i.e. ["PRO1711240001", "PRO1711240002"].
 
     Raises:
         ValueError: If the specified field does not exist in the model.
@@ -30,35 +279,48 @@ def get_generated_custom_id(
             f"The field '{field}' does not exist in the model '{model_class.__name__}'."
         )
 
-    current_date = datetime.date.today()
-    formatted_date = current_date.strftime("%d%m%y")
+    formatted_date = datetime.date.today().strftime(CUSTOM_ID_DATE_FORMAT)
 
-    # Fetch the latest ID that matches the current prefix and date
-    latest_instance = (
-        model_class.objects.filter(
-            **{f"{field}__startswith": f"{id_prefix}{formatted_date}"}
-        )
-        .order_by(f"-{field}")  # Order by the field in descending order
-        .first()
+    counters = custom_id_allocator.allocate(
+        id_prefix=id_prefix,
+        date_part=formatted_date,
+        count=count,
+        seed=lambda: get_latest_custom_id_counter(
+            id_prefix, formatted_date, field, model_class
+        ),
     )
 
-    # Extract the last counter and increment, or start with 1 if none exist
-    if latest_instance:
-        latest_field_value = getattr(latest_instance, field, "")
-        try:
-            # Extract the last 4 digits as the counter
-            previous_counter = int(latest_field_value[-4:])
-            new_counter = (
-                previous_counter + 1
-            ) % 10000  # Increment and reset if > 9999
-        except ValueError:
-            new_counter = 1  # Fallback if the latest ID's counter isn't a valid number
-    else:
-        new_counter = 1
-
-    # Ensure the counter is always four digits with leading zeros
-    formatted_counter = str(new_counter).zfill(4)
-
-    # Construct the new ID
-    new_id = f"{id_prefix}{formatted_date}{formatted_counter}"
-    return new_id
+    # The counter is at least four digits wide and keeps growing past 9999
+    return [
+        f"{id_prefix}{formatted_date}{str(counter).zfill(CUSTOM_ID_COUNTER_WIDTH)}"
+        for counter in counters
+    ]
+
+
+def get_generated_custom_id(
+    id_prefix: str,
+    field: str,
+    model_class: type[Model],
+    *args,
+    **kwargs,
+) -> str:
+    """
+    Generates a custom order place ID with a prefix, date, and incremented counter.
+
+    Args:
+        id_prefix (str): The prefix to prepend to the ID (e.g., 'INV').
+        field (str): The model field that stores the generated ID.
+        model_class (Type[Model]): The Django model class.
+
+    Returns:
+        str: The generated custom order ID.
+
+    Raises:
+        ValueError: If the specified field does not exist in the model.
+    """
+    return get_generated_custom_ids(
+        id_prefix=id_prefix,
+        field=field,
+        model_class=model_class,
+        count=1,
+    )[0]
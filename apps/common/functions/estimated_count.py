@@ -0,0 +1,83 @@
+import json
+
+from django.db import connections
+from django.db.models import QuerySet
+from loguru import logger
+
+
+def get_table_estimated_count(queryset: QuerySet) -> int | None:
+    """
+    Returns the planner row estimate of the whole table from ``pg_class.reltuples``.
+
+    Returns None if the table was never analyzed.
+    """
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+
+    # PostgreSQL 14+ reports -1 for tables that were never vacuumed or analyzed
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def get_query_estimated_count(queryset: QuerySet) -> int | None:
+    """
+    Returns the planner row estimate of a filtered queryset from ``EXPLAIN``.
+    """
+    connection = connections[queryset.db]
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        row = cursor.fetchone()
+
+    if not row:
+        return None
+
+    plan = json.loads(row[0]) if isinstance(row[0], str) else row[0]
+    if isinstance(plan, list):
+        plan = plan[0]
+    return int(plan["Plan"]["Plan Rows"])
+
+
+def get_planner_estimated_count(queryset: QuerySet) -> int | None:
+    """
+    Returns the PostgreSQL planner row estimate of a queryset, or None without one.
+
+    An unfiltered queryset reads ``pg_class.reltuples`` and a filtered one
+    reads the planner estimate, so neither scans the table. Other backends
+    and tables without statistics have no estimate.
+    """
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    try:
+        if not queryset.query.where and not queryset.query.distinct:
+            return get_table_estimated_count(queryset)
+        return get_query_estimated_count(queryset)
+    except Exception as e:
+        logger.error(f"ERROR(get_planner_estimated_count):---->> {e}")
+        return None
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Returns a cheap approximate row count for a queryset.
+
+    The planner estimate on PostgreSQL, see ``get_planner_estimated_count``.
+    Other backends, and tables without statistics, fall back to an exact
+    ``COUNT(*)``.
+
+    Args:
+        queryset (QuerySet): The queryset to count.
+
+    Returns:
+        int: The estimated number of rows.
+    """
+    estimated_count = get_planner_estimated_count(queryset)
+    if estimated_count is not None:
+        return estimated_count
+    return queryset.count()
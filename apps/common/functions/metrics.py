@@ -0,0 +1,374 @@
+import atexit
+import fcntl
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+from django.conf import settings
+from loguru import logger
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+# The summed counters and histograms of exited processes, and the lock folding them
+EXITED_PROCESSES_FILE_NAME = "exited.json"
+FOLD_LOCK_FILE_NAME = "fold.lock"
+
+
+def escape_label_value(value) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def format_labels(label_names: tuple[str, ...], labels: tuple, **extra) -> str:
+    pairs = [*zip(label_names, labels), *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{escape_label_value(v)}"' for k, v in pairs) + "}"
+
+
+def is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_snapshot(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        # Removed or replaced since listed
+        return None
+
+
+def write_snapshot(directory: Path, file_name: str, snapshot: dict) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    # Written aside and renamed, a scrape never reads a partial file
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, suffix=".tmp", delete=False
+    ) as file:
+        json.dump(snapshot, file)
+    os.replace(file.name, directory / file_name)
+
+
+# * <<-------------------------------------*** Metrics Registry ***-------------------------------------->>
+class MetricsRegistry:
+    """
+    In-process Prometheus style counters, gauges and histograms.
+
+    Recording a value is a dict update under an uncontended lock, nothing is
+    written on the request path. With ``METRICS_MULTIPROCESS_DIR`` set, every
+    server worker process dumps its values to its own file in that directory
+    at most every ``METRICS_FLUSH_INTERVAL`` seconds, and a scrape sums the
+    files of all processes. Counters and histograms of exited processes keep
+    counting, their gauges are dropped.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # name -> (type, help, label names, buckets)
+        self.metrics: dict[str, tuple[str, str, tuple[str, ...], tuple]] = {}
+        self.gauge_collectors = []
+        self.reset()
+        os.register_at_fork(after_in_child=self.reset)
+        atexit.register(self.flush)
+
+    def reset(self) -> None:
+        # Values inherited by a forked worker belong to its parent
+        self.pid = os.getpid()
+        self.file_name = f"{self.pid}-{time.time_ns()}.json"
+        self.last_flushed_at = time.monotonic()
+        self.values: dict[tuple[str, tuple], float] = {}
+        self.histograms: dict[tuple[str, tuple], list[float]] = {}
+
+    def counter(self, name: str, help_text: str, label_names: tuple = ()) -> None:
+        self.metrics[name] = (COUNTER, help_text, label_names, ())
+
+    def gauge(self, name: str, help_text: str, label_names: tuple = ()) -> None:
+        self.metrics[name] = (GAUGE, help_text, label_names, ())
+
+    def histogram(
+        self, name: str, help_text: str, label_names: tuple = (), buckets=()
+    ) -> None:
+        self.metrics[name] = (HISTOGRAM, help_text, label_names, tuple(buckets))
+
+    def add_gauge_collector(self, collector) -> None:
+        """
+        Adds a ``collector(registry)`` setting per process gauges right before they are read.
+        """
+        self.gauge_collectors.append(collector)
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1) -> None:
+        key = (name, labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def set(self, name: str, value: float, labels: tuple = ()) -> None:
+        with self.lock:
+            self.values[(name, labels)] = value
+
+    def observe(self, name: str, value: float, labels: tuple = ()) -> None:
+        buckets = self.metrics[name][3]
+        key = (name, labels)
+        with self.lock:
+            # One count per bucket plus +Inf, then the sum
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(buckets) + 2)
+            histogram[bisect_left(buckets, value)] += 1
+            histogram[-1] += value
+
+    # * <<----*** Multi Process ***---->>
+    def snapshot(self) -> dict:
+        for collector in self.gauge_collectors:
+            try:
+                collector(self)
+            except Exception as e:
+                logger.error(f"ERROR(MetricsRegistry):---->> {e}")
+        with self.lock:
+            return {
+                "pid": self.pid,
+                "values": [
+                    [name, list(labels), v] for (name, labels), v in self.values.items()
+                ],
+                "histograms": [
+                    [name, list(labels), list(h)]
+                    for (name, labels), h in self.histograms.items()
+                ],
+            }
+
+    def flush(self) -> None:
+        directory = getattr(settings, "METRICS_MULTIPROCESS_DIR", None)
+        if not directory:
+            return
+        self.last_flushed_at = time.monotonic()
+        snapshot = self.snapshot()
+        try:
+            write_snapshot(Path(directory), self.file_name, snapshot)
+        except OSError as e:
+            logger.error(f"ERROR(MetricsRegistry):---->> {e}")
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self.last_flushed_at >= settings.METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def get_snapshots(self) -> list[dict]:
+        snapshots = [self.snapshot()]
+        directory = getattr(settings, "METRICS_MULTIPROCESS_DIR", None)
+        if not directory or not os.path.isdir(directory):
+            return snapshots
+
+        directory = Path(directory)
+        try:
+            self.fold_exited_processes(directory)
+        except OSError as e:
+            logger.error(f"ERROR(MetricsRegistry):---->> {e}")
+
+        process_snapshots = {}
+        for path in directory.glob("*.json"):
+            if path.name in (self.file_name, EXITED_PROCESSES_FILE_NAME):
+                continue
+            if (snapshot := read_snapshot(path)) is not None:
+                process_snapshots[path.name] = snapshot
+
+        # Read after the process files, a file folded meanwhile is counted once
+        exited = read_snapshot(directory / EXITED_PROCESSES_FILE_NAME)
+        if exited is not None:
+            snapshots.append(exited)
+            for file_name in exited["folded"]:
+                process_snapshots.pop(file_name, None)
+        return snapshots + list(process_snapshots.values())
+
+    def fold_exited_processes(self, directory: Path) -> None:
+        """
+        Sums the files of exited processes into one and removes them.
+
+        Without it every worker restart leaves a file behind that each scrape
+        reads again. Their gauges are dropped, a scrape ignores them anyway.
+        One scrape folds at a time, the others skip it.
+        """
+        with open(directory / FOLD_LOCK_FILE_NAME, "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return
+
+            exited_path = directory / EXITED_PROCESSES_FILE_NAME
+            exited = read_snapshot(exited_path) or {
+                "pid": None,
+                "values": [],
+                "histograms": [],
+                "folded": [],
+            }
+            # Files folded before whose removal failed are not added again
+            folded = [
+                file_name
+                for file_name in exited["folded"]
+                if (directory / file_name).exists()
+            ]
+            values = {
+                (name, tuple(labels)): value for name, labels, value in exited["values"]
+            }
+            histograms = {
+                (name, tuple(labels), len(counts)): counts
+                for name, labels, counts in exited["histograms"]
+            }
+            paths = []
+            for path in directory.glob("*.json"):
+                if path.name in (self.file_name, EXITED_PROCESSES_FILE_NAME, *folded):
+                    continue
+                snapshot = read_snapshot(path)
+                if snapshot is None or is_process_alive(snapshot["pid"]):
+                    continue
+
+                for name, labels, value in snapshot["values"]:
+                    if self.metrics.get(name, (None,))[0] == GAUGE:
+                        continue
+                    key = (name, tuple(labels))
+                    values[key] = values.get(key, 0) + value
+                for name, labels, counts in snapshot["histograms"]:
+                    merged = histograms.setdefault(
+                        (name, tuple(labels), len(counts)), [0] * len(counts)
+                    )
+                    for index, count in enumerate(counts):
+                        merged[index] += count
+                paths.append(path)
+
+            if paths:
+                exited["values"] = [
+                    [name, list(labels), value]
+                    for (name, labels), value in values.items()
+                ]
+                exited["histograms"] = [
+                    [name, list(labels), counts]
+                    for (name, labels, _), counts in histograms.items()
+                ]
+                exited["folded"] = folded + [path.name for path in paths]
+                write_snapshot(directory, EXITED_PROCESSES_FILE_NAME, exited)
+
+            for file_name in folded + [path.name for path in paths]:
+                (directory / file_name).unlink(missing_ok=True)
+
+    # * <<----*** Exposition ***---->>
+    def collect(self, extra_gauges: dict | None = None) -> str:
+        """
+        Returns the values of every process in the Prometheus text exposition format.
+
+        Args:
+            extra_gauges (dict | None): ``{(name, labels): value}`` of gauges read at scrape time.
+        """
+        values: dict[tuple[str, tuple], float] = {}
+        histograms: dict[tuple[str, tuple], list[float]] = {}
+        for snapshot in self.get_snapshots():
+            # The exited processes' file has no pid and no gauges
+            is_alive = snapshot["pid"] is not None and (
+                snapshot["pid"] == self.pid or is_process_alive(snapshot["pid"])
+            )
+            for name, labels, value in snapshot["values"]:
+                metric = self.metrics.get(name)
+                if metric is None or (metric[0] == GAUGE and not is_alive):
+                    continue
+                key = (name, tuple(labels))
+                values[key] = values.get(key, 0) + value
+            for name, labels, counts in snapshot["histograms"]:
+                metric = self.metrics.get(name)
+                if metric is None or len(counts) != len(metric[3]) + 2:
+                    # Buckets changed since the file was written
+                    continue
+                key = (name, tuple(labels))
+                merged = histograms.setdefault(key, [0] * len(counts))
+                for index, count in enumerate(counts):
+                    merged[index] += count
+        values.update(extra_gauges or {})
+
+        lines = []
+        for name, (metric_type, help_text, label_names, buckets) in sorted(
+            self.metrics.items()
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if metric_type != HISTOGRAM:
+                for (key_name, labels), value in sorted(values.items()):
+                    if key_name == name:
+                        lines.append(
+                            f"{name}{format_labels(label_names, labels)} {value}"
+                        )
+                continue
+
+            for (key_name, labels), counts in sorted(histograms.items()):
+                if key_name != name:
+                    continue
+                cumulative = 0
+                for bucket, count in zip([*buckets, "+Inf"], counts):
+                    cumulative += count
+                    bucket_labels = format_labels(label_names, labels, le=bucket)
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                lines.append(
+                    f"{name}_sum{format_labels(label_names, labels)} {counts[-1]}"
+                )
+                lines.append(
+                    f"{name}_count{format_labels(label_names, labels)} {cumulative}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+metrics_registry.counter(
+    "http_requests_total",
+    "Requests served, by resolved URL name",
+    ("method", "view", "status"),
+)
+metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "Request latency, by resolved URL name",
+    ("view",),
+    buckets=settings.METRICS_LATENCY_BUCKETS,
+)
+metrics_registry.counter("db_queries_total", "SQL queries run while serving requests")
+metrics_registry.counter(
+    "db_query_duration_seconds_total",
+    "Time spent in SQL queries while serving requests",
+)
+metrics_registry.counter("cache_hits_total", "Cache lookups finding their key")
+metrics_registry.counter("cache_misses_total", "Cache lookups missing their key")
+metrics_registry.gauge(
+    "db_pool_connections", "Connections of the database pools", ("alias", "state")
+)
+metrics_registry.gauge(
+    "db_pool_requests_waiting",
+    "Requests waiting for a pooled connection",
+    ("alias",),
+)
+metrics_registry.gauge(
+    "background_jobs", "Background jobs in the queue, by status", ("status",)
+)
+
+
+def collect_db_pool_gauges(registry: MetricsRegistry) -> None:
+    from django.db import connections
+
+    for alias in connections:
+        # Only PostgreSQL with the "pool" option has a pool
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            continue
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        available = stats.get("pool_available", 0)
+        registry.set("db_pool_connections", size - available, (alias, "used"))
+        registry.set("db_pool_connections", available, (alias, "idle"))
+        registry.set("db_pool_connections", pool.max_size, (alias, "max"))
+        registry.set(
+            "db_pool_requests_waiting", stats.get("requests_waiting", 0), (alias,)
+        )
+
+
+metrics_registry.add_gauge_collector(collect_db_pool_gauges)
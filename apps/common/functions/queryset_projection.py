@@ -0,0 +1,151 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ManyToManyField, Prefetch, QuerySet
+from rest_framework.serializers import (
+    BaseSerializer,
+    PrimaryKeyRelatedField,
+    RelatedField,
+    SerializerMethodField,
+)
+
+
+def get_field_list(fields: str | list[str] | None) -> list[str]:
+    """
+    Splits a ``field_list`` query param the same way ``FilterFieldMixin`` does.
+    """
+    if not fields:
+        return []
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return [field.strip() for field in fields if field.strip()]
+
+
+def get_forward_relation_path(model, path: list[str]) -> tuple[list[str], object]:
+    """
+    Walks a dotted serializer source through forward foreign keys.
+
+    Returns the leading relation names and the model field the path ends at
+    (None if it ends at something that is not a model field), i.e.
+    ``(["product_unit", "unit_attribute"], <attribute_name field>)``.
+    """
+    relations: list[str] = []
+    for name in path:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return relations, None
+
+        if not (field.many_to_one or field.one_to_one) or not field.concrete:
+            return relations, field
+
+        relations.append(field.name)
+        model = field.related_model
+    return relations, None
+
+
+def get_projected_queryset(
+    queryset: QuerySet,
+    fields: str | list[str] | None,
+    serializer_class=None,
+) -> QuerySet:
+    """
+    Prunes the SQL of a queryset down to the columns a ``field_list`` renders.
+
+    Concrete fields go to ``.only()``, forward relations rendered through a
+    nested serializer or a dotted ``source`` become ``select_related`` and
+    many-to-many or reverse relations become ``prefetch_related``. A field
+    that cannot be mapped to model columns (a ``SerializerMethodField``, a
+    ``source="*"`` or a model property) keeps the full row, since its value
+    may read any attribute. A serializer field declaring ``projection_fields``
+    gets those columns loaded as well.
+
+    Args:
+        queryset (QuerySet): The queryset to project.
+        fields (str | list[str] | None): The requested fields, i.e. "id,product_name".
+        serializer_class: The serializer that renders the queryset.
+
+    Returns:
+        QuerySet: The projected queryset, unchanged if no fields were requested.
+    """
+    field_names = get_field_list(fields)
+    if not field_names or queryset._fields is not None:
+        return queryset
+
+    serializer_fields = serializer_class().fields if serializer_class else {}
+
+    only_fields: set[str] = set()
+    select_related: set[str] = set()
+    prefetches: dict[str, Prefetch | str] = {}
+    can_prune = True
+
+    for name in field_names:
+        serializer_field = serializer_fields.get(name)
+        if serializer_fields and serializer_field is None:
+            # FilterFieldMixin ignores unknown fields as well
+            continue
+
+        # Model fields a serializer field reads besides its source
+        only_fields.update(getattr(serializer_field, "projection_fields", ()))
+        source = getattr(serializer_field, "source", None) or name
+        if source == "*" or isinstance(serializer_field, SerializerMethodField):
+            can_prune = False
+            continue
+
+        path = source.split(".")
+        relations, leaf = get_forward_relation_path(queryset.model, path)
+
+        if not relations:
+            if leaf is None:
+                can_prune = False
+                continue
+
+            if leaf.many_to_many or leaf.one_to_many:
+                child = getattr(serializer_field, "child_relation", None)
+                if isinstance(leaf, ManyToManyField) and (
+                    serializer_field is None
+                    or isinstance(child, PrimaryKeyRelatedField)
+                ):
+                    # Rendered as primary keys, the related rows only need their pk
+                    prefetches[leaf.name] = Prefetch(
+                        leaf.name,
+                        queryset=leaf.related_model._base_manager.only("pk"),
+                    )
+                else:
+                    prefetches[leaf.name] = leaf.name
+            else:
+                only_fields.add(leaf.name)
+            continue
+
+        relation_path = "__".join(relations)
+        only_fields.update(
+            "__".join(relations[: depth + 1]) for depth in range(len(relations))
+        )
+
+        if (
+            leaf is not None
+            and not leaf.is_relation
+            and len(relations) + 1 == len(path)
+        ):
+            # i.e. source="product_unit.unit_attribute.attribute_name"
+            select_related.add(relation_path)
+            only_fields.add(f"{relation_path}__{leaf.name}")
+        elif len(relations) == len(path) and (
+            serializer_field is None
+            or isinstance(serializer_field, PrimaryKeyRelatedField)
+        ):
+            # A plain primary key only needs the foreign key column
+            continue
+        else:
+            # Nested serializers, slug/string fields and properties read the related row
+            select_related.add(relation_path)
+            if len(relations) != len(path) or not isinstance(
+                serializer_field, (BaseSerializer, RelatedField)
+            ):
+                can_prune = False
+
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches.values())
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if can_prune:
+        queryset = queryset.only("pk", *only_fields)
+    return queryset
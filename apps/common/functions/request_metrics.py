@@ -0,0 +1,50 @@
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+
+from apps.common.functions.metrics import metrics_registry
+
+
+class RequestMetrics:
+    """
+    Counters of the request being served, filled by the request timing middleware and the instrumented caches.
+    """
+
+    def __init__(self, max_logged_queries: int = 0):
+        self.started_at = time.perf_counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.view_time = 0.0
+        self.render_time = 0.0
+        self.max_logged_queries = max_logged_queries
+        # (sql, seconds) of the first ``max_logged_queries`` queries
+        self.queries: list[tuple[str, float]] = []
+
+    def record_query(self, sql: str, duration: float) -> None:
+        self.query_count += 1
+        self.db_time += duration
+        if len(self.queries) < self.max_logged_queries:
+            self.queries.append((sql, duration))
+
+
+current_request_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "current_request_metrics", default=None
+)
+
+
+def record_cache_lookup(hits: int = 0, misses: int = 0) -> None:
+    """
+    Counts cache lookups towards the current request and the /metrics cache hit ratio.
+    """
+    if settings.METRICS_ENABLED:
+        if hits:
+            metrics_registry.inc("cache_hits_total", value=hits)
+        if misses:
+            metrics_registry.inc("cache_misses_total", value=misses)
+    metrics = current_request_metrics.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
@@ -0,0 +1,133 @@
+import threading
+from collections import OrderedDict
+from functools import cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import Resolver404, ResolverMatch, get_resolver
+from django.urls.resolvers import RegexPattern, RoutePattern
+
+REGEX_SPECIAL_CHARACTERS = set(".^$*+?{}[]\\|()")
+
+
+class LRUCache:
+    """
+    A bounded thread safe mapping dropping its least recently used entry when full.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                self.entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self.entries[key]
+
+    def set(self, key, value) -> None:
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+# Misses are kept apart, a scanner flood must not evict the real URLs
+resolve_cache = LRUCache(settings.URL_RESOLVE_CACHE_SIZE)
+resolve_negative_cache = LRUCache(settings.URL_RESOLVE_NEGATIVE_CACHE_SIZE)
+
+
+def get_literal_prefix(pattern) -> str:
+    """
+    Returns the fixed start of a URL pattern, i.e. "api/v1/products/" or "media/".
+    """
+    if isinstance(pattern, RoutePattern):
+        return str(pattern).split("<", 1)[0]
+    if isinstance(pattern, RegexPattern):
+        prefix = []
+        for character in str(pattern).removeprefix("^"):
+            if character in REGEX_SPECIAL_CHARACTERS:
+                break
+            prefix.append(character)
+        return "".join(prefix)
+    return ""
+
+
+def get_resolver_match_copy(resolver_match: ResolverMatch) -> ResolverMatch:
+    # Views and middleware may change the kwargs of their request's match.
+    # copy.copy() is refused, ResolverMatch forbids pickling
+    match_copy = ResolverMatch.__new__(ResolverMatch)
+    match_copy.__dict__.update(resolver_match.__dict__)
+    match_copy.kwargs = dict(resolver_match.kwargs)
+    return match_copy
+
+
+@cache
+def get_url_prefixes(urlconf: str | None) -> tuple[str, ...] | None:
+    """
+    Returns the fixed starts of the root URL patterns, any valid path begins with one of them.
+
+    Returns None when a root pattern can match any path, i.e. "<slug:slug>/".
+    """
+    prefixes = set()
+    for url_pattern in get_resolver(urlconf).url_patterns:
+        prefix = get_literal_prefix(url_pattern.pattern)
+        if not prefix:
+            return None
+        prefixes.add(prefix)
+    return tuple(sorted(prefixes))
+
+
+def resolve_path(path: str, urlconf: str | None = None) -> ResolverMatch | None:
+    """
+    ``django.urls.resolve()`` with its results cached, returning None for a 404.
+
+    Paths outside every root pattern prefix are refused before any regex is
+    matched. Resolved and unresolved paths are kept in two bounded LRU
+    caches, ``URL_RESOLVE_CACHE_SIZE`` and ``URL_RESOLVE_NEGATIVE_CACHE_SIZE``
+    entries large. Every call returns its own copy of the cached
+    ``ResolverMatch``, changing it leaves the cache and other requests alone.
+
+    Args:
+        path (str): The ``path_info`` of the request.
+        urlconf (str | None): The ``urlconf`` of the request, ``ROOT_URLCONF`` by default.
+
+    Returns:
+        ResolverMatch | None: The match, or None if no URL pattern matches.
+    """
+    prefixes = get_url_prefixes(urlconf)
+    if prefixes is not None and not path.removeprefix("/").startswith(prefixes):
+        # Cheaper than a cache lookup, and keeps scanner paths out of the cache
+        return None
+
+    key = (urlconf, path)
+    resolver_match = resolve_cache.get(key)
+    if resolver_match is not None:
+        return get_resolver_match_copy(resolver_match)
+    if resolve_negative_cache.get(key):
+        return None
+
+    try:
+        resolver_match = get_resolver(urlconf).resolve(path)
+    except Resolver404:
+        resolve_negative_cache.set(key, True)
+        return None
+    resolve_cache.set(key, resolver_match)
+    return get_resolver_match_copy(resolver_match)
+
+
+@receiver(setting_changed)
+def clear_resolve_cache(*, setting, **kwargs):
+    if setting == "ROOT_URLCONF":
+        resolve_cache.clear()
+        resolve_negative_cache.clear()
+        get_url_prefixes.cache_clear()
@@ -13,6 +13,8 @@ def get_valid_query_params(
         allowed_query_params = {
             "limit",
             "offset",
+            "cursor",
+            "count",
             "field_list",
             "ordering",
             "query",
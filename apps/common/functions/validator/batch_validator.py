@@ -0,0 +1,356 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import connections
+from django.db.models import F, UniqueConstraint
+from django.db.models.functions import Lower
+
+from apps.common.functions.validator.image_validator import (
+    get_image_header_errors,
+    get_invalid_image_extension_indexes,
+)
+from apps.common.functions.validator.name_validator import (
+    SPECIAL_CHARACTER_MESSAGE,
+    get_special_character_indexes,
+)
+
+# (field name, compared case-insensitively)
+UniquePart = tuple[str, bool]
+# Values lowered per query, well under every backend's parameter limit
+LOWER_BATCH_SIZE = 500
+
+
+class BatchErrors(defaultdict):
+    """
+    ``{position: {field_name: [messages]}}`` collected over a batch.
+    """
+
+    def __init__(self):
+        super().__init__(lambda: defaultdict(list))
+
+    def add(self, index: int, field_name: str, message) -> None:
+        self[index][field_name].append(str(message))
+
+    def add_validation_error(self, index: int, error: ValidationError) -> None:
+        message_dict = (
+            error.message_dict
+            if hasattr(error, "error_dict")
+            else {NON_FIELD_ERRORS: error.messages}
+        )
+        for field_name, messages in message_dict.items():
+            for message in messages:
+                self.add(index, field_name, message)
+
+
+def get_unique_parts(
+    model_class, constraint: UniqueConstraint
+) -> list[UniquePart] | None:
+    """
+    Returns the parts of a unique constraint, or None if it cannot be checked in a batch.
+
+    Plain fields and ``Lower("<field>")`` expressions are supported; partial
+    constraints and other expressions are left to the database.
+    """
+    if constraint.condition is not None:
+        return None
+    if constraint.fields:
+        return [(name, False) for name in constraint.fields]
+
+    parts: list[UniquePart] = []
+    for expression in constraint.expressions:
+        if isinstance(expression, F):
+            parts.append((expression.name, False))
+        elif isinstance(expression, Lower) and isinstance(
+            expression.source_expressions[0], F
+        ):
+            parts.append((expression.source_expressions[0].name, True))
+        else:
+            return None
+    return parts
+
+
+def get_unique_checks(model_class) -> list[tuple[list[UniquePart], object]]:
+    """
+    Returns ``(parts, constraint or None)`` for every uniqueness rule of a model.
+
+    An exact rule over the same fields as a case-insensitive one is dropped,
+    the case-insensitive check already finds its duplicates.
+    """
+    opts = model_class._meta
+    checks: dict[tuple[str, ...], tuple[list[UniquePart], object]] = {}
+
+    for field in opts.concrete_fields:
+        if field.unique and not field.primary_key:
+            checks[(field.name,)] = ([(field.name, False)], None)
+    for unique_together in opts.unique_together:
+        checks[tuple(sorted(unique_together))] = (
+            [(name, False) for name in unique_together],
+            None,
+        )
+    for constraint in opts.total_unique_constraints + [
+        constraint
+        for constraint in opts.constraints
+        if isinstance(constraint, UniqueConstraint) and constraint.expressions
+    ]:
+        parts = get_unique_parts(model_class, constraint)
+        if parts is None:
+            continue
+        key = tuple(sorted(name for name, _ in parts))
+        existing = checks.get(key)
+        if existing is None or any(lower for _, lower in parts):
+            checks[key] = (parts, constraint)
+    return list(checks.values())
+
+
+def get_lowered_values(using: str, values: set[str]) -> dict[str, str]:
+    """
+    Lowers values with the database's ``LOWER()``, the function the ``Lower()`` constraints index.
+
+    Python's ``str.lower()`` differs from it, SQLite only folds ASCII letters,
+    so a batch lowered in Python would miss or invent stored duplicates.
+    """
+    values = list(values)
+    lowered: dict[str, str] = {}
+    with connections[using].cursor() as cursor:
+        for start in range(0, len(values), LOWER_BATCH_SIZE):
+            chunk = values[start : start + LOWER_BATCH_SIZE]
+            cursor.execute(
+                f"SELECT {', '.join(['LOWER(%s)'] * len(chunk))}",
+                chunk,
+            )
+            lowered.update(zip(chunk, cursor.fetchone()))
+    return lowered
+
+
+def get_unique_key(
+    instance, parts: list[UniquePart], lowered: dict[str, str]
+) -> tuple | None:
+    key = []
+    for name, lower in parts:
+        value = getattr(instance, instance._meta.get_field(name).attname)
+        if value is None:
+            # NULLs never collide in a unique index
+            return None
+        key.append(lowered[value] if lower and isinstance(value, str) else value)
+    return tuple(key)
+
+
+def set_unique_errors(
+    model_class, instances: list, errors: BatchErrors, exclude: set[str]
+) -> None:
+    """
+    Checks every uniqueness rule with one ``IN (...)`` query over the whole batch.
+
+    A case-insensitive rule costs one more query, lowering the batch values
+    the way the database lowers the stored ones.
+    """
+    manager = model_class._default_manager
+    for parts, constraint in get_unique_checks(model_class):
+        if any(name in exclude for name, _ in parts):
+            continue
+
+        lower_attnames = [
+            model_class._meta.get_field(name).attname for name, lower in parts if lower
+        ]
+        lowered = get_lowered_values(
+            manager.db,
+            {
+                value
+                for instance in instances
+                for attname in lower_attnames
+                if isinstance(value := getattr(instance, attname), str)
+            },
+        )
+        keys = {
+            index: get_unique_key(instance, parts, lowered)
+            for index, instance in enumerate(instances)
+        }
+        keys = {index: key for index, key in keys.items() if key is not None}
+        if not keys:
+            continue
+
+        queryset = manager.all()
+        columns = []
+        for position, (name, lower) in enumerate(parts):
+            attname = model_class._meta.get_field(name).attname
+            values = {key[position] for key in keys.values()}
+            if lower:
+                alias = f"_batch_lower_{name}"
+                queryset = queryset.annotate(**{alias: Lower(attname)})
+                queryset = queryset.filter(**{f"{alias}__in": values})
+                columns.append(alias)
+            else:
+                queryset = queryset.filter(**{f"{attname}__in": values})
+                columns.append(attname)
+
+        stored_pks: dict[tuple, set] = defaultdict(set)
+        for pk, *values in queryset.order_by().values_list("pk", *columns):
+            stored_pks[tuple(values)].add(pk)
+
+        if constraint is not None:
+            message = constraint.get_violation_error_message()
+        else:
+            message = (
+                instances[0]
+                .unique_error_message(model_class, tuple(name for name, _ in parts))
+                .messages[0]
+            )
+        field_name = parts[0][0] if len(parts) == 1 else NON_FIELD_ERRORS
+
+        seen: set[tuple] = set()
+        for index, key in keys.items():
+            other_pks = stored_pks.get(key, set()) - {instances[index].pk}
+            # A key repeated inside the batch fails from its second occurrence
+            if other_pks or key in seen:
+                errors.add(index, field_name, message)
+            seen.add(key)
+
+
+def set_relation_errors(
+    model_class, instances: list, errors: BatchErrors, exclude: set[str]
+) -> None:
+    """
+    Checks the foreign keys of the batch with one ``IN (...)`` query per field.
+    """
+    for field in model_class._meta.concrete_fields:
+        if not field.many_to_one and not field.one_to_one:
+            continue
+        if field.name in exclude:
+            continue
+
+        values = {
+            index: getattr(instance, field.attname)
+            for index, instance in enumerate(instances)
+        }
+        for index, value in values.items():
+            if value is None and not field.null:
+                errors.add(index, field.name, field.error_messages["null"])
+
+        lookup_values = {value for value in values.values() if value is not None}
+        if not lookup_values:
+            continue
+
+        target = field.target_field.attname
+        stored = set(
+            field.related_model._base_manager.filter(
+                **{f"{target}__in": lookup_values}
+            ).values_list(target, flat=True)
+        )
+        for index, value in values.items():
+            if value is not None and value not in stored:
+                errors.add(
+                    index,
+                    field.name,
+                    field.error_messages["invalid"]
+                    % {
+                        "model": field.related_model._meta.verbose_name,
+                        "pk": value,
+                        "field": field.target_field.name,
+                        "value": value,
+                    },
+                )
+
+
+def get_batch_validation_errors(
+    model_class,
+    instances: Iterable,
+    exclude: Iterable[str] | None = None,
+) -> dict[int, dict[str, list[str]]]:
+    """
+    Validates a batch of unsaved or changed instances without per-row queries.
+
+    Field validators run in memory, the model's ``special_character_fields``
+    and ``image_extension_fields`` are checked for the whole batch at once
+    (new image uploads by their header bytes only), and foreign keys and
+    uniqueness rules cost one query per field or constraint instead of one
+    per row. The model's own ``clean()`` is not called.
+
+    Args:
+        model_class: The model of the instances.
+        instances (Iterable): The instances to validate.
+        exclude (Iterable[str] | None): Field names to skip.
+
+    Returns:
+        dict[int, dict[str, list[str]]]: ``{position: {field_name: [messages]}}``, empty if the batch is valid.
+    """
+    instances = list(instances)
+    exclude = set(exclude or ())
+    errors = BatchErrors()
+
+    relation_names = {
+        field.name
+        for field in model_class._meta.concrete_fields
+        if field.many_to_one or field.one_to_one
+    }
+    for index, instance in enumerate(instances):
+        try:
+            instance.clean_fields(exclude=exclude | relation_names)
+        except ValidationError as error:
+            errors.add_validation_error(index, error)
+
+    for field_name in model_class.special_character_fields:
+        if field_name in exclude:
+            continue
+        for index in get_special_character_indexes(
+            [getattr(instance, field_name) for instance in instances]
+        ):
+            errors.add(
+                index,
+                field_name,
+                SPECIAL_CHARACTER_MESSAGE.format(field_name=field_name),
+            )
+
+    for field_name, valid_extensions in model_class.image_extension_fields.items():
+        if field_name in exclude:
+            continue
+        field_files = [getattr(instance, field_name) for instance in instances]
+        invalid_indexes = set(
+            get_invalid_image_extension_indexes(
+                [field_file.name for field_file in field_files], valid_extensions
+            )
+        )
+        for index in sorted(invalid_indexes):
+            errors.add(
+                index,
+                field_name,
+                f"Allowed image extensions: {', '.join(sorted(valid_extensions))}",
+            )
+
+        # New uploads are sniffed from their headers, a few hundred bytes each
+        uploads = {
+            index: field_file
+            for index, field_file in enumerate(field_files)
+            if field_file and not field_file._committed and index not in invalid_indexes
+        }
+        header_errors = get_image_header_errors(
+            list(uploads.values()),
+            valid_extensions,
+            max_pixels=settings.IMAGE_MAX_PIXELS,
+        )
+        upload_indexes = list(uploads)
+        for position, message in header_errors.items():
+            errors.add(upload_indexes[position], field_name, message)
+
+    set_relation_errors(model_class, instances, errors, exclude)
+    set_unique_errors(model_class, instances, errors, exclude)
+    return {index: dict(field_errors) for index, field_errors in sorted(errors.items())}
+
+
+def get_batch_validation_error(
+    errors: dict[int, dict[str, list[str]]],
+) -> ValidationError:
+    """
+    Builds one ``ValidationError`` keyed by row position from ``get_batch_validation_errors`` output.
+    """
+    return ValidationError(
+        {
+            f"row_{index}": [
+                f"{field_name}: {message}"
+                for field_name, messages in field_errors.items()
+                for message in messages
+            ]
+            for index, field_errors in errors.items()
+        }
+    )
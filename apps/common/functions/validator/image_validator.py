@@ -1,6 +1,262 @@
+import os
+from contextlib import contextmanager
+from typing import NamedTuple
+
 from loguru import logger
 from PIL import Image
 
+DEFAULT_IMAGE_EXTENSIONS = {
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".bmp",
+    ".tiff",
+    ".webp",
+}
+# Sniffed format -> the extensions it is uploaded with
+IMAGE_FORMAT_EXTENSIONS = {
+    "jpeg": {".jpg", ".jpeg"},
+    "png": {".png"},
+    "gif": {".gif"},
+    "webp": {".webp"},
+    "bmp": {".bmp"},
+    "tiff": {".tif", ".tiff"},
+}
+# Covers every fixed offset header field read below
+IMAGE_HEADER_BYTES = 32
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Start of frame markers, the ones carrying the dimensions (not DHT, JPG or DAC)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without a length field: TEM, RST0-7 and SOI
+JPEG_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD9)}
+JPEG_MAX_SEGMENTS = 256
+
+
+class ImageHeader(NamedTuple):
+    format: str
+    width: int
+    height: int
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+
+@contextmanager
+def open_image_file(image):
+    """
+    Yields a readable binary file of an upload, ``FieldFile`` or path, at its start.
+
+    An already open file is rewound to where it was afterwards, a file opened
+    here is closed again.
+    """
+    if isinstance(image, (str, os.PathLike)):
+        with open(image, "rb") as file:
+            yield file
+        return
+
+    was_closed = getattr(image, "closed", False)
+    if was_closed:
+        image.open("rb")
+    position = image.tell()
+    image.seek(0)
+    try:
+        yield image
+    finally:
+        if was_closed:
+            image.close()
+        else:
+            image.seek(position)
+
+
+def get_jpeg_size(file) -> tuple[int, int] | None:
+    """
+    Walks the JPEG segments up to the first start of frame, seeking over every payload.
+    """
+    file.seek(2)
+    for _ in range(JPEG_MAX_SEGMENTS):
+        marker = file.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        while code == 0xFF:
+            # Fill bytes before the marker code
+            fill = file.read(1)
+            if not fill:
+                return None
+            code = fill[0]
+
+        if code in JPEG_STANDALONE_MARKERS:
+            continue
+        if code in (0xD9, 0xDA):
+            # End of image or scan data before any frame header
+            return None
+
+        length = int.from_bytes(file.read(2), "big")
+        if length < 2:
+            return None
+        if code in JPEG_SOF_MARKERS:
+            frame = file.read(5)
+            if len(frame) < 5:
+                return None
+            # Sample precision, then height and width
+            return int.from_bytes(frame[3:5], "big"), int.from_bytes(frame[1:3], "big")
+        file.seek(length - 2, os.SEEK_CUR)
+    return None
+
+
+def get_webp_size(head: bytes) -> tuple[int, int] | None:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        # Lossy, 14 bit dimensions after the key frame start code
+        return (
+            int.from_bytes(head[26:28], "little") & 0x3FFF,
+            int.from_bytes(head[28:30], "little") & 0x3FFF,
+        )
+    if chunk == b"VP8L" and head[20] == 0x2F:
+        # Lossless, two 14 bit fields storing the dimensions minus one
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        # Extended, 24 bit canvas dimensions minus one
+        return (
+            int.from_bytes(head[24:27], "little") + 1,
+            int.from_bytes(head[27:30], "little") + 1,
+        )
+    return None
+
+
+def get_image_header(image) -> ImageHeader | None:
+    """
+    Sniffs the real format and the dimensions of an image without decoding it.
+
+    PNG, JPEG, GIF, WebP and BMP are parsed from their magic bytes and
+    header fields, a JPEG reading only its segment headers up to the frame
+    header. Other formats fall back to ``Image.open()``, which parses the
+    header lazily as well. Memory stays a few hundred bytes per image
+    whatever the file size.
+
+    Args:
+        image: An uploaded file, a ``FieldFile`` or a path.
+
+    Returns:
+        ImageHeader | None: The format and size, None if the file is not a readable image.
+    """
+    with open_image_file(image) as file:
+        head = file.read(IMAGE_HEADER_BYTES)
+        size = None
+        image_format = None
+
+        if head.startswith(PNG_SIGNATURE) and head[12:16] == b"IHDR":
+            image_format = "png"
+            size = (
+                int.from_bytes(head[16:20], "big"),
+                int.from_bytes(head[20:24], "big"),
+            )
+        elif head.startswith(b"\xff\xd8\xff"):
+            image_format = "jpeg"
+            size = get_jpeg_size(file)
+        elif head[:6] in (b"GIF87a", b"GIF89a"):
+            image_format = "gif"
+            size = (
+                int.from_bytes(head[6:8], "little"),
+                int.from_bytes(head[8:10], "little"),
+            )
+        elif head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+            image_format = "webp"
+            size = get_webp_size(head)
+        elif head[:2] == b"BM" and len(head) >= 26:
+            image_format = "bmp"
+            if int.from_bytes(head[14:18], "little") == 12:
+                # OS/2 core header, 16 bit dimensions
+                size = (
+                    int.from_bytes(head[18:20], "little"),
+                    int.from_bytes(head[20:22], "little"),
+                )
+            else:
+                size = (
+                    int.from_bytes(head[18:22], "little", signed=True),
+                    # Negative for top-down bitmaps
+                    abs(int.from_bytes(head[22:26], "little", signed=True)),
+                )
+        else:
+            file.seek(0)
+            try:
+                with Image.open(file) as opened:
+                    image_format, size = opened.format.lower(), opened.size
+            except Exception:
+                return None
+
+    if size is None or size[0] <= 0 or size[1] <= 0:
+        return None
+    return ImageHeader(image_format, *size)
+
+
+def get_image_header_errors(
+    images: list,
+    valid_extensions: set[str] | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    min_width: int | None = None,
+    min_height: int | None = None,
+    max_pixels: int | None = None,
+) -> dict[int, str]:
+    """
+    Validates the real format and the dimensions of images from their headers only.
+
+    Decompression bombs are rejected by their declared pixel count before any
+    pixel is decoded. A file that cannot be read as an image is an error,
+    never a silent pass.
+
+    Args:
+        images (list): Uploaded files, ``FieldFile`` objects or paths.
+        valid_extensions (set[str] | None): The allowed extensions, the sniffed format must be one of them. If None, any readable image.
+        max_width (int | None): Maximum allowed width. If None, no constraint.
+        max_height (int | None): Maximum allowed height. If None, no constraint.
+        min_width (int | None): Minimum allowed width. If None, no constraint.
+        min_height (int | None): Minimum allowed height. If None, no constraint.
+        max_pixels (int | None): Maximum width * height, Pillow's ``Image.MAX_IMAGE_PIXELS`` if None.
+
+    Returns:
+        dict[int, str]: ``{position: message}`` of the invalid images.
+    """
+    max_pixels = max_pixels or Image.MAX_IMAGE_PIXELS
+    errors: dict[int, str] = {}
+
+    for index, image in enumerate(images):
+        try:
+            header = get_image_header(image)
+        except OSError as e:
+            errors[index] = f"The image could not be read: {e}"
+            continue
+
+        if header is None:
+            errors[index] = "The file is not a valid image"
+        elif valid_extensions and not IMAGE_FORMAT_EXTENSIONS.get(
+            header.format, {f".{header.format}"}
+        ) & set(valid_extensions):
+            errors[index] = (
+                f"The file is a {header.format.upper()} image, allowed image "
+                f"extensions: {', '.join(sorted(valid_extensions))}"
+            )
+        elif max_pixels and header.pixels > max_pixels:
+            errors[index] = (
+                f"The image of {header.width}x{header.height} pixels exceeds "
+                f"the limit of {max_pixels} pixels"
+            )
+        elif (
+            (max_width is not None and header.width > max_width)
+            or (max_height is not None and header.height > max_height)
+            or (min_width is not None and header.width < min_width)
+            or (min_height is not None and header.height < min_height)
+        ):
+            errors[index] = (
+                f"The image of {header.width}x{header.height} pixels is outside "
+                f"the allowed dimensions"
+            )
+    return errors
+
 
 def get_validate_image_extensions(
     images: list,
@@ -21,15 +277,7 @@ def get_validate_image_extensions(
     """
     try:
         if valid_extensions is None:
-            valid_extensions = {
-                ".jpg",
-                ".jpeg",
-                ".png",
-                ".gif",
-                ".bmp",
-                ".tiff",
-                ".webp",
-            }
+            valid_extensions = DEFAULT_IMAGE_EXTENSIONS
 
         invalid_images = []
 
@@ -47,50 +295,62 @@ def get_validate_image_extensions(
         return None
 
 
+def get_invalid_image_extension_indexes(
+    file_names: list[str | None],
+    valid_extensions: set[str] | None = None,
+) -> list[int]:
+    """
+    Batch version of ``get_validate_image_extensions`` working on file names.
+
+    Args:
+        file_names (list[str | None]): The image file names, empty names are skipped.
+        valid_extensions (set[str] | None): The allowed extensions, i.e. {".jpg", ".png"}.
+
+    Returns:
+        list[int]: The positions of the names with an invalid extension.
+    """
+    suffixes = tuple(valid_extensions or DEFAULT_IMAGE_EXTENSIONS)
+    return [
+        index
+        for index, file_name in enumerate(file_names)
+        if file_name and not file_name.lower().endswith(suffixes)
+    ]
+
+
 def get_validate_image_dimensions(
     images: list,
     max_width: int | None = None,
     max_height: int | None = None,
     min_width: int | None = None,
     min_height: int | None = None,
+    max_pixels: int | None = None,
     *args,
     **kwargs,
 ) -> list[str] | None:
     """
     Validates the dimensions (height and width) of uploaded images.
 
+    Only the image headers are read, see ``get_image_header_errors``. An
+    image that cannot be read fails the validation.
+
     Args:
         images (list): A list of InMemoryUploadedFile objects.
         max_width (Optional[int]): Maximum allowed width for the images. If None, no constraint.
         max_height (Optional[int]): Maximum allowed height for the images. If None, no constraint.
         min_width (Optional[int]): Minimum allowed width for the images. If None, no constraint.
         min_height (Optional[int]): Minimum allowed height for the images. If None, no constraint.
+        max_pixels (Optional[int]): Maximum width * height. If None, Pillow's decompression bomb limit.
 
     Returns:
         Optional[List[str]]: A list of image names that fail the validation, otherwise None.
     """
-    try:
-        invalid_images = []
-
-        for image in images:
-            # Open the image using Pillow
-            img = Image.open(image)
-            width, height = img.size
-
-            # Validate dimensions
-            if (
-                (max_width is not None and width > max_width)
-                or (max_height is not None and height > max_height)
-                or (min_width is not None and width < min_width)
-                or (min_height is not None and height < min_height)
-            ):
-                invalid_images.append(image.name)
-
-        if invalid_images:
-            return invalid_images
-        else:
-            return None
-
-    except Exception as e:
-        logger.error(f"An error occurred while validating image dimensions: {str(e)}")
-        return None
+    images = list(images)
+    errors = get_image_header_errors(
+        images,
+        max_width=max_width,
+        max_height=max_height,
+        min_width=min_width,
+        min_height=min_height,
+        max_pixels=max_pixels,
+    )
+    return [images[index].name for index in errors] or None
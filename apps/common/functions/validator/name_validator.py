@@ -1,16 +1,50 @@
 import re
+from bisect import bisect_right
 
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+SPECIAL_CHARACTER_PATTERN = re.compile(r"[@#$%&]")
+SPECIAL_CHARACTER_MESSAGE = (
+    "{field_name} name cannot contain the following characters: @ # $ % &"
+)
+# Joins a batch of values for a single regex scan, it cannot appear in a name
+BATCH_SEPARATOR = "\x00"
+
 
 def validate_special_character(field_value: str, field_name: str) -> any:
     """
     Validate the attribute name for special characters.
     """
-    pattern = r"[@#$%&]"
-
-    if re.search(pattern, field_value):
+    if SPECIAL_CHARACTER_PATTERN.search(field_value):
         raise ValidationError(
-            _(f"{field_name} name cannot contain the following characters: @ # $ % &"),
+            _(SPECIAL_CHARACTER_MESSAGE.format(field_name=field_name)),
         )
+
+
+def get_special_character_indexes(field_values: list[str | None]) -> list[int]:
+    """
+    Batch version of ``validate_special_character``.
+
+    The values are joined and scanned by the regex engine in one pass, the
+    match offsets are mapped back to their value with a binary search.
+
+    Args:
+        field_values (list[str | None]): The values to check, None is skipped.
+
+    Returns:
+        list[int]: The positions of the values containing a special character.
+    """
+    starts: list[int] = []
+    offset = 0
+    for value in field_values:
+        starts.append(offset)
+        offset += len(value or "") + len(BATCH_SEPARATOR)
+
+    text = BATCH_SEPARATOR.join(value or "" for value in field_values)
+    return sorted(
+        {
+            bisect_right(starts, match.start()) - 1
+            for match in SPECIAL_CHARACTER_PATTERN.finditer(text)
+        }
+    )
@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, router, transaction
+from django.db.models import F, UniqueConstraint
+
+
+def get_unique_constraint_columns(
+    model_class, constraint: UniqueConstraint
+) -> set[str]:
+    """
+    Returns the columns a unique constraint covers, including the ones inside expressions like ``Lower("name")``.
+    """
+    field_names = set(constraint.fields)
+    for expression in constraint.expressions:
+        field_names.update(
+            node.name for node in expression.flatten() if isinstance(node, F)
+        )
+    return {model_class._meta.get_field(name).column for name in field_names}
+
+
+def get_unique_constraint_field_name(constraint: UniqueConstraint) -> str:
+    """
+    Returns the field a unique constraint error is reported on, the one inside ``Lower(...)`` rather than its scope.
+    """
+    for expression in constraint.expressions:
+        for node in expression.flatten():
+            if isinstance(node, F):
+                return node.name
+    return constraint.fields[0]
+
+
+def get_violated_unique_constraint(
+    model_class, error: IntegrityError
+) -> UniqueConstraint | None:
+    """
+    Finds the unique constraint an ``IntegrityError`` was raised for.
+
+    PostgreSQL and SQLite both name the violated index in the error message.
+    A plain ``unique=True`` column is reported by its column instead, i.e.
+    ``brand.brand_name`` or ``Key (brand_name)=...``; it maps to the
+    constraint that covers the same column, since a case-insensitive
+    constraint always covers the exact duplicates as well.
+    """
+    message = str(error)
+    constraints = [
+        constraint
+        for constraint in model_class._meta.constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+
+    for constraint in constraints:
+        if f'"{constraint.name}"' in message or f"'{constraint.name}'" in message:
+            return constraint
+
+    table = model_class._meta.db_table
+    for constraint in constraints:
+        for column in get_unique_constraint_columns(model_class, constraint):
+            if f"{table}.{column}" in message or f"({column})" in message:
+                return constraint
+    return None
+
+
+@contextmanager
+def unique_violation_as_validation_error(instance):
+    """
+    Turns a unique constraint violation raised by a save into the constraint's ``ValidationError``.
+
+    The database enforces uniqueness, so the save needs no ``exists()`` query
+    up front and stays correct under concurrent writers. The block runs in a
+    savepoint so an enclosing transaction remains usable after the error.
+
+    Args:
+        instance: The model instance being saved.
+
+    Raises:
+        ValidationError: With the ``violation_error_message`` of the violated constraint, keyed by its field.
+    """
+    model_class = instance.__class__
+    try:
+        with transaction.atomic(using=router.db_for_write(model_class)):
+            yield
+    except IntegrityError as error:
+        constraint = get_violated_unique_constraint(model_class, error)
+        if constraint is None:
+            raise
+        raise ValidationError(
+            {
+                get_unique_constraint_field_name(constraint): ValidationError(
+                    constraint.get_violation_error_message(),
+                    code=constraint.violation_error_code or "unique",
+                )
+            }
+        ) from error
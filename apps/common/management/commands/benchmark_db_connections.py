@@ -0,0 +1,112 @@
+import copy
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.utils import load_backend
+
+# CONN_MAX_AGE and pool OPTIONS of every benchmarked connection strategy
+MODES = {
+    "connect": {"CONN_MAX_AGE": 0},
+    "persistent": {"CONN_MAX_AGE": None},
+    "pool": {"CONN_MAX_AGE": 0, "pool": True},
+}
+
+
+# * <<-------------------------------------*** Benchmark DB Connections Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = (
+        "Measure the per-request database connection overhead of a new connection, "
+        "a persistent connection and the connection pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias whose settings are benchmarked",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Simulated requests per mode",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=5,
+            help="Requests per mode run before measuring",
+        )
+        parser.add_argument(
+            "--modes",
+            nargs="+",
+            choices=list(MODES),
+            default=list(MODES),
+            help="Connection strategies to compare",
+        )
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        if alias not in connections:
+            raise CommandError(f"Unknown database alias {alias}")
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1")
+
+        vendor = connections[alias].vendor
+        results = {}
+        for mode in options["modes"]:
+            if MODES[mode].get("pool") and vendor != "postgresql":
+                self.stdout.write(f"Skipping {mode}, pooling needs PostgreSQL")
+                continue
+            results[mode] = self.benchmark(
+                alias, mode, options["requests"], options["warmup"]
+            )
+
+        if not results:
+            return
+        fastest = min(statistics.mean(timings) for timings in results.values())
+        self.stdout.write(
+            f"{'mode':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'overhead ms':>14}"
+        )
+        for mode, timings in results.items():
+            mean = statistics.mean(timings)
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else mean
+            self.stdout.write(
+                f"{mode:<12}{mean:>10.3f}{statistics.median(timings):>10.3f}"
+                f"{p95:>10.3f}{mean - fastest:>14.3f}"
+            )
+
+    def get_connection(self, alias: str, mode: str):
+        settings_dict = copy.deepcopy(connections.settings[alias])
+        settings_dict["CONN_MAX_AGE"] = MODES[mode]["CONN_MAX_AGE"]
+        settings_dict["OPTIONS"].pop("pool", None)
+        if MODES[mode].get("pool"):
+            settings_dict["OPTIONS"]["pool"] = (
+                settings.DATABASES[alias].get("OPTIONS", {}).get("pool") or True
+            )
+        backend = load_backend(settings_dict["ENGINE"])
+        # Its own alias, the pool of a mode is not shared with the app connections
+        return backend.DatabaseWrapper(settings_dict, f"benchmark_{mode}")
+
+    def benchmark(self, alias: str, mode: str, requests: int, warmup: int):
+        connection = self.get_connection(alias, mode)
+        timings = []
+        try:
+            for index in range(warmup + requests):
+                started_at = time.perf_counter()
+                # What request_started and request_finished do around a one query view
+                connection.close_if_unusable_or_obsolete()
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                connection.close_if_unusable_or_obsolete()
+                if index >= warmup:
+                    timings.append((time.perf_counter() - started_at) * 1000)
+        finally:
+            connection.close()
+            if MODES[mode].get("pool"):
+                connection.close_pool()
+        return timings
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.common.models import MediaBlob
+from apps.common.storage.content_addressed_storage import ContentAddressedStorage
+
+
+# * <<-------------------------------------*** Prune Media Blobs Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = "Delete the content-addressed media files no model row references any more."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=24,
+            help="Keep unreferenced files this long, an upload in flight may reuse them",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the files without deleting them",
+        )
+
+    def handle(self, *args, **options):
+        if not isinstance(default_storage, ContentAddressedStorage):
+            raise CommandError("The default storage is not content-addressed")
+
+        unreferenced_before = timezone.now() - timedelta(hours=options["grace_hours"])
+        pruned = 0
+        for blob_id, name in (
+            MediaBlob.objects.filter(
+                reference_count=0, updated_at__lt=unreferenced_before
+            )
+            .values_list("id", "name")
+            .iterator()
+        ):
+            if options["dry_run"]:
+                self.stdout.write(name)
+                pruned += 1
+                continue
+            # Only if no save reused or referenced the file since the query. The
+            # lock is held until the file is gone, a concurrent save waits for it
+            # and writes the file again.
+            with transaction.atomic():
+                blob = (
+                    MediaBlob.objects.select_for_update()
+                    .filter(
+                        id=blob_id,
+                        reference_count=0,
+                        updated_at__lt=unreferenced_before,
+                    )
+                    .first()
+                )
+                if blob is None:
+                    continue
+                blob.delete()
+                default_storage.delete(name)
+                pruned += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} media files"))
@@ -0,0 +1,129 @@
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.common.functions.background_job import (
+    claim_background_jobs,
+    get_worker_name,
+    run_background_job,
+)
+
+
+def run_pool_job(job_id: int) -> str:
+    close_old_connections()
+    try:
+        return run_background_job(job_id)
+    finally:
+        close_old_connections()
+
+
+# * <<-------------------------------------*** Run Background Jobs Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = "Work the background job queue with a local process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.BACKGROUND_JOB_WORKERS,
+            help="Pool processes running jobs, 0 runs them in this process",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is due instead of polling",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.BACKGROUND_JOB_POLL_INTERVAL,
+            help="Seconds between queue polls when idle",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        if workers < 0:
+            raise CommandError("--workers must not be negative")
+
+        worker_name = get_worker_name()
+        self.stdout.write(f"Background job worker {worker_name} started")
+        try:
+            if workers == 0:
+                done = self.run_inline(options["burst"], options["poll_interval"])
+            else:
+                done = self.run_pool(
+                    workers, worker_name, options["burst"], options["poll_interval"]
+                )
+        except KeyboardInterrupt:
+            # Jobs still running are claimed again once their lease expires
+            self.stdout.write("Background job worker stopped")
+            return
+        self.stdout.write(self.style.SUCCESS(f"Ran {done} background jobs"))
+
+    def run_inline(self, burst: bool, poll_interval: float) -> int:
+        done = 0
+        while True:
+            job_ids = claim_background_jobs(1)
+            if not job_ids:
+                if burst:
+                    return done
+                time.sleep(poll_interval)
+                continue
+            run_pool_job(job_ids[0])
+            done += 1
+
+    def run_pool(
+        self, workers: int, worker_name: str, burst: bool, poll_interval: float
+    ) -> int:
+        done = 0
+        # Spawned processes start from a clean interpreter without inherited DB
+        # sockets, django.setup() runs before this module is imported there
+        context = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=django.setup
+        )
+        running = set()
+        try:
+            while True:
+                # Claim only what the pool can start now, the rest stays for other workers
+                free = workers - len(running)
+                close_old_connections()
+                job_ids = claim_background_jobs(free, worker_name) if free else []
+                running.update(
+                    executor.submit(run_pool_job, job_id) for job_id in job_ids
+                )
+
+                if not running:
+                    if burst:
+                        return done
+                    time.sleep(poll_interval)
+                    continue
+
+                finished, running = wait(
+                    running, timeout=poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in finished:
+                    done += 1
+                    try:
+                        future.result()
+                    except BrokenProcessPool:
+                        # A job crashed its process, its lease expires and it runs again
+                        self.stderr.write("A pool process died, restarting the pool")
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=context,
+                            initializer=django.setup,
+                        )
+                        running = set()
+                        break
+                    except Exception as e:
+                        self.stderr.write(f"Background job runner error: {e}")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,53 @@
+import math
+import time
+
+from django.conf import settings
+
+from apps.common.routers.replica_router import primary_pinned_until
+
+PRIMARY_PIN_COOKIE = "db_primary_until"
+
+
+class ReplicaPinningMiddleware:
+    """
+    Middleware keeping a client on the primary database for a while after it wrote.
+
+    The replica router pins the request to the primary when it writes a
+    replicated model, the pin is then sent back as a cookie so the
+    following requests of the client read their own writes instead of a
+    lagging replica.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICA_ALIASES:
+            return self.get_response(request)
+
+        try:
+            pinned_until = float(request.COOKIES.get(PRIMARY_PIN_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0.0
+        # A forged cookie cannot pin longer than a real write does
+        pinned_until = min(
+            pinned_until, time.time() + settings.DATABASE_READ_YOUR_WRITES_SECONDS
+        )
+
+        token = primary_pinned_until.set(pinned_until)
+        try:
+            response = self.get_response(request)
+            wrote_until = primary_pinned_until.get()
+        finally:
+            primary_pinned_until.reset(token)
+
+        if wrote_until > pinned_until:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                f"{wrote_until:.3f}",
+                max_age=math.ceil(settings.DATABASE_READ_YOUR_WRITES_SECONDS),
+                secure=request.is_secure(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,135 @@
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from loguru import logger
+
+from apps.common.functions.request_metrics import (
+    RequestMetrics,
+    current_request_metrics,
+)
+
+
+class RequestTimingMiddleware:
+    """
+    Middleware recording the query count, DB time, cache hits/misses, view and render time of every request.
+
+    The numbers are sent back in a ``Server-Timing`` header to staff users, or
+    to everyone with DEBUG on, and written as a structured log record for a ``REQUEST_TIMING_LOG_SAMPLE_RATE`` share of
+    requests. Requests slower than ``REQUEST_TIMING_SLOW_THRESHOLD_MS`` are
+    always logged, with their queries.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REQUEST_TIMING_ENABLED:
+            return self.get_response(request)
+
+        metrics = RequestMetrics(settings.REQUEST_TIMING_MAX_LOGGED_QUERIES)
+        request.request_metrics = metrics
+        token = current_request_metrics.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self.record_query))
+                response = self.get_response(request)
+        finally:
+            current_request_metrics.reset(token)
+
+        now = time.perf_counter()
+        render_started_at = getattr(request, "_timing_render_started_at", None)
+        if render_started_at is not None:
+            metrics.render_time = now - render_started_at
+        elif hasattr(request, "_timing_view_started_at"):
+            # Not a template response, the view returned it rendered
+            metrics.view_time = now - request._timing_view_started_at
+        total_time = now - metrics.started_at
+
+        if settings.REQUEST_TIMING_HEADER_ENABLED and self.can_see_server_timing(
+            request
+        ):
+            response["Server-Timing"] = self.get_server_timing(metrics, total_time)
+        self.log_request(request, response, metrics, total_time)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._timing_view_started_at = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after this hook, the rest is render time
+        now = time.perf_counter()
+        if hasattr(request, "request_metrics") and hasattr(
+            request, "_timing_view_started_at"
+        ):
+            request.request_metrics.view_time = now - request._timing_view_started_at
+            request._timing_render_started_at = now
+        return response
+
+    @staticmethod
+    def can_see_server_timing(request) -> bool:
+        # The query count and timings tell outsiders too much about the backend
+        if settings.DEBUG:
+            return True
+        user = getattr(request, "user", None)
+        return bool(user and user.is_staff)
+
+    @staticmethod
+    def record_query(execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics = current_request_metrics.get()
+            if metrics is not None:
+                metrics.record_query(sql, time.perf_counter() - started_at)
+
+    @staticmethod
+    def get_server_timing(metrics: RequestMetrics, total_time: float) -> str:
+        return ", ".join(
+            [
+                f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries"',
+                f'cache;desc="{metrics.cache_hits} hits, {metrics.cache_misses} misses"',
+                f"view;dur={metrics.view_time * 1000:.1f}",
+                f"render;dur={metrics.render_time * 1000:.1f}",
+                f"total;dur={total_time * 1000:.1f}",
+            ]
+        )
+
+    @staticmethod
+    def log_request(request, response, metrics: RequestMetrics, total_time: float):
+        is_slow = total_time * 1000 >= settings.REQUEST_TIMING_SLOW_THRESHOLD_MS
+        if not is_slow and random.random() >= settings.REQUEST_TIMING_LOG_SAMPLE_RATE:
+            return
+
+        request_logger = logger.bind(
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+            query_count=metrics.query_count,
+            db_ms=round(metrics.db_time * 1000, 1),
+            cache_hits=metrics.cache_hits,
+            cache_misses=metrics.cache_misses,
+            view_ms=round(metrics.view_time * 1000, 1),
+            render_ms=round(metrics.render_time * 1000, 1),
+            total_ms=round(total_time * 1000, 1),
+        )
+        summary = (
+            f"{request.method} {request.path} {response.status_code} "
+            f"{total_time * 1000:.1f}ms, {metrics.query_count} queries in {metrics.db_time * 1000:.1f}ms"
+        )
+        if not is_slow:
+            request_logger.info(f"REQUEST(RequestTimingMiddleware):---->> {summary}")
+            return
+
+        queries = "\n".join(
+            f"  {duration * 1000:.1f}ms {sql}" for sql, duration in metrics.queries
+        )
+        if metrics.query_count > len(metrics.queries):
+            queries += f"\n  ... {metrics.query_count - len(metrics.queries)} more"
+        request_logger.bind(queries=metrics.queries).warning(
+            f"SLOW REQUEST(RequestTimingMiddleware):---->> {summary}\n{queries}"
+        )
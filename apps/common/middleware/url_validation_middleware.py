@@ -1,40 +1,58 @@
 # custom_middleware.py
-from django.http import JsonResponse
-from django.urls import Resolver404, resolve
+import json
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.http import HttpResponse
 from rest_framework import status
 
 from apps.common.dataclass.response_dataclass import (
     InvalidUrlResponse,
     ResponseClient,
 )
+from apps.common.functions.url_resolver import resolve_path
 
 
 class UrlValidationMiddleware:
     """
     Middleware to check if the request URL exists.
     If not, returns a 404 Page Not Found response using InvalidUrlResponse model.
+
+    It runs ahead of the session, cache and CSRF middleware so invalid URLs
+    are refused before any of them. The resolved match is kept on the
+    request, the cached resolver handlers reuse it instead of resolving the
+    path again.
     """
 
     def __init__(self, get_response):
         self.get_response = get_response
+        # Create the response body using the InvalidUrlResponse model once, it never changes
+        error_response = InvalidUrlResponse(
+            status=status.HTTP_404_NOT_FOUND,
+            message="404 Page Not Found",
+            client=ResponseClient.DEVELOPER,  # Specify client or adjust as necessary
+            description={"info": "The requested URL was not found on the server."},
+        )
+        self.not_found_content = json.dumps(error_response.model_dump()).encode()
+        # Static files are served by WhiteNoise further down the chain, not by a URL pattern
+        self.static_path = "/" + urlsplit(settings.STATIC_URL).path.strip("/") + "/"
 
     def __call__(self, request):
-        try:
-            # Attempt to resolve the URL path
-            resolve(request.path)
-        except Resolver404:
-            # Create the response using the InvalidUrlResponse model
-            error_response = InvalidUrlResponse(
-                status=status.HTTP_404_NOT_FOUND,
-                message="404 Page Not Found",
-                client=ResponseClient.DEVELOPER,  # Specify client or adjust as necessary
-                description={"info": "The requested URL was not found on the server."},
-            )
-            return JsonResponse(
-                error_response.model_dump(),
+        if request.path_info.startswith(self.static_path):
+            return self.get_response(request)
+
+        # Attempt to resolve the URL path
+        resolver_match = resolve_path(
+            request.path_info, getattr(request, "urlconf", None)
+        )
+        if resolver_match is None:
+            return HttpResponse(
+                self.not_found_content,
+                content_type="application/json",
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         # If the URL is valid, continue processing the request
+        request.resolver_match = resolver_match
         response = self.get_response(request)
         return response
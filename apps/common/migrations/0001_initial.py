@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomIdSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sequence_key", models.CharField(max_length=50, unique=True)),
+                ("last_value", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Custom ID Sequence",
+                "verbose_name_plural": "Custom ID Sequence",
+                "db_table": "custom_id_sequence",
+                "ordering": ["-id"],
+            },
+        ),
+    ]
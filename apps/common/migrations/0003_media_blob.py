@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0002_background_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("reference_count", models.PositiveBigIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Media Blob",
+                "verbose_name_plural": "Media Blob",
+                "db_table": "media_blob",
+                "ordering": ["-id"],
+                "indexes": [
+                    models.Index(
+                        fields=["reference_count", "updated_at"],
+                        name="media_blob_referen_50b93a_idx",
+                    )
+                ],
+            },
+        ),
+    ]
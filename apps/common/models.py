@@ -1,4 +1,26 @@
-from django.db.models import CharField, DateTimeField, Model, TextChoices
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import (
+    CharField,
+    DateTimeField,
+    Index,
+    JSONField,
+    Manager,
+    Model,
+    PositiveBigIntegerField,
+    PositiveSmallIntegerField,
+    Q,
+    QuerySet,
+    TextChoices,
+    TextField,
+)
+from django.utils import timezone
+
+from apps.common.functions.validator.batch_validator import (
+    get_batch_validation_error,
+    get_batch_validation_errors,
+)
+from apps.common.functions.validator.image_validator import get_image_header_errors
 
 
 class ActiveStatusChoices(TextChoices):
@@ -6,6 +28,43 @@ class ActiveStatusChoices(TextChoices):
     INACTIVE = "inactive", "Inactive"
 
 
+# The predicate of .active() and the condition of the partial indexes backing it, they must match
+ACTIVE_CONDITION = Q(active_status=ActiveStatusChoices.ACTIVE)
+
+
+class ImageStatusChoices(TextChoices):
+    PENDING = "pending", "Pending"
+    READY = "ready", "Ready"
+    REJECTED = "rejected", "Rejected"
+    FAILED = "failed", "Failed"
+
+
+# * <<--------------------------------------*** Active QuerySet ***--------------------------------------->>
+class ActiveQuerySet(QuerySet):
+    """
+    QuerySet for the models carrying an ``active_status``.
+    """
+
+    def active(self):
+        """
+        Returns the active rows only.
+
+        The filter is ``ACTIVE_CONDITION``, the condition of the partial
+        indexes declared on the catalog tables, so the database can read
+        those small indexes instead of scanning the inactive rows too.
+        """
+        return self.filter(ACTIVE_CONDITION)
+
+
+class ActiveManager(Manager.from_queryset(ActiveQuerySet)):
+    """
+    Default manager of ``DjangoBaseModel``, every row plus ``.active()``.
+
+    It does not hide inactive rows, the admin, the exports and the related
+    lookups still need them.
+    """
+
+
 class DjangoBaseModel(Model):
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
@@ -17,5 +76,204 @@ class DjangoBaseModel(Model):
         null=True,
     )
 
+    # Fields checked by validate_special_character, batch validated by validate_many()
+    special_character_fields: tuple[str, ...] = ()
+    # Image fields and their allowed extensions, batch validated by validate_many()
+    image_extension_fields: dict[str, set[str]] = {}
+    # Image fields served with pre-generated thumbnails and WebP/AVIF copies
+    rendition_image_fields: tuple[str, ...] = ()
+
+    objects = ActiveManager()
+
     class Meta:
         abstract = True
+
+    def validate_image_uploads(self) -> None:
+        """
+        Checks the real format and size of new ``image_extension_fields`` uploads.
+
+        Only the file headers are read, so a decompression bomb is rejected by
+        its declared pixel count before anything decodes it. Stored files were
+        checked when they were uploaded and are skipped.
+
+        Raises:
+            ValidationError: Keyed by the field names of the invalid uploads.
+        """
+        errors = {}
+        for field_name, valid_extensions in self.image_extension_fields.items():
+            field_file = getattr(self, field_name)
+            if not field_file or field_file._committed:
+                continue
+            header_errors = get_image_header_errors(
+                [field_file], valid_extensions, max_pixels=settings.IMAGE_MAX_PIXELS
+            )
+            if header_errors:
+                errors[field_name] = header_errors[0]
+        if errors:
+            raise ValidationError(errors)
+
+    @classmethod
+    def validate_many(cls, instances, exclude=None) -> dict[int, dict[str, list[str]]]:
+        """
+        Validates a batch of instances the way ``full_clean()`` validates one.
+
+        Field validators run in memory, the special character and image
+        extension checks run over the whole batch at once, and foreign keys
+        and uniqueness rules cost one ``IN (...)`` query per field or
+        constraint. The model's own ``clean()`` is not called.
+
+        Args:
+            instances: The instances to validate.
+            exclude: Field names to skip.
+
+        Returns:
+            dict[int, dict[str, list[str]]]: ``{position: {field_name: [messages]}}``, empty if every instance is valid.
+        """
+        return get_batch_validation_errors(cls, instances, exclude)
+
+    @classmethod
+    def bulk_create_validated(cls, instances, **kwargs) -> list:
+        """
+        ``validate_many()`` followed by a single ``bulk_create()``.
+
+        Raises:
+            ValidationError: Keyed by ``row_<position>`` if any instance is invalid, nothing is written.
+        """
+        instances = list(instances)
+        errors = cls.validate_many(instances)
+        if errors:
+            raise get_batch_validation_error(errors)
+        return cls._default_manager.bulk_create(instances, **kwargs)
+
+    @classmethod
+    def bulk_update_validated(cls, instances, fields, **kwargs) -> int:
+        """
+        ``validate_many()`` over the updated ``fields`` followed by a single ``bulk_update()``.
+
+        Raises:
+            ValidationError: Keyed by ``row_<position>`` if any instance is invalid, nothing is written.
+        """
+        instances = list(instances)
+        exclude = {
+            field.name
+            for field in cls._meta.concrete_fields
+            if field.name not in fields and field.attname not in fields
+        }
+        errors = cls.validate_many(instances, exclude=exclude)
+        if errors:
+            raise get_batch_validation_error(errors)
+        return cls._default_manager.bulk_update(instances, fields, **kwargs)
+
+
+# * <<--------------------------------------*** Custom ID Sequence Table ***--------------------------------------->>
+class CustomIdSequence(Model):
+    """
+    Counter table backing the custom ID allocator.
+
+    One row per ``<prefix><ddmmyy>`` key. ``last_value`` is the highest counter
+    handed out so far; workers reserve whole blocks of counters at once, so the
+    row is only touched when a block runs out.
+    """
+
+    sequence_key = CharField(max_length=50, unique=True)
+    last_value = PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Custom ID Sequence"
+        verbose_name_plural = "Custom ID Sequence"
+        ordering = ["-id"]
+        app_label = "common"
+        db_table = "custom_id_sequence"
+
+    def __str__(self):
+        return f"{self.sequence_key}"
+
+    def __repr__(self):
+        return (
+            f"<CustomIdSequence: {self.sequence_key}> <last_value: {self.last_value}>"
+        )
+
+
+class BackgroundJobStatusChoices(TextChoices):
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
+
+
+# * <<--------------------------------------*** Background Job Table ***--------------------------------------->>
+class BackgroundJob(Model):
+    """
+    Database backed job queue, worked by the ``run_background_jobs`` command.
+
+    ``task`` is the dotted path of a function called with ``payload`` as
+    keyword arguments. A job row is written in the same transaction as the
+    data it works on, so no job is lost or run before that data commits.
+    """
+
+    task = CharField(max_length=255)
+    payload = JSONField(default=dict, blank=True)
+    status = CharField(
+        max_length=10,
+        choices=BackgroundJobStatusChoices.choices,
+        default=BackgroundJobStatusChoices.PENDING,
+    )
+    attempts = PositiveSmallIntegerField(default=0)
+    max_attempts = PositiveSmallIntegerField(default=3)
+    run_after = DateTimeField(default=timezone.now)
+    locked_by = CharField(max_length=100, blank=True, null=True)
+    locked_at = DateTimeField(blank=True, null=True)
+    finished_at = DateTimeField(blank=True, null=True)
+    last_error = TextField(blank=True, null=True)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Background Job"
+        verbose_name_plural = "Background Job"
+        ordering = ["-id"]
+        indexes = [
+            # The claim query, due jobs of a status in run order
+            Index(fields=["status", "run_after"]),
+            Index(fields=["task"]),
+        ]
+        app_label = "common"
+        db_table = "background_job"
+
+    def __str__(self):
+        return f"{self.task}"
+
+    def __repr__(self):
+        return f"<BackgroundJob: {self.task}> <status: {self.status}>"
+
+
+# * <<--------------------------------------*** Media Blob Table ***--------------------------------------->>
+class MediaBlob(Model):
+    """
+    Reference count of a file in the content-addressed media storage.
+
+    One row per stored file, counting the model rows whose file fields point
+    at it. Blobs nobody references any more are removed by ``prune_media_blobs``.
+    """
+
+    name = CharField(max_length=255, unique=True)
+    reference_count = PositiveBigIntegerField(default=0)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Media Blob"
+        verbose_name_plural = "Media Blob"
+        ordering = ["-id"]
+        indexes = [
+            # The prune query, unreferenced blobs by age
+            Index(fields=["reference_count", "updated_at"]),
+        ]
+        app_label = "common"
+        db_table = "media_blob"
+
+    def __str__(self):
+        return f"{self.name}"
+
+    def __repr__(self):
+        return f"<MediaBlob: {self.name}> <reference_count: {self.reference_count}>"
@@ -0,0 +1,30 @@
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from apps.common.functions.estimated_count import get_planner_estimated_count
+
+
+# * <<-------------------------------------*** Estimated Count Paginator ***-------------------------------------->>
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin changelist paginator that avoids ``COUNT(*)`` on large tables.
+
+    The planner estimate is used once it passes ``exact_count_threshold``; below
+    that an exact count is cheap and keeps small changelists precise. Use with
+    ``show_full_result_count = False`` so the changelist does not run a second,
+    unfiltered count.
+    """
+
+    exact_count_threshold = 10_000
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+
+        # Without an estimate, or a small one, one exact count
+        estimated_count = get_planner_estimated_count(self.object_list)
+        if estimated_count is None or estimated_count < self.exact_count_threshold:
+            return self.object_list.count()
+        return estimated_count
@@ -1,8 +1,21 @@
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
 from collections import OrderedDict
+from enum import StrEnum
 from math import ceil
 
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import LimitOffsetPagination as _LimitOffsetPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.common.functions.estimated_count import get_estimated_count
+from apps.common.functions.queryset_projection import get_projected_queryset
 
 
 class LimitOffsetPagination(_LimitOffsetPagination):
@@ -45,6 +58,10 @@ def get_paginated_response(
 
     paginator = pagination_class()
 
+    # Only read the columns of the requested fields
+    if "fields" in kwargs:
+        queryset = get_projected_queryset(queryset, kwargs["fields"], serializer_class)
+
     # Set limit and offset if provided
     if limit is not None:
         paginator.default_limit = int(limit)
@@ -66,3 +83,260 @@ def get_paginated_response(
 
     serializer = serializer_class(queryset, **serializer_kwargs)
     return Response(data=serializer.data)
+
+
+class CountModeChoices(StrEnum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on ``(ordering key, id)`` instead of ``OFFSET``.
+
+    Every page is a ``WHERE key < last_key OR (key = last_key AND id < last_id)``
+    range scan of ``limit + 1`` rows, so a deep page costs the same as the first
+    one. The ordering key is the first field of the queryset ordering (or
+    ``ordering`` on the paginator) and must be a non-nullable model field.
+
+    The total count is controlled by the ``count`` query param: ``exact`` runs
+    ``COUNT(*)``, ``estimate`` reads the planner estimate and ``none`` skips it.
+    """
+
+    default_limit = 20
+    max_limit = 50
+    limit_query_param = "limit"
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    default_count_mode = CountModeChoices.EXACT
+    ordering = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.count_mode = self.get_count_mode(request)
+        self.key_field, self.descending = self.get_ordering(queryset)
+        self.count = self.get_count(queryset)
+
+        cursor = self.decode_cursor(request)
+        is_previous = bool(cursor and cursor["p"])
+        # A previous page is read backwards from the cursor and reversed afterwards
+        descending = self.descending != is_previous
+        direction = "-" if descending else ""
+        lookup = "lt" if descending else "gt"
+        key_name = self.key_field.name
+
+        # A projected queryset still needs the key column to build the cursors
+        immediate_fields, is_defer = queryset.query.deferred_loading
+        if not is_defer and immediate_fields:
+            queryset = queryset.only(*immediate_fields, key_name)
+        elif is_defer and key_name in immediate_fields:
+            queryset = queryset.defer(None).defer(*(immediate_fields - {key_name}))
+
+        if self.key_field.primary_key:
+            queryset = queryset.order_by(f"{direction}pk")
+            if cursor:
+                queryset = queryset.filter(**{f"pk__{lookup}": cursor["i"]})
+        else:
+            # The primary key breaks ties between rows sharing the same key value
+            queryset = queryset.order_by(f"{direction}{key_name}", f"{direction}pk")
+            if cursor:
+                queryset = queryset.filter(
+                    Q(**{f"{key_name}__{lookup}": cursor["k"]})
+                    | Q(**{key_name: cursor["k"], f"pk__{lookup}": cursor["i"]})
+                )
+
+        rows = list(queryset[: self.limit + 1])
+        has_more = len(rows) > self.limit
+        rows = rows[: self.limit]
+
+        if is_previous:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("count_mode", self.count_mode.value),
+                    ("limit", self.limit),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ],
+            ),
+        )
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def get_count_mode(self, request) -> CountModeChoices:
+        try:
+            return CountModeChoices(
+                request.query_params.get(
+                    self.count_query_param, self.default_count_mode
+                )
+            )
+        except ValueError:
+            return CountModeChoices(self.default_count_mode)
+
+    def get_count(self, queryset) -> int | None:
+        match self.count_mode:
+            case CountModeChoices.EXACT:
+                return queryset.order_by().count()
+            case CountModeChoices.ESTIMATE:
+                return get_estimated_count(queryset.order_by())
+            case _:
+                return None
+
+    def get_ordering(self, queryset):
+        ordering = (
+            self.ordering
+            or queryset.query.order_by
+            or queryset.model._meta.ordering
+            or ["-pk"]
+        )
+        ordering = ordering[0]
+        if not isinstance(ordering, str):
+            raise ValueError("KeysetPagination only supports ordering by a field name")
+
+        descending = ordering.startswith("-")
+        field_name = ordering.lstrip("-")
+        try:
+            key_field = (
+                queryset.model._meta.pk
+                if field_name == "pk"
+                else queryset.model._meta.get_field(field_name)
+            )
+        except FieldDoesNotExist as error:
+            raise ValueError(
+                f"KeysetPagination cannot order by {field_name}: {error}"
+            ) from error
+        return key_field, descending
+
+    def encode_cursor(self, row, is_previous: bool) -> str:
+        cursor = {
+            "k": getattr(row, self.key_field.attname),
+            "i": row.pk,
+            "p": is_previous,
+        }
+        return b64encode(
+            json.dumps(cursor, cls=DjangoJSONEncoder, separators=(",", ":")).encode(),
+            altchars=b"-_",
+        ).decode()
+
+    def decode_cursor(self, request) -> dict | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(b64decode(encoded.encode(), altchars=b"-_"))
+            if not isinstance(cursor, dict) or not {"k", "i", "p"} <= cursor.keys():
+                raise ValueError("missing cursor keys")
+            if not isinstance(cursor["p"], bool):
+                raise ValueError("invalid cursor direction")
+            # The values end up in .filter(), which raises on a wrong type
+            for key, field in (
+                ("k", self.key_field),
+                ("i", self.key_field.model._meta.pk),
+            ):
+                value = field.to_python(cursor[key])
+                if value is None:
+                    raise ValueError(f"empty cursor value {key}")
+                field.run_validators(value)
+                cursor[key] = value
+        except (
+            BinasciiError,
+            UnicodeDecodeError,
+            ValueError,
+            TypeError,
+            ValidationError,
+        ) as error:
+            raise NotFound("Invalid cursor") from error
+        return cursor
+
+    def get_link(self, cursor: str) -> str:
+        url = remove_query_param(self.request.build_absolute_uri(), "offset")
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.get_link(self.encode_cursor(self.page[-1], is_previous=False))
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        return self.get_link(self.encode_cursor(self.page[0], is_previous=True))
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Total count mode: exact, estimate or none",
+                "schema": {
+                    "type": "string",
+                    "enum": [c.value for c in CountModeChoices],
+                },
+            },
+        ]
+
+
+def get_keyset_paginated_response(
+    pagination_class,
+    serializer_class,
+    queryset,
+    request,
+    view,
+    *args,
+    **kwargs,
+):
+    paginator = pagination_class()
+
+    # Let the view pick the count mode used when the request does not ask for one
+    if "count_mode" in kwargs:
+        paginator.default_count_mode = CountModeChoices(kwargs["count_mode"])
+
+    # Only read the columns of the requested fields
+    if "fields" in kwargs:
+        queryset = get_projected_queryset(queryset, kwargs["fields"], serializer_class)
+
+    page = paginator.paginate_queryset(queryset, request, view=view)
+
+    # Pass fields argument only if it exists in kwargs
+    serializer_kwargs = {
+        "many": True,
+    }
+    if "fields" in kwargs:
+        serializer_kwargs["fields"] = kwargs["fields"]
+
+    serializer = serializer_class(page, **serializer_kwargs)
+    return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,150 @@
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from loguru import logger
+
+# Seconds a PostgreSQL replica is behind, 0 when it replayed all it received
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+# Wall clock time until which the reads of the current request or job stay on the primary
+primary_pinned_until: ContextVar[float] = ContextVar(
+    "primary_pinned_until", default=0.0
+)
+
+
+def pin_primary(seconds: float | None = None) -> None:
+    """
+    Sends the reads of the current context to the primary for ``DATABASE_READ_YOUR_WRITES_SECONDS``.
+    """
+    if seconds is None:
+        seconds = settings.DATABASE_READ_YOUR_WRITES_SECONDS
+    primary_pinned_until.set(max(primary_pinned_until.get(), time.time() + seconds))
+
+
+@contextmanager
+def use_primary():
+    """
+    Reads inside the block go to the primary, for code that must see the latest writes.
+    """
+    token = primary_pinned_until.set(math.inf)
+    try:
+        yield
+    finally:
+        primary_pinned_until.reset(token)
+
+
+# * <<-------------------------------------*** Replica Monitor ***-------------------------------------->>
+class ReplicaMonitor:
+    """
+    Tracks which replicas are up and close enough to the primary to be read.
+
+    Each replica is checked at most every ``DATABASE_REPLICA_CHECK_INTERVAL``
+    seconds per process, by the request routing to it. While a check runs
+    the other threads keep the previous result, a replica never checked yet
+    counts as unavailable.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checked_at: dict[str, float] = {}
+        self.available: dict[str, bool] = {}
+
+    def is_available(self, alias: str) -> bool:
+        now = time.monotonic()
+        with self.lock:
+            is_due = (
+                now - self.checked_at.get(alias, -math.inf)
+                >= settings.DATABASE_REPLICA_CHECK_INTERVAL
+            )
+            if is_due:
+                self.checked_at[alias] = now
+        if is_due:
+            self.available[alias] = self.check(alias)
+        return self.available.get(alias, False)
+
+    @staticmethod
+    def check(alias: str) -> bool:
+        connection = connections[alias]
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == "postgresql":
+                    cursor.execute(REPLICA_LAG_QUERY)
+                    lag = float(cursor.fetchone()[0] or 0)
+                else:
+                    cursor.execute("SELECT 1")
+                    lag = 0.0
+        except Exception as e:
+            logger.error(f"ERROR(ReplicaMonitor):---->> {alias} is down: {e}")
+            connection.close()
+            return False
+
+        if lag > settings.DATABASE_REPLICA_MAX_LAG_SECONDS:
+            logger.warning(
+                f"WARNING(ReplicaMonitor):---->> {alias} is {lag:.1f}s behind"
+            )
+            return False
+        return True
+
+
+replica_monitor = ReplicaMonitor()
+
+
+# * <<-------------------------------------*** Replica Router ***-------------------------------------->>
+class ReplicaRouter:
+    """
+    Routes the reads of ``DATABASE_REPLICA_APPS`` to an available replica and every write to the primary.
+
+    Reads stay on the primary inside a transaction, and for
+    ``DATABASE_READ_YOUR_WRITES_SECONDS`` after the current context wrote a
+    model of those apps; ``ReplicaPinningMiddleware`` carries that window to
+    the next requests of the client. Without replicas it routes nothing.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICA_ALIASES
+        if not replicas or model._meta.app_label not in settings.DATABASE_REPLICA_APPS:
+            return None
+
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            # Related rows come from the database the instance was read from
+            return instance._state.db
+        if (
+            primary_pinned_until.get() > time.time()
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+
+        available = [alias for alias in replicas if replica_monitor.is_available(alias)]
+        return random.choice(available) if available else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if not settings.DATABASE_REPLICA_ALIASES:
+            return None
+        if model._meta.app_label in settings.DATABASE_REPLICA_APPS:
+            pin_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICA_ALIASES}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema by replication
+        if db in settings.DATABASE_REPLICA_ALIASES:
+            return False
+        return None
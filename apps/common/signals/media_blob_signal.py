@@ -0,0 +1,94 @@
+from django.apps import apps
+from django.db.models import FileField
+from django.db.models.signals import post_delete, post_init, post_save
+
+from apps.common.storage.content_addressed_storage import ContentAddressedStorage
+
+MEDIA_BLOB_NAMES_ATTR = "_media_blob_names"
+
+
+def get_content_addressed_fields(model_class) -> list[FileField]:
+    return [
+        field
+        for field in model_class._meta.concrete_fields
+        if isinstance(field, FileField)
+        and isinstance(field.storage, ContentAddressedStorage)
+    ]
+
+
+def get_file_name(instance, field: FileField) -> str | None:
+    value = instance.__dict__.get(field.attname)
+    return getattr(value, "name", value) or None
+
+
+# * <<-------------------------------------*** Media Blob Reference Signal ***------------------------------------->>
+def media_blob_post_init(sender, instance, **kwargs):
+    """
+    Remembers the loaded file names, the baseline the next save is compared to.
+    """
+    instance.__dict__[MEDIA_BLOB_NAMES_ATTR] = {
+        field.attname: get_file_name(instance, field)
+        for field in get_content_addressed_fields(sender)
+        # Deferred fields are unknown, a change to them is counted as an addition
+        if field.attname in instance.__dict__
+    }
+
+
+def media_blob_post_save(sender, instance, raw=False, **kwargs):
+    """
+    Moves the references of the file fields whose file changed with this save.
+    """
+    if raw:
+        return
+
+    names = instance.__dict__.setdefault(MEDIA_BLOB_NAMES_ATTR, {})
+    for field in get_content_addressed_fields(sender):
+        if field.attname not in instance.__dict__:
+            continue
+        name = get_file_name(instance, field)
+        previous_name = names.get(field.attname)
+        if name == previous_name:
+            continue
+        if name:
+            field.storage.add_reference(name)
+        if previous_name:
+            field.storage.remove_reference(previous_name)
+        names[field.attname] = name
+
+
+def media_blob_post_delete(sender, instance, **kwargs):
+    """
+    Drops the references of a deleted row, ``prune_media_blobs`` removes the orphaned files.
+    """
+    names = instance.__dict__.get(MEDIA_BLOB_NAMES_ATTR, {})
+    for field in get_content_addressed_fields(sender):
+        name = names.get(field.attname) or get_file_name(instance, field)
+        if name:
+            field.storage.remove_reference(name)
+
+
+def connect_media_blob_signals() -> None:
+    """
+    Connects the reference counting to the models with content-addressed file fields only.
+
+    Every other model keeps instantiating without a ``post_init`` receiver.
+    """
+    for model_class in apps.get_models():
+        if not get_content_addressed_fields(model_class):
+            continue
+        label = model_class._meta.label_lower
+        post_init.connect(
+            media_blob_post_init,
+            sender=model_class,
+            dispatch_uid=f"media_blob_post_init_{label}",
+        )
+        post_save.connect(
+            media_blob_post_save,
+            sender=model_class,
+            dispatch_uid=f"media_blob_post_save_{label}",
+        )
+        post_delete.connect(
+            media_blob_post_delete,
+            sender=model_class,
+            dispatch_uid=f"media_blob_post_delete_{label}",
+        )
@@ -0,0 +1,83 @@
+import hashlib
+import posixpath
+
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.common.models import MediaBlob
+
+
+# * <<-------------------------------------*** Content Addressed Storage ***-------------------------------------->>
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    ``FileSystemStorage`` naming every file by the SHA-256 of its content.
+
+    ``product/napa.jpg`` is stored as ``product/ab/cd/abcd...ef.jpg``, sharded
+    by the first hash bytes so no directory grows unbounded. Saving content
+    that is already stored is a hash and an existence check, nothing is
+    written. The model rows pointing at a file are counted in ``MediaBlob``
+    by the media blob signals, so copying a file field to another row costs
+    no disk I/O either. Reusing a stored file restarts the prune grace period
+    of its blob, so it is not pruned before the new row references it.
+    """
+
+    def __init__(self, **kwargs):
+        # Same name means same content, rewriting a file can never change it
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+
+    def get_content_name(self, name: str, content) -> str:
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content_hash = digest.hexdigest()
+        return posixpath.join(
+            posixpath.dirname(name),
+            content_hash[:2],
+            content_hash[2:4],
+            f"{content_hash}{posixpath.splitext(name)[1].lower()}",
+        )
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        name = self.get_content_name(name, content)
+        # Without a blob row the file predates this backend or was just pruned, write it again
+        if self.exists(name) and self.touch(name):
+            return name
+        return super().save(name, content, max_length=max_length)
+
+    def touch(self, name: str) -> bool:
+        """
+        Restarts the prune grace period of a stored file, False if it has no blob row.
+        """
+        return bool(
+            MediaBlob.objects.filter(name=name).update(updated_at=timezone.now())
+        )
+
+    def add_reference(self, name: str) -> None:
+        if MediaBlob.objects.filter(name=name).update(
+            reference_count=F("reference_count") + 1, updated_at=timezone.now()
+        ):
+            return
+        try:
+            with transaction.atomic():
+                MediaBlob.objects.create(name=name, reference_count=1)
+        except IntegrityError:
+            # Created by a concurrent save in between
+            MediaBlob.objects.filter(name=name).update(
+                reference_count=F("reference_count") + 1, updated_at=timezone.now()
+            )
+
+    def remove_reference(self, name: str) -> None:
+        # Files stored before this backend have no blob row and are never pruned
+        # update() skips auto_now, the grace period starts from the last release
+        MediaBlob.objects.filter(name=name, reference_count__gt=0).update(
+            reference_count=F("reference_count") - 1, updated_at=timezone.now()
+        )
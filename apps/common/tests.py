@@ -1 +1,504 @@
-# Create your tests here.
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from base64 import b64encode
+from datetime import timedelta
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.common.functions.background_job import (
+    claim_background_jobs,
+    enqueue_background_job,
+    run_background_job,
+)
+from apps.common.functions.custom_id import CustomIdAllocator
+from apps.common.functions.metrics import (
+    EXITED_PROCESSES_FILE_NAME,
+    metrics_registry,
+)
+from apps.common.functions.url_resolver import resolve_path
+from apps.common.functions.validator.image_validator import (
+    PNG_SIGNATURE,
+    get_image_header,
+    get_image_header_errors,
+)
+from apps.common.middleware.request_timing_middleware import RequestTimingMiddleware
+from apps.common.middleware.url_validation_middleware import UrlValidationMiddleware
+from apps.common.models import BackgroundJob, BackgroundJobStatusChoices, MediaBlob
+from apps.common.pagination.admin_paginator import EstimatedCountPaginator
+from apps.common.pagination.pagination import KeysetPagination
+from apps.common.routers.replica_router import (
+    ReplicaRouter,
+    primary_pinned_until,
+    replica_monitor,
+    use_primary,
+)
+from config.server.handlers import CachedResolverWSGIHandler
+
+
+def succeed_background_job() -> None:
+    return None
+
+
+def fail_background_job(message: str) -> None:
+    raise ValueError(message)
+
+
+# * <<-------------------------------------*** Background Job Test ***-------------------------------------->>
+@override_settings(BACKGROUND_JOBS_EAGER=False, BACKGROUND_JOB_RETRY_DELAY=10)
+class BackgroundJobTest(TestCase):
+    """
+    A job is claimed by one worker at a time and retried with a doubling delay.
+    """
+
+    def claim_and_run(self, job: BackgroundJob) -> BackgroundJob:
+        BackgroundJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        self.assertEqual(claim_background_jobs(1, "worker"), [job.id])
+        run_background_job(job.id)
+        job.refresh_from_db()
+        return job
+
+    def test_each_job_is_claimed_once(self):
+        job_ids = [enqueue_background_job(succeed_background_job).id for _ in range(3)]
+        enqueue_background_job(succeed_background_job, delay=60)
+
+        first = claim_background_jobs(2, "first")
+        second = claim_background_jobs(5, "second")
+
+        self.assertEqual(first + second, job_ids)
+        self.assertEqual(claim_background_jobs(5, "third"), [])
+        job = BackgroundJob.objects.get(id=second[0])
+        self.assertEqual(job.status, BackgroundJobStatusChoices.RUNNING)
+        self.assertEqual((job.attempts, job.locked_by), (1, "second"))
+
+    def test_job_of_a_crashed_worker_is_claimed_again(self):
+        job = enqueue_background_job(succeed_background_job)
+        claim_background_jobs(1, "crashed")
+
+        with override_settings(BACKGROUND_JOB_LEASE_TIMEOUT=60):
+            BackgroundJob.objects.filter(id=job.id).update(
+                locked_at=timezone.now() - timedelta(seconds=61)
+            )
+            self.assertEqual(claim_background_jobs(1, "worker"), [job.id])
+
+        job.refresh_from_db()
+        self.assertEqual((job.attempts, job.locked_by), (2, "worker"))
+        self.assertEqual(
+            run_background_job(job.id), BackgroundJobStatusChoices.SUCCEEDED
+        )
+
+    def test_failed_job_is_retried_with_backoff(self):
+        job = enqueue_background_job(
+            fail_background_job, max_attempts=3, message="broken"
+        )
+
+        for attempt, retry_delay in ((1, 10), (2, 20)):
+            started_at = timezone.now()
+            job = self.claim_and_run(job)
+            self.assertEqual(job.status, BackgroundJobStatusChoices.PENDING)
+            self.assertEqual(job.attempts, attempt)
+            self.assertIsNone(job.locked_by)
+            self.assertGreaterEqual(
+                job.run_after, started_at + timedelta(seconds=retry_delay)
+            )
+            self.assertEqual(claim_background_jobs(1, "worker"), [])
+
+        job = self.claim_and_run(job)
+        self.assertEqual(job.status, BackgroundJobStatusChoices.FAILED)
+        self.assertEqual(job.attempts, 3)
+        self.assertIsNotNone(job.finished_at)
+        self.assertIn("ValueError: broken", job.last_error)
+
+
+# * <<-------------------------------------*** Custom Id Allocator Test ***-------------------------------------->>
+class CustomIdAllocatorTest(TransactionTestCase):
+    """
+    Allocators sharing the sequence table never hand out the same counter.
+    """
+
+    def test_rolled_back_reservation_is_not_reused(self):
+        allocator = CustomIdAllocator(block_size=10)
+        other = CustomIdAllocator(block_size=10)
+
+        with self.assertRaises(ValueError), transaction.atomic():
+            allocator.allocate("TST", "181026", count=3)
+            raise ValueError("rolled back")
+        counters = other.allocate("TST", "181026", count=3)
+        counters += allocator.allocate("TST", "181026", count=3)
+        counters += other.allocate("TST", "181026", count=3)
+
+        self.assertEqual(len(set(counters)), len(counters))
+
+    def test_allocators_get_disjoint_blocks(self):
+        first = CustomIdAllocator(block_size=10)
+        second = CustomIdAllocator(block_size=10)
+
+        counters = []
+        for count in (5, 5, 8, 30, 1):
+            counters += first.allocate("TST", "181026", count=count)
+            counters += second.allocate("TST", "181026", count=count)
+
+        self.assertEqual(len(counters), 98)
+        self.assertEqual(len(set(counters)), len(counters))
+
+
+# * <<-------------------------------------*** Media Blob Prune Test ***-------------------------------------->>
+class MediaBlobPruneTest(TestCase):
+    """
+    A stored file reused by a new upload survives a prune running before the upload is referenced.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def test_reused_file_is_not_pruned(self):
+        name = default_storage.save("product/napa.txt", ContentFile(b"napa"))
+        expired = MediaBlob.objects.create(name=name, reference_count=0)
+        MediaBlob.objects.filter(id=expired.id).update(
+            updated_at=timezone.now() - timedelta(hours=25)
+        )
+        forgotten = default_storage.save("product/ace.txt", ContentFile(b"ace"))
+        MediaBlob.objects.filter(id=MediaBlob.objects.create(name=forgotten).id).update(
+            updated_at=timezone.now() - timedelta(hours=25)
+        )
+
+        # The upload deduplicates onto the expired blob, prune runs before its post_save
+        self.assertEqual(
+            default_storage.save("product/napa.txt", ContentFile(b"napa")), name
+        )
+        call_command("prune_media_blobs", stdout=io.StringIO())
+
+        self.assertTrue(default_storage.exists(name))
+        self.assertTrue(MediaBlob.objects.filter(name=name).exists())
+        self.assertFalse(default_storage.exists(forgotten))
+        self.assertFalse(MediaBlob.objects.filter(name=forgotten).exists())
+
+
+# * <<-------------------------------------*** Metrics Test ***-------------------------------------->>
+class MetricsTest(TestCase):
+    """
+    /metrics needs a token outside development and exited workers fold into one file.
+    """
+
+    @override_settings(DEBUG=False, METRICS_AUTH_TOKEN=None)
+    def test_metrics_are_hidden_without_a_token(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
+
+    @override_settings(DEBUG=False, METRICS_AUTH_TOKEN="scrape")
+    def test_metrics_need_the_token(self):
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, 401)
+        response = self.client.get(url, headers={"Authorization": "Bearer scrape"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_exited_processes_are_folded(self):
+        metrics_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(metrics_directory.cleanup)
+        directory = Path(metrics_directory.name)
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        for index, queries in enumerate([2, 3]):
+            (directory / f"{process.pid}-{index}.json").write_text(
+                json.dumps(
+                    {
+                        "pid": process.pid,
+                        "values": [
+                            ["db_queries_total", [], queries],
+                            ["db_pool_requests_waiting", ["default"], 1],
+                        ],
+                        "histograms": [],
+                    }
+                )
+            )
+        own_queries = metrics_registry.values.get(("db_queries_total", ()), 0)
+
+        with self.settings(METRICS_MULTIPROCESS_DIR=str(directory)):
+            first = metrics_registry.collect()
+            second = metrics_registry.collect()
+
+        self.assertIn(f"db_queries_total {own_queries + 5}", first)
+        self.assertEqual(first, second)
+        self.assertEqual(
+            [path.name for path in directory.glob("*.json")],
+            [EXITED_PROCESSES_FILE_NAME],
+        )
+        self.assertNotIn('db_pool_requests_waiting{alias="default"}', first)
+
+
+# * <<-------------------------------------*** Url Resolver Test ***-------------------------------------->>
+class UrlResolverTest(SimpleTestCase):
+    """
+    Each request gets its own copy of a cached match, the handler reuses it.
+    """
+
+    path = "/api/v1/products/image-renditions/small/webp/product/napa.jpg"
+
+    def test_changed_kwargs_do_not_reach_the_cache(self):
+        first = resolve_path(self.path)
+        first.kwargs.pop("name")
+
+        second = resolve_path(self.path)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.kwargs["name"], "product/napa.jpg")
+
+    def test_middleware_match_is_reused_by_the_handler(self):
+        handler = CachedResolverWSGIHandler()
+        request = RequestFactory().get(self.path)
+        UrlValidationMiddleware(lambda request: HttpResponse())(request)
+        resolver_match = request.resolver_match
+
+        self.assertIs(handler.resolve_request(request), resolver_match)
+
+        # A urlconf set after the middleware resolves the path again
+        request.urlconf = None
+        resolved = handler.resolve_request(request)
+        self.assertIsNot(resolved, resolver_match)
+        self.assertEqual(resolved.kwargs, resolver_match.kwargs)
+
+
+# * <<-------------------------------------*** Request Timing Test ***-------------------------------------->>
+class RequestTimingTest(SimpleTestCase):
+    """
+    The Server-Timing header is only sent to staff users or with DEBUG on.
+    """
+
+    def get_response(self, user):
+        request = RequestFactory().get("/")
+        request.user = user
+        return RequestTimingMiddleware(lambda request: HttpResponse())(request)
+
+    def test_server_timing_is_hidden_from_other_users(self):
+        self.assertNotIn("Server-Timing", self.get_response(AnonymousUser()))
+        self.assertIn(
+            "Server-Timing", self.get_response(get_user_model()(is_staff=True))
+        )
+
+    @override_settings(DEBUG=True)
+    def test_server_timing_is_sent_with_debug(self):
+        self.assertIn("Server-Timing", self.get_response(AnonymousUser()))
+
+
+# * <<-------------------------------------*** Image Header Test ***-------------------------------------->>
+class ImageHeaderTest(SimpleTestCase):
+    """
+    The format and size are read from the header bytes, nothing is decoded.
+    """
+
+    @staticmethod
+    def get_png(width: int, height: int) -> io.BytesIO:
+        return io.BytesIO(
+            PNG_SIGNATURE
+            + b"\x00\x00\x00\rIHDR"
+            + width.to_bytes(4, "big")
+            + height.to_bytes(4, "big")
+            + bytes(16)
+        )
+
+    def test_headers_are_parsed_without_decoding(self):
+        jpeg = (
+            b"\xff\xd8"
+            # APP0 segment, seeked over
+            + b"\xff\xe0\x00\x10"
+            + bytes(14)
+            # Baseline frame header: precision, height, width
+            + b"\xff\xc0\x00\x11\x08"
+            + (480).to_bytes(2, "big")
+            + (640).to_bytes(2, "big")
+            + bytes(12)
+        )
+        gif = b"GIF89a" + (640).to_bytes(2, "little") + (480).to_bytes(2, "little")
+        webp = (
+            b"RIFF"
+            + bytes(4)
+            + b"WEBPVP8X"
+            + bytes(8)
+            # Extended canvas, dimensions minus one
+            + (639).to_bytes(3, "little")
+            + (479).to_bytes(3, "little")
+        )
+        bmp = (
+            b"BM"
+            + bytes(12)
+            + (40).to_bytes(4, "little")
+            + (640).to_bytes(4, "little")
+            # Negative height, a top-down bitmap
+            + (-480).to_bytes(4, "little", signed=True)
+            + bytes(6)
+        )
+
+        for image_format, content in (
+            ("png", self.get_png(640, 480)),
+            ("jpeg", io.BytesIO(jpeg)),
+            ("gif", io.BytesIO(gif + bytes(22))),
+            ("webp", io.BytesIO(webp + bytes(2))),
+            ("bmp", io.BytesIO(bmp)),
+        ):
+            with self.subTest(image_format=image_format):
+                header = get_image_header(content)
+                self.assertEqual(header, (image_format, 640, 480))
+                # The caller's file position is kept
+                self.assertEqual(content.tell(), 0)
+
+    def test_truncated_jpeg_is_not_an_image(self):
+        # The APP0 segment runs past the end, there is no frame header
+        truncated = io.BytesIO(b"\xff\xd8\xff\xe0\x00\x10JFIF")
+
+        self.assertIsNone(get_image_header(truncated))
+        self.assertEqual(
+            get_image_header_errors([truncated]), {0: "The file is not a valid image"}
+        )
+
+    def test_decompression_bomb_is_rejected_from_its_declared_size(self):
+        errors = get_image_header_errors(
+            [self.get_png(640, 480), self.get_png(100_000, 100_000)],
+            {".png"},
+            max_pixels=1_000_000,
+        )
+
+        self.assertEqual(list(errors), [1])
+        self.assertIn("exceeds the limit of 1000000 pixels", errors[1])
+
+
+# * <<-------------------------------------*** Keyset Pagination Test ***-------------------------------------->>
+class KeysetPaginationTest(TestCase):
+    """
+    A tampered cursor is not found, it must never reach the query.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for _ in range(3):
+            enqueue_background_job(succeed_background_job)
+
+    def paginate(self, cursor: str | None = None) -> tuple[KeysetPagination, list]:
+        params = {"limit": 2, "cursor": cursor} if cursor else {"limit": 2}
+        request = Request(APIRequestFactory().get("/", params))
+        paginator = KeysetPagination()
+        return paginator, paginator.paginate_queryset(
+            BackgroundJob.objects.all(), request
+        )
+
+    def test_next_cursor_continues_the_page(self):
+        paginator, first_page = self.paginate()
+        cursor = paginator.encode_cursor(first_page[-1], is_previous=False)
+
+        _, second_page = self.paginate(cursor)
+
+        self.assertEqual(len(first_page + second_page), 3)
+        self.assertLess(second_page[0].id, first_page[-1].id)
+
+    def test_cursor_with_wrong_value_types_is_not_found(self):
+        for cursor in (
+            {"k": "abc", "i": "abc", "p": False},
+            {"k": [1], "i": 1, "p": False},
+            {"k": 1, "i": None, "p": False},
+            {"k": 1, "i": 1, "p": "yes"},
+            {"k": 2**70, "i": 2**70, "p": False},
+        ):
+            encoded = b64encode(json.dumps(cursor).encode(), altchars=b"-_").decode()
+            with self.subTest(cursor=cursor), self.assertRaises(NotFound):
+                self.paginate(encoded)
+
+
+# * <<-------------------------------------*** Estimated Count Paginator Test ***-------------------------------------->>
+class EstimatedCountPaginatorTest(TestCase):
+    """
+    Without a planner estimate the changelist is counted exactly, and only once.
+    """
+
+    def test_count_without_estimate_runs_one_count(self):
+        for _ in range(3):
+            enqueue_background_job(succeed_background_job)
+        paginator = EstimatedCountPaginator(BackgroundJob.objects.all(), 2)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 3)
+
+
+# * <<-------------------------------------*** Replica Router Test ***-------------------------------------->>
+@override_settings(
+    DATABASE_REPLICA_ALIASES=["replica"],
+    DATABASE_REPLICA_APPS=["common"],
+    DATABASE_REPLICA_CHECK_INTERVAL=60,
+    DATABASE_READ_YOUR_WRITES_SECONDS=5,
+)
+class ReplicaRouterTest(SimpleTestCase):
+    """
+    Catalog reads go to a healthy replica, unless the context must see its own writes.
+    """
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        token = primary_pinned_until.set(0.0)
+        self.addCleanup(primary_pinned_until.reset, token)
+        self.set_replica_available(True)
+        self.addCleanup(replica_monitor.checked_at.pop, "replica", None)
+        self.addCleanup(replica_monitor.available.pop, "replica", None)
+
+    @staticmethod
+    def set_replica_available(is_available: bool) -> None:
+        # Checked just now, the monitor keeps the result for the check interval
+        replica_monitor.checked_at["replica"] = time.monotonic()
+        replica_monitor.available["replica"] = is_available
+
+    def test_catalog_reads_go_to_the_replica(self):
+        self.assertEqual(self.router.db_for_read(BackgroundJob), "replica")
+        self.assertIsNone(self.router.db_for_read(ContentType))
+
+    def test_unavailable_replica_falls_back_to_the_primary(self):
+        self.set_replica_available(False)
+
+        self.assertEqual(self.router.db_for_read(BackgroundJob), DEFAULT_DB_ALIAS)
+
+    def test_reads_after_a_write_stay_on_the_primary(self):
+        self.assertEqual(self.router.db_for_write(BackgroundJob), DEFAULT_DB_ALIAS)
+
+        self.assertEqual(self.router.db_for_read(BackgroundJob), DEFAULT_DB_ALIAS)
+        # The read-your-writes window is over
+        primary_pinned_until.set(time.time() - 1)
+        self.assertEqual(self.router.db_for_read(BackgroundJob), "replica")
+
+    def test_use_primary_reads_from_the_primary(self):
+        with use_primary():
+            self.assertEqual(self.router.db_for_read(BackgroundJob), DEFAULT_DB_ALIAS)
+        self.assertEqual(self.router.db_for_read(BackgroundJob), "replica")
+
+    def test_related_rows_come_from_the_instance_database(self):
+        job = BackgroundJob(id=1)
+        job._state.db = DEFAULT_DB_ALIAS
+
+        self.assertEqual(
+            self.router.db_for_read(BackgroundJob, instance=job), DEFAULT_DB_ALIAS
+        )
+
+    def test_replicas_are_never_migrated(self):
+        self.assertFalse(self.router.allow_migrate("replica", "common"))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "common"))
@@ -1 +1,43 @@
-# Create your views here.
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+from loguru import logger
+
+from apps.common.functions.background_job import get_background_job_counts
+from apps.common.functions.metrics import metrics_registry
+
+
+# * <<-------------------------------------*** Metrics View ***-------------------------------------->>
+@never_cache
+@require_GET
+def metrics_view(request):
+    """
+    Serves the metrics of every server process in the Prometheus text exposition format.
+    """
+    if not settings.METRICS_ENABLED:
+        return HttpResponse(status=404)
+
+    token = settings.METRICS_AUTH_TOKEN
+    if not token and not settings.DEBUG:
+        # Never exposed without a token outside development
+        return HttpResponse(status=404)
+    if token and not hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse(status=401)
+
+    extra_gauges = {}
+    try:
+        # Read here, the queue is shared by all processes
+        for job_status, count in get_background_job_counts().items():
+            extra_gauges[("background_jobs", (str(job_status),))] = count
+    except Exception as e:
+        logger.error(f"ERROR(metrics_view):---->> {e}")
+
+    return HttpResponse(
+        metrics_registry.collect(extra_gauges),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("medicines", "0002_medicineinfo"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="genericnameinformation",
+            name="generic_nam_id_21ce4c_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="genericnameinformation",
+            name="generic_nam_generic_683e4a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="medicineinfo",
+            name="medicine_in_id_0c0f99_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="medicineinfo",
+            name="medicine_in_product_c87874_idx",
+        ),
+    ]
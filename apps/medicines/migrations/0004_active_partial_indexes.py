@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("medicines", "0003_drop_redundant_indexes"),
+        ("products", "0015_query_driven_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="genericnameinformation",
+            name="generic_nam_active__39a8d9_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="medicineinfo",
+            name="medicine_in_active__7721d4_idx",
+        ),
+        migrations.AddIndex(
+            model_name="genericnameinformation",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="generic_name_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicineinfo",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="medicine_info_active_id_idx",
+            ),
+        ),
+    ]
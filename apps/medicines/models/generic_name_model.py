@@ -10,6 +10,7 @@ from django.db.models import (
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.models import (
+    ACTIVE_CONDITION,
     ActiveStatusChoices,
     DjangoBaseModel,
 )
@@ -40,9 +41,11 @@ class GenericNameInformation(DjangoBaseModel):
         verbose_name_plural = _("Generic Name Information")
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["generic_name"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="generic_name_active_id_idx",
+            ),
         ]
         app_label = "medicines"
         db_table = "generic_name_information"
@@ -11,7 +11,7 @@ from django.db.models import (
 )
 from django.utils.translation import gettext_lazy as _
 
-from apps.common.models import ActiveStatusChoices, DjangoBaseModel
+from apps.common.models import ACTIVE_CONDITION, ActiveStatusChoices, DjangoBaseModel
 from apps.medicines.models.generic_name_model import GenericNameInformation
 
 # Import other models
@@ -61,9 +61,11 @@ class MedicineInfo(DjangoBaseModel):
         verbose_name_plural = _("Medicine Info")
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["product"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="medicine_info_active_id_idx",
+            ),
             Index(fields=["is_required_prescription"]),
         ]
         app_label = "medicines"
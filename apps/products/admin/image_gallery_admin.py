@@ -15,6 +15,7 @@ class ProductImageGalleryAdmin(ModelAdmin):
     list_display = (
         "id",
         "product",
+        "image_status",
         "created_at",
         "updated_at",
         "active_status",
@@ -26,6 +27,7 @@ class ProductImageGalleryAdmin(ModelAdmin):
         "product",
     )
     list_filter = (
+        "image_status",
         "active_status",
         ("created_at", DateFieldListFilter),
         (
@@ -42,3 +44,9 @@ class ProductImageGalleryAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    list_select_related = ("product__product_unit__unit_attribute",)
+    autocomplete_fields = ("product",)
+
+    def get_queryset(self, request):
+        # ProductImageGallery.__str__ renders the product name in autocomplete results as well
+        return super().get_queryset(request).select_related(*self.list_select_related)
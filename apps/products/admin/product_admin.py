@@ -6,6 +6,7 @@ from django.contrib.admin import (
 )
 from rangefilter.filters import DateRangeFilterBuilder
 
+from apps.common.pagination.admin_paginator import EstimatedCountPaginator
 from apps.products.models.product_model import Product
 
 
@@ -54,3 +55,26 @@ class ProductAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    list_select_related = (
+        "purchase_vat",
+        "sales_vat",
+        "product_unit__unit_attribute",
+        "brand",
+        "manufacturer",
+    )
+    autocomplete_fields = (
+        "sub_category",
+        "purchase_vat",
+        "sales_vat",
+        "product_unit",
+        "brand",
+        "manufacturer",
+    )
+    # COUNT(*) on the product table dominates the changelist on large catalogs
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # Product.__str__ renders the unit in autocomplete results as well. ChangeList
+        # skips list_select_related once the queryset already selects related rows.
+        return super().get_queryset(request).select_related(*self.list_select_related)
@@ -48,3 +48,5 @@ class ProductSeoAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    list_select_related = ("product__product_unit__unit_attribute",)
+    autocomplete_fields = ("product",)
@@ -49,3 +49,5 @@ class SubCategoryAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    list_select_related = ("category",)
+    autocomplete_fields = ("category",)
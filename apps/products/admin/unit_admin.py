@@ -88,3 +88,9 @@ class UnitAttributeValueAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    list_select_related = ("unit_attribute",)
+    autocomplete_fields = ("unit_attribute",)
+
+    def get_queryset(self, request):
+        # UnitAttributeValue.__str__ renders the attribute name in autocomplete results as well
+        return super().get_queryset(request).select_related(*self.list_select_related)
@@ -44,3 +44,7 @@ class ProductVariationAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    autocomplete_fields = (
+        "product",
+        "variation_attribute",
+    )
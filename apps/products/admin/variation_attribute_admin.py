@@ -87,3 +87,5 @@ class VariationAttributeValueAdmin(ModelAdmin):
     )
     ordering = ("-id",)
     list_per_page = 50
+    list_select_related = ("variation_attribute",)
+    autocomplete_fields = ("variation_attribute",)
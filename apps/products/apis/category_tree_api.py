@@ -0,0 +1,140 @@
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import never_cache
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
+from loguru import logger
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.dataclass.response_dataclass import (
+    ErrorResponse,
+    ErrorType,
+    ResponseClient,
+    SuccessResponse,
+)
+from apps.common.documentation.documentation import ResponseAPIDocumentation
+from apps.common.functions.valid_query_params import get_valid_query_params
+from apps.common.models import ActiveStatusChoices
+from apps.products.function.category_tree_cache_method import (
+    get_cached_category_tree,
+)
+from apps.products.function.category_tree_method import get_category_tree
+
+
+# * <<-------------------------------------*** Category Tree API ***-------------------------------------->>
+# The active tree has its own versioned cache, keep the page cache middleware out of it
+@method_decorator(never_cache, name="dispatch")
+class CategoryTreeAPIView(APIView):
+    """
+    Returns the full category -> sub-category tree built from a single query.
+
+    The active tree is served pre-rendered from the cache.
+    """
+
+    @extend_schema(
+        tags=["Category"],
+        summary="Category tree",
+        description="Nested categories, child categories and sub-categories.",
+        parameters=[
+            OpenApiParameter(
+                name="active_status",
+                type=str,
+                description="'active' (default) returns active nodes only, 'all' returns every node",
+                examples=[OpenApiExample("Active Status Example", value="active")],
+            ),
+            OpenApiParameter(
+                name="is_client_usable",
+                type=bool,
+                description="Return client usable nodes only",
+                examples=[OpenApiExample("Client Usable Example", value=True)],
+            ),
+        ],
+        examples=[
+            ResponseAPIDocumentation.get_200_response(
+                message="Category tree fetched successfully",
+                example={
+                    "id": 1,
+                    "type": "category",
+                    "name": "Medicine",
+                    "icon": None,
+                    "is_client_usable": True,
+                    "children": [],
+                },
+            ),
+            ResponseAPIDocumentation.get_400_response(),
+            ResponseAPIDocumentation.get_500_response(),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        query_params = request.query_params
+        valid_params = get_valid_query_params(
+            "details",
+            set(query_params.keys()),
+            extended_fields=["active_status", "is_client_usable"],
+        )
+        if not valid_params["is_valid"]:
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="Invalid query parameters",
+                    client=ResponseClient.DEVELOPER,
+                    description={
+                        "allowed_params": sorted(valid_params["allowed_params"]),
+                        "invalid_params": valid_params["invalid_params"],
+                    },
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        active_status = query_params.get("active_status", ActiveStatusChoices.ACTIVE)
+        if active_status not in (ActiveStatusChoices.ACTIVE, "all"):
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="Invalid active_status",
+                    client=ResponseClient.DEVELOPER,
+                    description={"active_status": ["active", "all"]},
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        client_usable_only = query_params.get("is_client_usable", "").lower() in (
+            "true",
+            "1",
+        )
+        try:
+            if active_status == ActiveStatusChoices.ACTIVE:
+                return HttpResponse(
+                    get_cached_category_tree(client_usable_only),
+                    content_type="application/json",
+                )
+
+            tree = get_category_tree(
+                active_only=False, client_usable_only=client_usable_only
+            )
+        except Exception as e:
+            logger.error(f"ERROR(CategoryTreeAPIView):---->> {e}")
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    type=ErrorType.ERROR,
+                    message="An server side error occurred while processing your request",
+                    client=ResponseClient.DEVELOPER,
+                    description={"error": str(e)},
+                ).model_dump(),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(
+            SuccessResponse(
+                status=status.HTTP_200_OK,
+                message="Category tree fetched successfully",
+                client=ResponseClient.USER,
+                data=tree,
+                links={},
+            ).model_dump(),
+            status=status.HTTP_200_OK,
+        )
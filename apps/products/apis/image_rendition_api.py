@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import HttpResponseRedirect
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from loguru import logger
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.dataclass.response_dataclass import (
+    ErrorResponse,
+    ErrorType,
+    ResponseClient,
+)
+from apps.common.documentation.documentation import ResponseAPIDocumentation
+from apps.products.services.image_rendition_service import (
+    get_rejected_image_names,
+    get_rendition_formats,
+    get_rendition_name,
+    get_rendition_storage,
+    is_rendition_source,
+    schedule_stored_image,
+)
+
+
+# * <<-------------------------------------*** Image Rendition API ***-------------------------------------->>
+class ImageRenditionAPIView(APIView):
+    """
+    Redirects to an image rendition, or to the original until the rendition exists.
+
+    Serializers link here only until an image's renditions exist, afterwards
+    they link the stored files directly. Nothing is rendered on the request
+    path: a missing rendition queues the image job once, and images the job
+    rejects are not found.
+    """
+
+    @extend_schema(
+        tags=["Product"],
+        summary="Image rendition",
+        description="Redirects to a downscaled WebP/AVIF copy of an uploaded image, or to the original while it is rendered.",
+        responses={302: OpenApiResponse(description="Redirect to the rendition")},
+        examples=[
+            ResponseAPIDocumentation.get_404_response(),
+            ResponseAPIDocumentation.get_500_response(),
+        ],
+    )
+    def get(self, request, size, file_format, name, *args, **kwargs):
+        if (
+            size not in settings.IMAGE_RENDITION_SIZES
+            or file_format not in get_rendition_formats()
+            or not is_rendition_source(name)
+            or not default_storage.exists(name)
+        ):
+            return self.get_not_found_response()
+
+        rendition_name = get_rendition_name(name, size, file_format)
+        rendition_storage = get_rendition_storage()
+        try:
+            if rendition_storage.exists(rendition_name):
+                return HttpResponseRedirect(rendition_storage.url(rendition_name))
+
+            # Header only, the image job refuses the same images
+            with default_storage.open(name, "rb") as image:
+                is_rejected = bool(get_rejected_image_names([image]))
+            if not is_rejected:
+                schedule_stored_image(name)
+        except Exception as e:
+            logger.error(f"ERROR(ImageRenditionAPIView):---->> {e}")
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    type=ErrorType.ERROR,
+                    message="An server side error occurred while processing your request",
+                    client=ResponseClient.DEVELOPER,
+                    description={"error": str(e)},
+                ).model_dump(),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        if is_rejected:
+            return self.get_not_found_response()
+        return HttpResponseRedirect(default_storage.url(name))
+
+    @staticmethod
+    def get_not_found_response() -> Response:
+        return Response(
+            ErrorResponse(
+                status=status.HTTP_404_NOT_FOUND,
+                type=ErrorType.WARNING,
+                message="Given Content not found",
+                client=ResponseClient.DEVELOPER,
+                description={
+                    "sizes": sorted(settings.IMAGE_RENDITION_SIZES),
+                    "formats": list(get_rendition_formats()),
+                },
+            ).model_dump(),
+            status=status.HTTP_404_NOT_FOUND,
+        )
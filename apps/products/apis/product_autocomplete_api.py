@@ -0,0 +1,136 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import never_cache
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
+from loguru import logger
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.dataclass.response_dataclass import (
+    ErrorResponse,
+    ErrorType,
+    ResponseClient,
+    SuccessResponse,
+)
+from apps.common.documentation.documentation import (
+    ParameterAPIDocumentation,
+    ResponseAPIDocumentation,
+)
+from apps.common.functions.valid_query_params import get_valid_query_params
+from apps.products.services.product_autocomplete_service import (
+    AutocompleteTypeChoices,
+    product_autocomplete_index,
+)
+
+PRODUCT_AUTOCOMPLETE_DEFAULT_LIMIT = 10
+PRODUCT_AUTOCOMPLETE_MAX_LIMIT = 50
+AUTOCOMPLETE_TYPES = [choice.value for choice in AutocompleteTypeChoices]
+
+
+# * <<-------------------------------------*** Product Autocomplete API ***-------------------------------------->>
+# Answered from memory, a page cache entry per keystroke would only add a round trip
+@method_decorator(never_cache, name="dispatch")
+class ProductAutocompleteAPIView(APIView):
+    """
+    Typeahead suggestions for product and generic names served from an in-memory prefix index.
+    """
+
+    @extend_schema(
+        tags=["Product"],
+        summary="Product typeahead",
+        description="Active product and generic names starting with the query, or with a word of it.",
+        parameters=[
+            OpenApiParameter(
+                name="query",
+                type=str,
+                required=True,
+                description="The typed prefix",
+                examples=[OpenApiExample("Query Example", value="nap")],
+            ),
+            OpenApiParameter(
+                name="type",
+                type=str,
+                enum=AUTOCOMPLETE_TYPES,
+                description="Suggest products or generic names only",
+                examples=[OpenApiExample("Type Example", value="product")],
+            ),
+            ParameterAPIDocumentation.get_limit_parameter(),
+        ],
+        examples=[
+            ResponseAPIDocumentation.get_200_response(
+                message="Suggestions fetched successfully",
+                example={"id": 1, "type": "product", "name": "Napa Extra"},
+            ),
+            ResponseAPIDocumentation.get_400_response(),
+            ResponseAPIDocumentation.get_500_response(),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        query_params = request.query_params
+        valid_params = get_valid_query_params(
+            "list", set(query_params.keys()), extended_fields=["type"]
+        )
+        if not valid_params["is_valid"]:
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="Invalid query parameters",
+                    client=ResponseClient.DEVELOPER,
+                    description={
+                        "allowed_params": sorted(valid_params["allowed_params"]),
+                        "invalid_params": valid_params["invalid_params"],
+                    },
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        query = query_params.get("query", "")
+        item_type = query_params.get("type")
+        limit = query_params.get("limit", str(PRODUCT_AUTOCOMPLETE_DEFAULT_LIMIT))
+        if (
+            not limit.isdigit()
+            or int(limit) < 1
+            or (item_type and item_type not in AUTOCOMPLETE_TYPES)
+        ):
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="Invalid limit or type",
+                    client=ResponseClient.DEVELOPER,
+                    description={
+                        "limit": limit,
+                        "type": AUTOCOMPLETE_TYPES,
+                    },
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            suggestions = product_autocomplete_index.search(
+                query, min(int(limit), PRODUCT_AUTOCOMPLETE_MAX_LIMIT), item_type
+            )
+        except Exception as e:
+            logger.error(f"ERROR(ProductAutocompleteAPIView):---->> {e}")
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    type=ErrorType.ERROR,
+                    message="An server side error occurred while processing your request",
+                    client=ResponseClient.DEVELOPER,
+                    description={"error": str(e)},
+                ).model_dump(),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(
+            SuccessResponse(
+                status=status.HTTP_200_OK,
+                message="Suggestions fetched successfully",
+                client=ResponseClient.USER,
+                data=suggestions,
+                links={},
+            ).model_dump(),
+            status=status.HTTP_200_OK,
+        )
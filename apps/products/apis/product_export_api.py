@@ -0,0 +1,99 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import never_cache
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.dataclass.response_dataclass import (
+    ErrorResponse,
+    ErrorType,
+    ResponseClient,
+)
+from apps.common.documentation.documentation import ResponseAPIDocumentation
+from apps.common.functions.valid_query_params import get_valid_query_params
+from apps.products.services.product_export_service import (
+    PRODUCT_EXPORT_FORMATS,
+    ProductExportService,
+    get_export_content_type,
+    get_export_file_name,
+)
+
+
+# * <<-------------------------------------*** Product Export API ***-------------------------------------->>
+# A streamed catalog dump must never be buffered into the page cache
+@method_decorator(never_cache, name="dispatch")
+class ProductExportAPIView(APIView):
+    """
+    Streams the full catalog for marketplace feeds without loading it into memory.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["Product"],
+        summary="Export the catalog",
+        description="Products with brand, manufacturer, VAT, unit, sub-categories, tags, SEO and medicine info.",
+        parameters=[
+            OpenApiParameter(
+                # "format" is taken by DRF's renderer negotiation
+                name="file_format",
+                type=str,
+                enum=list(PRODUCT_EXPORT_FORMATS),
+                description="Export file format, csv by default",
+                examples=[OpenApiExample("Format Example", value="jsonl")],
+            ),
+            OpenApiParameter(
+                name="compress",
+                type=str,
+                enum=["gzip"],
+                description="Gzip compress the export",
+                examples=[OpenApiExample("Compress Example", value="gzip")],
+            ),
+        ],
+        responses={(200, "text/csv"): bytes, (200, "application/x-ndjson"): bytes},
+        examples=[ResponseAPIDocumentation.get_400_response()],
+    )
+    def get(self, request, *args, **kwargs):
+        query_params = request.query_params
+        valid_params = get_valid_query_params(
+            "details",
+            set(query_params.keys()),
+            extended_fields=["file_format", "compress"],
+        )
+        file_format = query_params.get("file_format", "csv")
+        compress = query_params.get("compress")
+        if (
+            not valid_params["is_valid"]
+            or file_format not in PRODUCT_EXPORT_FORMATS
+            or compress not in (None, "gzip")
+        ):
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="Invalid query parameters",
+                    client=ResponseClient.DEVELOPER,
+                    description={
+                        "allowed_params": sorted(valid_params["allowed_params"]),
+                        "file_format": list(PRODUCT_EXPORT_FORMATS),
+                        "compress": ["gzip"],
+                    },
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        service = ProductExportService(file_format=file_format, compress=bool(compress))
+        # Under ASGI only an async iterator is streamed without buffering it first
+        is_asgi = isinstance(request._request, ASGIRequest)
+        response = StreamingHttpResponse(
+            service.astream() if is_asgi else service.stream(),
+            content_type=get_export_content_type(file_format, bool(compress)),
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{get_export_file_name(file_format, bool(compress))}"'
+        )
+        return response
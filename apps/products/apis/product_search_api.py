@@ -0,0 +1,132 @@
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
+from loguru import logger
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.dataclass.response_dataclass import (
+    ErrorResponse,
+    ErrorType,
+    ResponseClient,
+    SuccessResponse,
+)
+from apps.common.documentation.documentation import (
+    ParameterAPIDocumentation,
+    ResponseAPIDocumentation,
+)
+from apps.common.functions.valid_query_params import get_valid_query_params
+from apps.products.models import Product
+from apps.products.serializers.product_serializer import ProductSerializer
+from apps.products.services.product_search_service import search_products
+
+PRODUCT_SEARCH_DEFAULT_LIMIT = 20
+PRODUCT_SEARCH_MAX_LIMIT = 100
+
+
+# * <<-------------------------------------*** Product Search API ***-------------------------------------->>
+class ProductSearchAPIView(APIView):
+    """
+    Ranked full-text search over product names, keywords, generic names,
+    brands and descriptions.
+    """
+
+    @extend_schema(
+        tags=["Product"],
+        summary="Search products",
+        description="Relevance ranked, typo tolerant product search.",
+        parameters=[
+            OpenApiParameter(
+                name="query",
+                type=str,
+                required=True,
+                description="Search text, matched against name, keywords, generic names, brand and description",
+                examples=[OpenApiExample("Query Example", value="napa extra")],
+            ),
+            ParameterAPIDocumentation.get_limit_parameter(),
+            ParameterAPIDocumentation.get_field_list_parameter(
+                fields_list="id,product_name,brand_name,sales_price",
+                example_value="id,product_name,brand_name",
+            ),
+        ],
+        examples=[
+            ResponseAPIDocumentation.get_200_response(
+                message="Products fetched successfully",
+                example={
+                    "id": 1,
+                    "product_name": "Napa Extra",
+                    "brand_name": "Beximco",
+                },
+            ),
+            ResponseAPIDocumentation.get_400_response(),
+            ResponseAPIDocumentation.get_500_response(),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        query_params = request.query_params
+        valid_params = get_valid_query_params("list", set(query_params.keys()))
+        if not valid_params["is_valid"]:
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="Invalid query parameters",
+                    client=ResponseClient.DEVELOPER,
+                    description={
+                        "allowed_params": sorted(valid_params["allowed_params"]),
+                        "invalid_params": valid_params["invalid_params"],
+                    },
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        query = query_params.get("query", "").strip()
+        limit = query_params.get("limit", str(PRODUCT_SEARCH_DEFAULT_LIMIT))
+        if not query or not limit.isdigit() or int(limit) < 1:
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    type=ErrorType.WARNING,
+                    message="A search query and a positive limit are required",
+                    client=ResponseClient.DEVELOPER,
+                    description={"query": query, "limit": limit},
+                ).model_dump(),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fields = query_params.get("field_list")
+        try:
+            results = search_products(
+                query, min(int(limit), PRODUCT_SEARCH_MAX_LIMIT), active_only=True
+            )
+            rank_by_id = dict(results)
+
+            # A product deactivated since the search is left out as well
+            products = sorted(
+                Product.objects.for_listing(fields).active().filter(id__in=rank_by_id),
+                key=lambda product: rank_by_id[product.pk],
+                reverse=True,
+            )
+            data = ProductSerializer(products, many=True, fields=fields).data
+        except Exception as e:
+            logger.error(f"ERROR(ProductSearchAPIView):---->> {e}")
+            return Response(
+                ErrorResponse(
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    type=ErrorType.ERROR,
+                    message="An server side error occurred while processing your request",
+                    client=ResponseClient.DEVELOPER,
+                    description={"error": str(e)},
+                ).model_dump(),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(
+            SuccessResponse(
+                status=status.HTTP_200_OK,
+                message="Products fetched successfully",
+                client=ResponseClient.USER,
+                data=data,
+                links={},
+            ).model_dump(),
+            status=status.HTTP_200_OK,
+        )
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class ProductsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.products"
+
+    def ready(self):
+        # Register the signal receivers
+        from apps.products.signals import (  # noqa: F401
+            category_tree_signal,
+            image_rendition_signal,
+            product_autocomplete_signal,
+            product_search_signal,
+        )
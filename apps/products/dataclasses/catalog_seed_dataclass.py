@@ -0,0 +1,24 @@
+# * PYDANTIC IMPORTS
+from pydantic import (
+    BaseModel,
+    Field,
+    computed_field,
+)
+
+
+# * <<-------------------------------------*** Catalog Seed Summary Model ***--------------------------------->>
+class CatalogSeedSummary(BaseModel):
+    seed: int = Field(..., description="The random seed the catalog was generated from")
+    rows: dict[str, int] = Field(
+        default_factory=dict, description="Rows written per table"
+    )
+    elapsed_seconds: float = Field(
+        default=0.0, description="Wall clock time of the seeding"
+    )
+
+    @computed_field
+    @property
+    def products_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return round(self.rows.get("product", 0) / self.elapsed_seconds, 2)
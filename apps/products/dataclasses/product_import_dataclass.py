@@ -0,0 +1,102 @@
+# * PYDANTIC IMPORTS
+from decimal import Decimal
+
+from pydantic import (
+    BaseModel,
+    Field,
+    computed_field,
+    field_validator,
+)
+
+from apps.common.models import ActiveStatusChoices
+from apps.products.models.product_model import (
+    ProductBarcodeChoices,
+    ProductTypeChoices,
+)
+
+
+# * <<-------------------------------------*** Product Import Row Data Model ***--------------------------------->>
+class ProductImportRowModel(BaseModel):
+    """
+    One row of a product import file (CSV column or JSONL key per field).
+    """
+
+    product_name: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="The product name, i.e. Napa 500",
+    )
+    product_type: ProductTypeChoices = Field(
+        default=ProductTypeChoices.GENERAL,
+        description="The product type, i.e. medicine",
+    )
+    image_alt_name: str | None = Field(
+        default=None,
+        max_length=255,
+        description="The product image alt name, defaults to the product name",
+    )
+    barcode_type: ProductBarcodeChoices = Field(
+        default=ProductBarcodeChoices.MANUAL,
+        description="The barcode type, manual or auto",
+    )
+    barcode: str | None = Field(
+        default=None, max_length=255, description="The product barcode"
+    )
+    purchase_vat: Decimal | None = Field(
+        default=None, description="The purchase VAT amount"
+    )
+    sales_vat: Decimal | None = Field(default=None, description="The sales VAT amount")
+    unit_value: str | None = Field(default=None, description="The unit value, i.e. 500")
+    unit_attribute: str | None = Field(
+        default=None, description="The unit attribute name, i.e. mg"
+    )
+    brand: str | None = Field(default=None, description="The brand name")
+    manufacturer: str | None = Field(default=None, description="The manufacturer name")
+    sub_categories: list[str] = Field(
+        default_factory=list,
+        description="The sub-category names, '|' separated in CSV files",
+    )
+    description: str | None = Field(default=None, description="The product description")
+    active_status: ActiveStatusChoices = Field(
+        default=ActiveStatusChoices.ACTIVE,
+        description="The product is active or inactive",
+    )
+
+    @field_validator("sub_categories", mode="before")
+    @classmethod
+    def split_sub_categories(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [name.strip() for name in value.split("|") if name.strip()]
+        return value
+
+
+# * <<-------------------------------------*** Product Import Row Error Model ***--------------------------------->>
+class ProductImportRowError(BaseModel):
+    line_number: int = Field(..., description="The line of the import file")
+    errors: list[str] = Field(..., description="Why the row was rejected")
+
+
+# * <<-------------------------------------*** Product Import Summary Model ***--------------------------------->>
+class ProductImportSummary(BaseModel):
+    total_rows: int = Field(default=0, description="Rows read from the import file")
+    imported_rows: int = Field(default=0, description="Rows written to the database")
+    failed_rows: int = Field(
+        default=0, description="Rows rejected by validation or the database"
+    )
+    elapsed_seconds: float = Field(
+        default=0.0, description="Wall clock time of the import"
+    )
+    dry_run: bool = Field(
+        default=False, description="Rows were validated but not written"
+    )
+    errors: list[ProductImportRowError] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def rows_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return round(self.total_rows / self.elapsed_seconds, 2)
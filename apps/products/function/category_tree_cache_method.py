@@ -0,0 +1,99 @@
+import json
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from loguru import logger
+from rest_framework import status
+
+from apps.common.dataclass.response_dataclass import ResponseClient, SuccessResponse
+from apps.common.routers.replica_router import use_primary
+from apps.products.function.category_tree_method import get_category_tree
+
+CATEGORY_TREE_VERSION_KEY = "products:category_tree:version"
+CATEGORY_TREE_BLOB_KEY = "products:category_tree:blob:{variant}"
+
+
+def get_category_tree_blob_key(client_usable_only: bool) -> str:
+    return CATEGORY_TREE_BLOB_KEY.format(
+        variant="client" if client_usable_only else "all"
+    )
+
+
+def get_rendered_category_tree(client_usable_only: bool = False) -> bytes:
+    """
+    Renders the active category tree response envelope as compact JSON.
+    """
+    response = SuccessResponse(
+        status=status.HTTP_200_OK,
+        message="Category tree fetched successfully",
+        client=ResponseClient.USER,
+        data=get_category_tree(active_only=True, client_usable_only=client_usable_only),
+        links={},
+    )
+    return json.dumps(response.model_dump(mode="json"), separators=(",", ":")).encode()
+
+
+def set_category_tree_cache_version() -> str:
+    """
+    Invalidates every cached category tree by storing a new version token.
+
+    A random token instead of a counter, so an evicted version key can never
+    make an old blob look current again.
+    """
+    version = uuid4().hex
+    cache.set(CATEGORY_TREE_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def get_cached_category_tree(client_usable_only: bool = False) -> bytes:
+    """
+    Returns the pre-rendered active category tree response.
+
+    A warm cache costs one ``get_many`` round trip and no database query. The
+    blob is stored together with the version it was built from; after an
+    invalidation only the worker that wins the ``cache.add`` lock rebuilds it
+    while the others keep serving the stale blob.
+
+    Args:
+        client_usable_only (bool): Only client usable categories and sub-categories.
+
+    Returns:
+        bytes: The JSON encoded ``SuccessResponse`` envelope.
+    """
+    blob_key = get_category_tree_blob_key(client_usable_only)
+    cached = cache.get_many([CATEGORY_TREE_VERSION_KEY, blob_key])
+    version = cached.get(CATEGORY_TREE_VERSION_KEY)
+    stored = cached.get(blob_key)
+
+    if version and stored and stored[0] == version:
+        return stored[1]
+
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(CATEGORY_TREE_VERSION_KEY, version, timeout=None):
+            version = cache.get(CATEGORY_TREE_VERSION_KEY) or version
+
+    lock_key = f"{blob_key}:lock"
+    if not cache.add(
+        lock_key, version, timeout=settings.CATEGORY_TREE_REBUILD_LOCK_TIMEOUT
+    ):
+        # Another worker is rebuilding, a stale tree is better than a query stampede
+        if stored:
+            return stored[1]
+        return get_rendered_category_tree(client_usable_only)
+
+    try:
+        # Stored under the new version, a lagging replica could still hold the old tree
+        with use_primary():
+            blob = get_rendered_category_tree(client_usable_only)
+        cache.set(
+            blob_key,
+            (version, blob),
+            timeout=settings.CATEGORY_TREE_CACHE_TIMEOUT,
+        )
+    finally:
+        cache.delete(lock_key)
+
+    logger.info(f"INFO(get_cached_category_tree):---->> rebuilt {blob_key}")
+    return blob
@@ -0,0 +1,254 @@
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
+
+CATEGORY_TREE_SEPARATOR = "/"
+CATEGORY_PATH_PREFIX = "c"
+SUB_CATEGORY_PATH_PREFIX = "s"
+
+
+def get_tree_models():
+    # Resolved lazily, the category models import this module
+    return (
+        apps.get_model("products", "Category"),
+        apps.get_model("products", "SubCategory"),
+    )
+
+
+def get_parent_tree_path(tree_path: str) -> str:
+    """
+    Returns the path of the parent node, i.e. "c1/s4/" for "c1/s4/s9/".
+    """
+    segments = tree_path.rstrip(CATEGORY_TREE_SEPARATOR).split(CATEGORY_TREE_SEPARATOR)
+    if len(segments) <= 1:
+        return ""
+    return CATEGORY_TREE_SEPARATOR.join(segments[:-1]) + CATEGORY_TREE_SEPARATOR
+
+
+def get_category_parent_tree_path(parent_id: int) -> str | None:
+    """
+    Returns the tree path of a parent category, or None if it does not exist.
+    """
+    Category, _ = get_tree_models()
+    return (
+        Category.objects.filter(id=parent_id)
+        .values_list("tree_path", flat=True)
+        .first()
+    )
+
+
+def get_sub_category_parent_tree_path(parent_id: int) -> tuple[str, int] | None:
+    """
+    Returns the tree path and category id of a parent sub-category, or None if it does not exist.
+    """
+    _, SubCategory = get_tree_models()
+    return (
+        SubCategory.objects.filter(id=parent_id)
+        .values_list("tree_path", "category_id")
+        .first()
+    )
+
+
+def get_node_tree_path(instance) -> str:
+    """
+    Computes the materialized path of a saved category or sub-category.
+
+    Categories chain ``c<id>/`` segments through ``parent_id``. A sub-category
+    appends ``s<id>/`` to its parent sub-category path, or to its category
+    path when it has no parent.
+    """
+    Category, _ = get_tree_models()
+
+    if isinstance(instance, Category):
+        parent_path = ""
+        if instance.parent_id:
+            parent_path = get_category_parent_tree_path(instance.parent_id) or ""
+        return (
+            f"{parent_path}{CATEGORY_PATH_PREFIX}{instance.id}{CATEGORY_TREE_SEPARATOR}"
+        )
+
+    parent_path = ""
+    if instance.parent_id:
+        parent = get_sub_category_parent_tree_path(instance.parent_id)
+        parent_path = parent[0] if parent else ""
+    if not parent_path:
+        parent_path = get_category_parent_tree_path(instance.category_id) or ""
+    return (
+        f"{parent_path}{SUB_CATEGORY_PATH_PREFIX}{instance.id}{CATEGORY_TREE_SEPARATOR}"
+    )
+
+
+def get_tree_depth(tree_path: str) -> int:
+    return max(tree_path.count(CATEGORY_TREE_SEPARATOR) - 1, 0)
+
+
+def set_descendant_tree_paths(old_path: str, new_path: str) -> None:
+    """
+    Moves every node below ``old_path`` under ``new_path``.
+
+    One UPDATE per table rewrites the path prefix in the database, so moving a
+    node never loads its subtree into Python.
+    """
+    if not old_path or old_path == new_path:
+        return
+
+    # Not get_tree_depth(), which clamps the depth of the empty root path to 0
+    depth_delta = new_path.count(CATEGORY_TREE_SEPARATOR) - old_path.count(
+        CATEGORY_TREE_SEPARATOR
+    )
+    for model_class in get_tree_models():
+        model_class.objects.filter(tree_path__startswith=old_path).exclude(
+            tree_path=old_path
+        ).update(
+            tree_path=Concat(Value(new_path), Substr("tree_path", len(old_path) + 1)),
+            tree_depth=F("tree_depth") + depth_delta,
+        )
+
+
+def set_category_tree_path(instance) -> None:
+    """
+    Stores the tree path of a saved node and rewrites the paths of its descendants.
+    """
+    old_path = instance.tree_path
+    new_path = get_node_tree_path(instance)
+    if old_path == new_path:
+        return
+
+    instance.__class__.objects.filter(id=instance.id).update(
+        tree_path=new_path,
+        tree_depth=get_tree_depth(new_path),
+    )
+    set_descendant_tree_paths(old_path, new_path)
+
+    # Sub-categories below a moved sub-category follow it into its category
+    _, SubCategory = get_tree_models()
+    if isinstance(instance, SubCategory) and old_path:
+        SubCategory.objects.filter(tree_path__startswith=new_path).exclude(
+            category_id=instance.category_id
+        ).update(category_id=instance.category_id)
+
+    instance.tree_path = new_path
+    instance.tree_depth = get_tree_depth(new_path)
+
+
+def set_stored_tree_path(instance) -> None:
+    """
+    Loads the stored tree path of a node, locking its row until the transaction ends.
+
+    The in-memory value is stale whenever an ancestor moved after the instance
+    was loaded, and ``save()`` would otherwise write it back.
+    """
+    if instance.pk is None:
+        return
+
+    stored = (
+        instance.__class__.objects.select_for_update()
+        .filter(id=instance.pk)
+        .values_list("tree_path", "tree_depth")
+        .first()
+    )
+    if stored:
+        instance.tree_path, instance.tree_depth = stored
+
+
+def set_deleted_node_children(instance) -> None:
+    """
+    Re-parents the children of a node that is being deleted to the node's own parent.
+
+    Sub-categories of a deleted category are removed by the CASCADE, so only
+    child categories (and their sub-categories) or child sub-categories move up.
+    """
+    set_stored_tree_path(instance)
+    if not instance.tree_path:
+        return
+
+    # The in-memory parent may be stale or an unsaved edit, the children follow the stored one
+    stored_parent_id = (
+        instance.__class__.objects.filter(id=instance.pk)
+        .values_list("parent_id", flat=True)
+        .first()
+    )
+    instance.__class__.objects.filter(parent_id=instance.id).update(
+        parent_id=stored_parent_id or 0
+    )
+    set_descendant_tree_paths(
+        instance.tree_path, get_parent_tree_path(instance.tree_path)
+    )
+
+
+def get_category_tree(
+    active_only: bool = True,
+    client_usable_only: bool = False,
+) -> list[dict]:
+    """
+    Returns the nested category -> sub-category tree built from one UNION query.
+
+    Args:
+        active_only (bool): Skip inactive categories and sub-categories.
+        client_usable_only (bool): Skip nodes that are not client usable.
+
+    Returns:
+        list[dict]: Root categories, each with nested ``children``.
+    """
+    Category, SubCategory = get_tree_models()
+
+    categories, sub_categories = Category.objects.all(), SubCategory.objects.all()
+    if active_only:
+        categories, sub_categories = categories.active(), sub_categories.active()
+    if client_usable_only:
+        categories = categories.filter(is_client_usable=True)
+        sub_categories = sub_categories.filter(is_client_usable=True)
+
+    categories = categories.order_by().values_list(
+        "id",
+        "category_name",
+        "tree_path",
+        "tree_depth",
+        "is_client_usable",
+        "category_icon",
+    )
+    sub_categories = sub_categories.order_by().values_list(
+        "id",
+        "sub_category_name",
+        "tree_path",
+        "tree_depth",
+        "is_client_usable",
+        "sub_category_icon",
+    )
+
+    rows = sorted(
+        categories.union(sub_categories, all=True),
+        key=lambda row: (row[3], row[1].lower()),
+    )
+
+    tree: list[dict] = []
+    nodes: dict[str, dict] = {}
+    for node_id, name, tree_path, _, is_client_usable, icon in rows:
+        if not tree_path:
+            continue
+
+        parent_path = get_parent_tree_path(tree_path)
+        node = {
+            "id": node_id,
+            "type": (
+                "sub_category"
+                if tree_path[len(parent_path) :].startswith(SUB_CATEGORY_PATH_PREFIX)
+                else "category"
+            ),
+            "name": name,
+            "icon": default_storage.url(icon) if icon else None,
+            "is_client_usable": is_client_usable,
+            "children": [],
+        }
+
+        if not parent_path:
+            tree.append(node)
+        elif parent_path in nodes:
+            nodes[parent_path]["children"].append(node)
+        else:
+            # The parent was filtered out, so is the whole branch
+            continue
+        nodes[tree_path] = node
+
+    return tree
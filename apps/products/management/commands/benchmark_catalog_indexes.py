@@ -0,0 +1,192 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Index
+
+from apps.common.models import ActiveStatusChoices
+from apps.products.models import (
+    Category,
+    Product,
+    ProductImageGallery,
+    SubCategory,
+)
+from apps.products.models.product_model import ProductTypeChoices
+
+# The indexes of these tables before products.0015, besides the constraint ones
+LEGACY_INDEXES = {
+    Product: [
+        Index(fields=["id"], name="product_id_a3d46d_idx"),
+        Index(fields=["product_id"], name="product_product_a470af_idx"),
+        Index(fields=["product_type"], name="product_product_f634b9_idx"),
+        Index(fields=["barcode"], name="product_barcode_d2887e_idx"),
+        Index(fields=["brand"], name="product_brand_i_080bb1_idx"),
+        Index(fields=["manufacturer"], name="product_manufac_766aee_idx"),
+        Index(fields=["active_status"], name="product_active__f101c0_idx"),
+    ],
+    ProductImageGallery: [
+        Index(fields=["id"], name="product_ima_id_0a74a4_idx"),
+        Index(fields=["product_id"], name="product_ima_product_e5be17_idx"),
+        Index(fields=["active_status"], name="product_ima_active__2dca36_idx"),
+    ],
+    SubCategory: [
+        Index(fields=["id"], name="sub_categor_id_650cec_idx"),
+        Index(fields=["sub_category_name"], name="sub_categor_sub_cat_4dd523_idx"),
+        Index(fields=["is_client_usable"], name="sub_categor_is_clie_86acc2_idx"),
+        Index(fields=["active_status"], name="sub_categor_active__f6abd7_idx"),
+    ],
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+# * <<-------------------------------------*** Benchmark Catalog Indexes Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = (
+        "Compare the legacy and the current catalog index sets: insert throughput "
+        "and the query plans of the catalog list queries. Everything runs in a "
+        "transaction that is rolled back, nothing is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=5000,
+            help="Products inserted per index set, with one gallery image each",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows per INSERT",
+        )
+
+    def handle(self, *args, **options):
+        if options["products"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--products and --batch-size must be positive integers")
+        if not connection.features.can_rollback_ddl:
+            # An interrupted run must never leave the live schema on the legacy indexes
+            raise CommandError(
+                f"The index swap cannot be rolled back on {connection.vendor}, "
+                "run the benchmark on PostgreSQL or SQLite"
+            )
+
+        results = {
+            "legacy": self.run_benchmark(
+                "legacy", options, self.get_legacy_index_sql()
+            ),
+            "current": self.run_benchmark("current", options),
+        }
+
+        legacy, current = results["legacy"], results["current"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Insert throughput: legacy {legacy:,.0f} rows/s, current {current:,.0f} rows/s "
+                f"({(current / legacy - 1) * 100:+.1f}%)"
+            )
+        )
+
+    def get_legacy_index_sql(self) -> list[str]:
+        """
+        Returns the statements replacing the current indexes with the legacy ones.
+
+        Only collected here, they run inside the benchmark transaction, where
+        a schema editor refuses to open on SQLite.
+        """
+        with connection.schema_editor(collect_sql=True) as editor:
+            for model_class, legacy_indexes in LEGACY_INDEXES.items():
+                for index in model_class._meta.indexes:
+                    editor.remove_index(model_class, index)
+                for index in legacy_indexes:
+                    editor.add_index(model_class, index)
+        return editor.collected_sql
+
+    def run_benchmark(
+        self, index_set: str, options, index_sql: list[str] | None = None
+    ) -> float:
+        try:
+            # The benchmark rows and the index swap are never kept, even if the run is killed
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    for statement in index_sql or []:
+                        cursor.execute(statement)
+                category = Category.objects.bulk_create(
+                    [Category(category_name="Index Benchmark")]
+                )[0]
+                rows_per_second = self.benchmark(
+                    index_set, category, options["products"], options["batch_size"]
+                )
+                raise Rollback
+        except Rollback:
+            return rows_per_second
+
+    def benchmark(
+        self, index_set: str, category, products: int, batch_size: int
+    ) -> float:
+        product_types = list(ProductTypeChoices.values)
+        product_rows = [
+            Product(
+                product_id=f"IDXBENCH{index:09d}",
+                product_name=f"Index Benchmark {index}",
+                product_type=product_types[index % len(product_types)],
+                barcode=f"IDXBENCH{index:09d}",
+                image_alt_name="",
+                # One in ten inactive, like a catalog with retired products
+                active_status=(
+                    ActiveStatusChoices.INACTIVE
+                    if index % 10 == 0
+                    else ActiveStatusChoices.ACTIVE
+                ),
+            )
+            for index in range(products)
+        ]
+        started_at = time.perf_counter()
+        Product.objects.bulk_create(product_rows, batch_size=batch_size)
+        gallery_rows = [
+            ProductImageGallery(
+                product=product,
+                product_image="product/index-benchmark.jpg",
+                active_status=product.active_status,
+            )
+            for product in Product.objects.filter(
+                product_id__startswith="IDXBENCH"
+            ).only("id", "active_status")
+        ]
+        ProductImageGallery.objects.bulk_create(gallery_rows, batch_size=batch_size)
+        elapsed = time.perf_counter() - started_at
+        SubCategory.objects.bulk_create(
+            [
+                SubCategory(category=category, sub_category_name=f"Index Benchmark {i}")
+                for i in range(50)
+            ]
+        )
+
+        # Fresh statistics, the planner must see the benchmark rows
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        product = gallery_rows[-1].product
+        queries = {
+            "Active products of a type": Product.objects.active()
+            .filter(product_type=ProductTypeChoices.MEDICINE)
+            .order_by("-id")[:20],
+            "Active products": Product.objects.active().order_by("-id")[:20],
+            "Active sub-categories of a category": SubCategory.objects.active()
+            .filter(category=category)
+            .order_by("-id"),
+            "Active gallery images of a product": ProductImageGallery.objects.active()
+            .filter(product=product)
+            .order_by("-id"),
+        }
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{index_set} index set"))
+        rows = len(product_rows) + len(gallery_rows)
+        self.stdout.write(f"Inserted {rows} rows in {elapsed:.3f}s")
+        for label, queryset in queries.items():
+            self.stdout.write(f"{label}:")
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f"    {line}")
+        return rows / elapsed
@@ -0,0 +1,84 @@
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.services.product_export_service import (
+    PRODUCT_EXPORT_CHUNK_SIZE,
+    PRODUCT_EXPORT_FORMATS,
+    ProductExportService,
+)
+
+
+# * <<-------------------------------------*** Export Catalog Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = "Stream the full product catalog to a CSV or JSONL file, optionally gzip compressed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output",
+            help="Path of the export file, '-' writes to stdout",
+        )
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=PRODUCT_EXPORT_FORMATS,
+            default=None,
+            help="File format, detected from the file suffix by default",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Gzip compress the output, implied by a .gz suffix",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=PRODUCT_EXPORT_CHUNK_SIZE,
+            help="Products read, prefetched and written per chunk",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer")
+
+        output = options["output"]
+        suffixes = [suffix.lstrip(".").lower() for suffix in Path(output).suffixes]
+        compress = options["gzip"] or (suffixes[-1:] == ["gz"])
+        file_format = options["file_format"] or next(
+            (suffix for suffix in suffixes if suffix in PRODUCT_EXPORT_FORMATS), "csv"
+        )
+
+        try:
+            service = ProductExportService(
+                file_format=file_format,
+                compress=compress,
+                chunk_size=options["chunk_size"],
+            )
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+
+        started_at = time.perf_counter()
+        written = 0
+        if output == "-":
+            for data in service.stream():
+                sys.stdout.buffer.write(data)
+                written += len(data)
+            sys.stdout.buffer.flush()
+            return
+
+        try:
+            with open(output, "wb") as export_file:
+                for data in service.stream():
+                    export_file.write(data)
+                    written += len(data)
+        except OSError as error:
+            raise CommandError(str(error)) from error
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported the catalog to {output} ({written} bytes) "
+                f"in {time.perf_counter() - started_at:.1f}s"
+            )
+        )
@@ -0,0 +1,65 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from apps.common.functions.background_job import get_task_path
+from apps.common.models import BackgroundJob, BackgroundJobStatusChoices
+from apps.products.services.image_rendition_service import (
+    process_instance_images,
+    process_stored_image,
+)
+
+
+# * <<-------------------------------------*** Generate Image Renditions Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = "Validate and render the uploaded images that have no renditions yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Render again the images that already have renditions, and retry the failed rendition endpoint jobs",
+        )
+
+    def handle(self, *args, **options):
+        processed = failed = 0
+        for model_class in apps.get_models():
+            field_names = getattr(model_class, "rendition_image_fields", ())
+            if not field_names:
+                continue
+
+            has_image = Q()
+            for field_name in field_names:
+                has_image |= Q(**{f"{field_name}__gt": ""})
+            for pk in (
+                model_class._base_manager.filter(has_image)
+                .values_list("pk", flat=True)
+                .iterator()
+            ):
+                try:
+                    process_instance_images(
+                        model_class._meta.label, pk, force=options["force"]
+                    )
+                    processed += 1
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{model_class._meta.label} {pk}: {e}")
+
+        if options["force"]:
+            # The rendition endpoint never queues an image whose job failed again
+            failed_jobs = BackgroundJob.objects.filter(
+                task=get_task_path(process_stored_image),
+                status=BackgroundJobStatusChoices.FAILED,
+            )
+            for job_id, payload in failed_jobs.values_list("id", "payload").iterator():
+                try:
+                    process_stored_image(**payload)
+                    BackgroundJob.objects.filter(id=job_id).delete()
+                    processed += 1
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{payload['name']}: {e}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Processed {processed} records, {failed} failed")
+        )
@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.services.product_import_service import (
+    PRODUCT_IMPORT_CHUNK_SIZE,
+    PRODUCT_IMPORT_FORMATS,
+    ProductImportService,
+)
+
+
+# * <<-------------------------------------*** Import Products Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = "Stream a CSV or JSONL product catalog into the database using bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("file_path", help="Path to the CSV or JSONL import file")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=PRODUCT_IMPORT_FORMATS,
+            default=None,
+            help="File format, detected from the file suffix by default",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=PRODUCT_IMPORT_CHUNK_SIZE,
+            help="Rows validated and written per chunk",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without writing to the database",
+        )
+        parser.add_argument(
+            "--max-errors",
+            type=int,
+            default=20,
+            help="Number of rejected rows to print",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer")
+
+        service = ProductImportService(
+            chunk_size=options["chunk_size"],
+            dry_run=options["dry_run"],
+        )
+        try:
+            summary = service.import_file(options["file_path"], options["file_format"])
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error)) from error
+
+        for row_error in summary.errors[: options["max_errors"]]:
+            self.stderr.write(
+                f"line {row_error.line_number}: {'; '.join(row_error.errors)}"
+            )
+
+        action = "Validated" if summary.dry_run else "Imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {summary.imported_rows} of {summary.total_rows} rows "
+                f"({summary.failed_rows} rejected) in {summary.elapsed_seconds:.2f}s, "
+                f"{summary.rows_per_second} rows/sec"
+            )
+        )
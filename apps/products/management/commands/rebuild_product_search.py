@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.models import Product, ProductSearchDocument
+from apps.products.services.product_search_service import (
+    PRODUCT_SEARCH_BATCH_SIZE,
+    set_product_search_documents,
+)
+
+
+# * <<-------------------------------------*** Rebuild Product Search Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = "Rebuild the product search documents from the catalog."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PRODUCT_SEARCH_BATCH_SIZE,
+            help="Products rebuilt per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+
+        # Documents of products removed outside the ORM
+        deleted, _ = ProductSearchDocument.objects.exclude(
+            product_id__in=Product.objects.values("id")
+        ).delete()
+
+        written = 0
+        batch: list[int] = []
+        for product_id in (
+            Product.objects.order_by("id")
+            .values_list("id", flat=True)
+            .iterator(chunk_size=batch_size)
+        ):
+            batch.append(product_id)
+            if len(batch) == batch_size:
+                written += set_product_search_documents(batch)
+                batch = []
+        if batch:
+            written += set_product_search_documents(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {written} product search documents, removed {deleted} stale"
+            )
+        )
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.services.catalog_seed_service import (
+    CATALOG_SEED_CHUNK_SIZE,
+    CatalogSeedService,
+)
+
+
+# * <<-------------------------------------*** Seed Catalog Command ***-------------------------------------->>
+class Command(BaseCommand):
+    help = (
+        "Fill the database with a deterministic synthetic catalog for load and scale "
+        "testing, using bulk inserts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=10_000,
+            help="Products to generate, the reference tables are sized from it",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed, the same seed always generates the same catalog",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CATALOG_SEED_CHUNK_SIZE,
+            help="Products written per transaction",
+        )
+        parser.add_argument(
+            "--no-images",
+            action="store_true",
+            help="Skip the placeholder product and gallery images",
+        )
+        parser.add_argument(
+            "--no-search-index",
+            action="store_true",
+            help="Skip the search documents, rebuild_product_search can write them later",
+        )
+
+    def handle(self, *args, **options):
+        if options["products"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--products and --chunk-size must be positive integers")
+
+        service = CatalogSeedService(
+            products=options["products"],
+            seed=options["seed"],
+            chunk_size=options["chunk_size"],
+            with_images=not options["no_images"],
+            with_search_index=not options["no_search_index"],
+        )
+        try:
+            summary = service.seed_catalog()
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+
+        for table, count in summary.rows.items():
+            self.stdout.write(f"{table:<36}{count:>12,}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {summary.rows.get('product', 0):,} products with seed {summary.seed} "
+                f"in {summary.elapsed_seconds:.2f}s, {summary.products_per_second} products/sec"
+            )
+        )
@@ -0,0 +1,56 @@
+from apps.common.functions.queryset_projection import get_projected_queryset
+from apps.common.models import ActiveQuerySet
+
+
+# * <<-------------------------------------*** Product QuerySet ***-------------------------------------->>
+class ProductQuerySet(ActiveQuerySet):
+    """
+    QuerySet for the Product model.
+    """
+
+    def under_category_node(self, node):
+        """
+        Returns the products linked to any sub-category below a category tree node.
+
+        The sub-category lookup is a prefix match on the indexed ``tree_path``
+        joined to the product/sub-category through table, so the whole subtree
+        is resolved in a single query whatever its depth.
+
+        Args:
+            node (Category | SubCategory | str): A tree node or its ``tree_path``.
+        """
+        tree_path = node if isinstance(node, str) else node.tree_path
+        if not tree_path:
+            return self.none()
+
+        through_model = self.model.sub_category.through
+        return self.filter(
+            id__in=through_model.objects.filter(
+                subcategory__tree_path__startswith=tree_path
+            ).values("product_id")
+        )
+
+    def for_listing(self, fields=None, serializer_class=None):
+        """
+        Loads exactly the columns, joins and prefetches a product listing renders.
+
+        Forward relations read through dotted serializer sources are joined
+        with ``select_related`` and to-many relations (sub-categories, search
+        keywords) are prefetched, so a page costs the same number of queries
+        whatever its size.
+
+        Args:
+            fields (str | list[str] | None): The ``field_list``; every serializer field if None.
+            serializer_class: The serializer rendering the rows, ``ProductSerializer`` by default.
+        """
+        if serializer_class is None:
+            # Imported here, the serializer module imports the Product model
+            from apps.products.serializers.product_serializer import (
+                ProductSerializer,
+            )
+
+            serializer_class = ProductSerializer
+
+        return get_projected_queryset(
+            self, fields or list(serializer_class().fields), serializer_class
+        )
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:39
+
+from django.db import migrations, models
+
+
+def set_tree_paths(apps, schema_editor):
+    Category = apps.get_model("products", "Category")
+    SubCategory = apps.get_model("products", "SubCategory")
+
+    def get_path(node_id, parents, segment, root_path, seen=()):
+        # Missing or cyclic parents become roots
+        parent_id = parents[node_id][0]
+        path = f"{segment}{node_id}/"
+        if parent_id in parents and parent_id != node_id and parent_id not in seen:
+            return (
+                get_path(parent_id, parents, segment, root_path, (*seen, node_id))
+                + path
+            )
+        return root_path(node_id) + path
+
+    categories = {
+        category_id: (parent_id,)
+        for category_id, parent_id in Category.objects.values_list("id", "parent_id")
+    }
+    category_paths = {
+        category_id: get_path(category_id, categories, "c", lambda _: "")
+        for category_id in categories
+    }
+
+    sub_categories = {
+        sub_category_id: (parent_id, category_id)
+        for sub_category_id, parent_id, category_id in SubCategory.objects.values_list(
+            "id", "parent_id", "category_id"
+        )
+    }
+    # A parent sub-category from another category is ignored
+    sub_categories = {
+        sub_category_id: (
+            (
+                parent_id
+                if parent_id in sub_categories
+                and sub_categories[parent_id][1] == category_id
+                else 0
+            ),
+            category_id,
+        )
+        for sub_category_id, (parent_id, category_id) in sub_categories.items()
+    }
+    sub_category_paths = {
+        sub_category_id: get_path(
+            sub_category_id,
+            sub_categories,
+            "s",
+            lambda node_id: category_paths.get(sub_categories[node_id][1], ""),
+        )
+        for sub_category_id in sub_categories
+    }
+
+    for model_class, paths in (
+        (Category, category_paths),
+        (SubCategory, sub_category_paths),
+    ):
+        nodes = [
+            model_class(id=node_id, tree_path=path, tree_depth=path.count("/") - 1)
+            for node_id, path in paths.items()
+        ]
+        model_class.objects.bulk_update(
+            nodes, ["tree_path", "tree_depth"], batch_size=500
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0010_productvariation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="tree_depth",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="tree_path",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="subcategory",
+            name="tree_depth",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="subcategory",
+            name="tree_path",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.RunPython(set_tree_paths, migrations.RunPython.noop),
+    ]
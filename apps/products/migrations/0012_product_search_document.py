@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+POSTGRES_FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    ALTER TABLE product_search_document
+    ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name_text, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(keyword_text, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(brand_text, '')), 'C')
+        || setweight(to_tsvector('english', coalesce(body_text, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX product_search_document_vector_gin "
+    "ON product_search_document USING gin (search_vector)",
+    "CREATE INDEX product_search_document_name_trgm "
+    "ON product_search_document USING gin (name_text gin_trgm_ops)",
+]
+
+POSTGRES_REVERSE_SQL = [
+    "DROP INDEX IF EXISTS product_search_document_name_trgm",
+    "DROP INDEX IF EXISTS product_search_document_vector_gin",
+    "ALTER TABLE product_search_document DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_postgres_sql(statements):
+    # The full-text column and indexes only exist on PostgreSQL
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0011_category_tree_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductSearchDocument",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="products.product",
+                    ),
+                ),
+                ("name_text", models.TextField(blank=True, default="")),
+                ("keyword_text", models.TextField(blank=True, default="")),
+                ("brand_text", models.TextField(blank=True, default="")),
+                ("body_text", models.TextField(blank=True, default="")),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Product Search Document",
+                "verbose_name_plural": "Product Search Document",
+                "db_table": "product_search_document",
+                "ordering": ["-product_id"],
+            },
+        ),
+        migrations.RunPython(
+            run_postgres_sql(POSTGRES_FORWARD_SQL),
+            run_postgres_sql(POSTGRES_REVERSE_SQL),
+        ),
+    ]
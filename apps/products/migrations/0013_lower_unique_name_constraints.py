@@ -0,0 +1,160 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:55
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+# (model, name field, scope fields) of every case-insensitive constraint added below
+LOWER_UNIQUE_FIELDS = [
+    ("brand", "brand_name", ()),
+    ("category", "category_name", ()),
+    ("manufacturer", "manufacturer_name", ()),
+    ("manufacturerproductcategory", "product_category", ()),
+    ("productseo", "seo_title", ()),
+    ("productvariation", "variation_name", ("product",)),
+    ("subcategory", "sub_category_name", ()),
+    ("unitattribute", "attribute_name", ()),
+    ("variationattribute", "attribute_name", ()),
+    ("variationattributevalue", "attribute_value", ("variation_attribute",)),
+]
+
+
+def check_case_insensitive_duplicates(apps, schema_editor):
+    """
+    Refuses to add the constraints while rows differ only by case, listing them to merge or rename first.
+    """
+    db_alias = schema_editor.connection.alias
+    duplicates = []
+    for model_name, field_name, scope in LOWER_UNIQUE_FIELDS:
+        model = apps.get_model("products", model_name)
+        # NULLs never collide in a unique index
+        rows = model._base_manager.using(db_alias).exclude(
+            **{f"{name}__isnull": True for name in (field_name, *scope)}
+        )
+        groups = (
+            rows.annotate(lower_name=Lower(field_name))
+            .order_by()
+            .values("lower_name", *scope)
+            .annotate(row_count=Count("pk"))
+            .filter(row_count__gt=1)
+        )
+        for group in groups:
+            group.pop("row_count")
+            lower_name = group.pop("lower_name")
+            names = (
+                rows.annotate(lower_name=Lower(field_name))
+                .filter(lower_name=lower_name, **group)
+                .order_by("pk")
+                .values_list("pk", field_name)
+            )
+            duplicates.append(
+                f"{model._meta.db_table}.{field_name}: "
+                + ", ".join(f"{name!r} (id {pk})" for pk, name in names)
+            )
+
+    if duplicates:
+        raise RuntimeError(
+            "Names differing only by case must be merged or renamed before "
+            "the case-insensitive unique constraints are added:\n"
+            + "\n".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0012_product_search_document"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_insensitive_duplicates, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="brand",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("brand_name"),
+                name="unique_lower_brand_name",
+                violation_error_message="A brand with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="category",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("category_name"),
+                name="unique_lower_category_name",
+                violation_error_message="A category with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="manufacturer",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("manufacturer_name"),
+                name="unique_lower_manufacturer_name",
+                violation_error_message="A manufacturer with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="manufacturerproductcategory",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("product_category"),
+                name="unique_lower_manufacturer_product_category",
+                violation_error_message="A product category with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productseo",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("seo_title"),
+                name="unique_lower_seo_title",
+                violation_error_message="A seo with this title already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productvariation",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("variation_name"),
+                models.F("product"),
+                name="unique_lower_product_variation_name",
+                violation_error_message="A variation with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="subcategory",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("sub_category_name"),
+                name="unique_lower_sub_category_name",
+                violation_error_message="A sub-category with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="unitattribute",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("attribute_name"),
+                name="unique_lower_unit_attribute_name",
+                violation_error_message="An attribute with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="variationattribute",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("attribute_name"),
+                name="unique_lower_variation_attribute_name",
+                violation_error_message="An attribute with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="variationattributevalue",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("attribute_value"),
+                models.F("variation_attribute"),
+                name="unique_lower_variation_attribute_value",
+                violation_error_message="A value with this name already exists for the selected variation attribute.",
+            ),
+        ),
+    ]
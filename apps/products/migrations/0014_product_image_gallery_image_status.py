@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0013_lower_unique_name_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productimagegallery",
+            name="image_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("ready", "Ready"),
+                    ("rejected", "Rejected"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,168 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0014_product_image_gallery_image_status"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="brand",
+            name="brand_id_2f0614_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="brand",
+            name="brand_brand_n_0502cf_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="category",
+            name="category_id_db0083_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="category",
+            name="category_categor_d484be_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="manufacturer",
+            name="manufacture_id_6771ee_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="manufacturer",
+            name="manufacture_manufac_01b007_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="manufacturerproductcategory",
+            name="manufacture_id_67cdfc_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="manufacturerproductcategory",
+            name="manufacture_product_6a95ca_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_id_a3d46d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_product_a470af_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_product_f634b9_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_barcode_d2887e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_brand_i_080bb1_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_manufac_766aee_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="product",
+            name="product_active__f101c0_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productimagegallery",
+            name="product_ima_id_0a74a4_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productimagegallery",
+            name="product_ima_product_e5be17_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productseo",
+            name="product_seo_id_5bca72_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productseo",
+            name="product_seo_product_4929a9_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productvariation",
+            name="product_var_id_7b812b_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productvariation",
+            name="product_var_variati_73abca_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="subcategory",
+            name="sub_categor_id_650cec_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="subcategory",
+            name="sub_categor_sub_cat_4dd523_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="unitattribute",
+            name="unit_attrib_id_7f300d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="unitattribute",
+            name="unit_attrib_attribu_dfc910_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="unitattributevalue",
+            name="unit_attrib_id_501de3_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="variationattribute",
+            name="variation_a_id_7031d0_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="variationattribute",
+            name="variation_a_attribu_20c83e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="variationattributevalue",
+            name="variation_a_id_cbaa77_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="vat",
+            name="vat_id_3a9f01_idx",
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["active_status", "product_type", "-id"],
+                name="product_status_type_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="product_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productimagegallery",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["product", "-id"],
+                name="gallery_active_product_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subcategory",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["category", "-id"],
+                name="sub_category_active_cat_idx",
+            ),
+        ),
+    ]
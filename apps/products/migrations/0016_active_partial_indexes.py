@@ -0,0 +1,189 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0015_query_driven_indexes"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="brand",
+            name="brand_active__c82066_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="category",
+            name="category_is_clie_3b0174_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="category",
+            name="category_active__543f22_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="manufacturer",
+            name="manufacture_active__8d52f8_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="manufacturerproductcategory",
+            name="manufacture_active__7d52fe_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productimagegallery",
+            name="product_ima_active__2dca36_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productseo",
+            name="product_seo_active__e5ca15_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="productvariation",
+            name="product_var_active__58ca87_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="subcategory",
+            name="sub_categor_is_clie_86acc2_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="subcategory",
+            name="sub_categor_active__f6abd7_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="unitattribute",
+            name="unit_attrib_active__db0e49_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="unitattributevalue",
+            name="unit_attrib_active__5002cf_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="variationattribute",
+            name="variation_a_active__62449b_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="variationattributevalue",
+            name="variation_a_active__25e4e7_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="vat",
+            name="vat_active__594cb8_idx",
+        ),
+        migrations.AddIndex(
+            model_name="brand",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="brand_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["is_client_usable"],
+                name="category_active_client_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="category_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manufacturer",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="manufacturer_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="manufacturerproductcategory",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="mfr_category_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productseo",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="product_seo_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productvariation",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="variation_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subcategory",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["is_client_usable"],
+                name="sub_category_active_client_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subcategory",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="sub_category_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="unitattribute",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="unit_attribute_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="unitattributevalue",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="unit_value_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="variationattribute",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="variation_attr_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="variationattributevalue",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="variation_value_active_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vat",
+            index=models.Index(
+                condition=models.Q(("active_status", "active")),
+                fields=["-id"],
+                name="vat_active_id_idx",
+            ),
+        ),
+    ]
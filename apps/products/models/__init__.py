@@ -6,6 +6,7 @@ from apps.products.models.manufacturer_model import (
     ManufacturerProductCategory,
 )
 from apps.products.models.product_model import Product
+from apps.products.models.product_search_model import ProductSearchDocument
 from apps.products.models.product_seo_model import ProductSeo
 from apps.products.models.sub_category_model import SubCategory
 from apps.products.models.unit_model import (
@@ -29,6 +30,7 @@ __all__ = [
     "ManufacturerProductCategory",
     "Vat",
     "Product",
+    "ProductSearchDocument",
     "ProductImageGallery",
     "ProductSeo",
     "VariationAttribute",
@@ -5,17 +5,20 @@ from django.db.models import (
     ImageField,
     Index,
     TextField,
+    UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.functions.validator.name_validator import validate_special_character
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
+    ImageStatusChoices,
 )
 
 
@@ -30,48 +33,47 @@ class Brand(DjangoBaseModel):
         max_length=100, default="Bangladesh", blank=True, null=True
     )
     brand_logo = ImageField(upload_to="product/brands", blank=True, null=True)
-    contact_number = PhoneNumberField(blank=True, null=True)
-    brand_email = EmailField(max_length=255, blank=True, null=True)
-    active_status = CharField(
+    image_status = CharField(
         max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
+        choices=ImageStatusChoices.choices,
+        default=ImageStatusChoices.PENDING,
     )
+    contact_number = PhoneNumberField(blank=True, null=True)
+    brand_email = EmailField(max_length=255, blank=True, null=True)
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("brand_name",)
+    image_extension_fields = {"brand_logo": {".jpg", ".jpeg", ".png", ".webp"}}
+    rendition_image_fields = ("brand_logo",)
+
     class Meta:
         verbose_name = "Brand"
         verbose_name_plural = "Brand"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["brand_name"]),
             Index(fields=["origin_country"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="brand_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "brand"
+        constraints = [
+            UniqueConstraint(
+                Lower("brand_name"),
+                name="unique_lower_brand_name",
+                violation_error_message=_("A brand with this name already exists."),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure brand_name is unique.
-        Raises a ValidationError if a brand with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_brand_name constraint.
         """
-        # Check if a brand with the same name already exists
-        if (
-            self.__class__.objects.filter(brand_name__iexact=self.brand_name)
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _(
-                    "A brand with this name already exists.",
-                )
-            )
-
         # Check any special character exist in the brand name
         if self.brand_name:
             validate_special_character(
@@ -84,14 +86,8 @@ class Brand(DjangoBaseModel):
                 )
             )
 
-        # Ensure brand_logo is a valid image file
-        if self.brand_logo:
-            get_validate_image_extensions(
-                images=[
-                    self.brand_logo,
-                ],
-                valid_extensions={".jpg", ".jpeg", ".png", ".webp"},
-            )
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
 
         super().clean()  # Call the parent's clean method
 
@@ -100,9 +96,11 @@ class Brand(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     # Return a string representation of the model instance
     def __str__(self):
@@ -1,21 +1,31 @@
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import (
     BooleanField,
     CharField,
     ImageField,
     Index,
     PositiveIntegerField,
+    PositiveSmallIntegerField,
     TextField,
+    UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.functions.validator.name_validator import validate_special_character
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
+    ImageStatusChoices,
+)
+from apps.products.function.category_tree_method import (
+    get_category_parent_tree_path,
+    set_category_tree_path,
+    set_stored_tree_path,
 )
 
 
@@ -27,46 +37,57 @@ class Category(DjangoBaseModel):
 
     category_name = CharField(max_length=255, unique=True)
     parent_id = PositiveIntegerField(default=0, blank=True)
+    # Materialized path of the node, i.e. "c1/c5/". Maintained on save and delete.
+    tree_path = CharField(
+        max_length=255, blank=True, default="", db_index=True, editable=False
+    )
+    tree_depth = PositiveSmallIntegerField(default=0, editable=False)
     is_client_usable = BooleanField(default=False, blank=True)
     category_icon = ImageField(upload_to="product/categories", blank=True, null=True)
-    active_status = CharField(
+    image_status = CharField(
         max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
+        choices=ImageStatusChoices.choices,
+        default=ImageStatusChoices.PENDING,
     )
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("category_name",)
+    image_extension_fields = {"category_icon": {".jpg", ".jpeg", ".png", ".webp"}}
+    rendition_image_fields = ("category_icon",)
+
     class Meta:
         verbose_name = "Category"
         verbose_name_plural = "Category"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["category_name"]),
-            Index(fields=["is_client_usable"]),
-            Index(fields=["active_status"]),
+            # The storefront category tree, active client usable categories
+            Index(
+                fields=["is_client_usable"],
+                condition=ACTIVE_CONDITION,
+                name="category_active_client_idx",
+            ),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="category_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "category"
+        constraints = [
+            UniqueConstraint(
+                Lower("category_name"),
+                name="unique_lower_category_name",
+                violation_error_message=_("A category with this name already exists."),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure category_name is unique.
-        Raises a ValidationError if a category with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_category_name constraint.
         """
-        # Check if a category with the same name already exists
-        if (
-            self.__class__.objects.filter(category_name__iexact=self.category_name)
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("A category with this name already exists."),
-            )
-
         # Check any special character exist in the category name
         if self.category_name:
             validate_special_character(
@@ -79,14 +100,22 @@ class Category(DjangoBaseModel):
                 )
             )
 
-        # Ensure category_icon is a valid image file
-        if self.category_icon:
-            get_validate_image_extensions(
-                images=[
-                    self.category_icon,
-                ],
-                valid_extensions={".jpg", ".jpeg", ".png", ".webp"},
-            )
+        # Ensure the parent exists and is not the category itself or one of its descendants
+        if self.parent_id:
+            parent_tree_path = get_category_parent_tree_path(self.parent_id)
+            if parent_tree_path is None:
+                raise ValidationError(
+                    _("Parent category does not exist."),
+                )
+            if self.parent_id == self.id or (
+                self.tree_path and parent_tree_path.startswith(self.tree_path)
+            ):
+                raise ValidationError(
+                    _("A category cannot be moved under itself or its descendants."),
+                )
+
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
 
         super().clean()  # Call the parent's clean method
 
@@ -95,9 +124,13 @@ class Category(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
-
-        return super().save(*args, **kwargs)
+        with transaction.atomic():
+            set_stored_tree_path(self)
+            # Uniqueness is checked by the database constraints, not by a query up front
+            self.full_clean(validate_unique=False, validate_constraints=False)
+            with unique_violation_as_validation_error(self):
+                super().save(*args, **kwargs)
+            set_category_tree_path(self)
 
     # Return a string representation of the model instance
     def __str__(self):
@@ -9,12 +9,10 @@ from django.db.models import (
 )
 from django.utils.translation import gettext_lazy as _
 
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
+    ImageStatusChoices,
 )
 from apps.products.models.product_model import Product
 
@@ -37,22 +35,27 @@ class ProductImageGallery(DjangoBaseModel):
     image_meta_tags = TextField(blank=True, null=True)
     image_meta_description = TextField(blank=True, null=True)
     image_seo_description = TextField(blank=True, null=True)
-    active_status = CharField(
+    # Set by the background job that validates and renders the upload
+    image_status = CharField(
         max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
+        choices=ImageStatusChoices.choices,
+        default=ImageStatusChoices.PENDING,
     )
 
+    image_extension_fields = {"product_image": {".jpg", ".png"}}
+    rendition_image_fields = ("product_image",)
+
     class Meta:
         verbose_name = "Product Image Gallery"
         verbose_name_plural = "Product Image Gallery"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["product_id"]),
-            Index(fields=["active_status"]),
+            # Active images of a product, newest first
+            Index(
+                fields=["product", "-id"],
+                condition=ACTIVE_CONDITION,
+                name="gallery_active_product_idx",
+            ),
         ]
         app_label = "products"
         db_table = "product_image_gallery"
@@ -67,11 +70,8 @@ class ProductImageGallery(DjangoBaseModel):
             raise ValidationError(
                 _("Product Image is required."),
             )
-        # Validate image extensions
-        if self.product_image:
-            get_validate_image_extensions(
-                self.product_image, allowed_extensions=[".jpg", ".png"]
-            )
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
         super().clean()  # Call the parent's clean method
 
     # Save the instance after cleaning up
@@ -7,16 +7,18 @@ from django.db.models import (
     ManyToManyField,
     TextChoices,
     TextField,
+    UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.functions.validator.name_validator import validate_special_character
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
 )
 
@@ -38,45 +40,39 @@ class ManufacturerProductCategory(DjangoBaseModel):
     """
 
     product_category = CharField(max_length=255, unique=True)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("product_category",)
+
     class Meta:
         verbose_name = "Manufacturer Product Category"
         verbose_name_plural = "Manufacturer Product Category"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["product_category"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="mfr_category_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "manufacturer_products_category"
+        constraints = [
+            UniqueConstraint(
+                Lower("product_category"),
+                name="unique_lower_manufacturer_product_category",
+                violation_error_message=_(
+                    "A product category with this name already exists."
+                ),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure product_category is unique.
-        Raises a ValidationError if a product category with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_manufacturer_product_category constraint.
         """
-        # Check if a product category with the same name already exists
-        if (
-            self.__class__.objects.filter(
-                product_category__iexact=self.product_category
-            )
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("A product category with this name already exists."),
-            )
-
         # Check any special character exist in the product_category name
         if self.product_category:
             validate_special_character(
@@ -95,9 +91,11 @@ class ManufacturerProductCategory(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     # Return a string representation of the model instance
     def __str__(self):
@@ -134,47 +132,42 @@ class Manufacturer(DjangoBaseModel):
         blank=True,
         null=True,
     )
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("manufacturer_name",)
+    image_extension_fields = {"manufacturer_logo": {".jpg", ".jpeg", ".png"}}
+
     class Meta:
         verbose_name = "Manufacturer"
         verbose_name_plural = "Manufacturer"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["manufacturer_name"]),
             Index(fields=["manufacturer_email"]),
             Index(fields=["manufacturer_phone"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="manufacturer_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "manufacturer"
+        constraints = [
+            UniqueConstraint(
+                Lower("manufacturer_name"),
+                name="unique_lower_manufacturer_name",
+                violation_error_message=_(
+                    "A manufacturer with this name already exists."
+                ),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure manufacturer_name is unique.
-        Raises a ValidationError if a manufacturer with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_manufacturer_name constraint.
         """
-        # Check if a manufacturer with the same name already exists
-        if (
-            Manufacturer.objects.filter(
-                manufacturer_name__iexact=self.manufacturer_name
-            )
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("A manufacturer with this name already exists."),
-            )
-
         # Check any special character exist in the manufacturer_name name
         if self.manufacturer_name:
             validate_special_character(
@@ -186,11 +179,8 @@ class Manufacturer(DjangoBaseModel):
                 _("Manufacturer name cannot be empty."),
             )
 
-        # Validate the manufacturer_logo field
-        if self.manufacturer_logo:
-            get_validate_image_extensions(
-                self.manufacturer_logo, allowed_extensions=["jpg", "jpeg", "png"]
-            )
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
 
         super().clean()  # Call the parent's clean method
 
@@ -199,9 +189,11 @@ class Manufacturer(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     # Return a string representation of the model instance
     def __str__(self):
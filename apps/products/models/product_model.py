@@ -18,17 +18,16 @@ from apps.common.functions.barcode_methods import (
 from apps.common.functions.custom_id import (
     get_generated_custom_id,
 )
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.functions.validator.name_validator import (
     validate_special_character,
 )
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
+    ImageStatusChoices,
 )
 from apps.products.function.url_slug_method import get_generated_slug
+from apps.products.managers.product_manager import ProductQuerySet
 from apps.products.models.brand_model import Brand
 from apps.products.models.manufacturer_model import Manufacturer
 from apps.products.models.sub_category_model import SubCategory
@@ -81,6 +80,11 @@ class Product(DjangoBaseModel):
         null=True,
     )
     product_image = ImageField(upload_to="product/", blank=True, null=True)
+    image_status = CharField(
+        max_length=10,
+        choices=ImageStatusChoices.choices,
+        default=ImageStatusChoices.PENDING,
+    )
     image_alt_name = CharField(max_length=255)
     barcode_type = CharField(
         max_length=10,
@@ -127,26 +131,30 @@ class Product(DjangoBaseModel):
     url_slug = CharField(max_length=255, blank=True, null=True)
     search_keyword = TaggableManager(blank=True, verbose_name="search_keyword")
     description = TextField(blank=True, null=True)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
+
+    objects = ProductQuerySet.as_manager()
+
+    special_character_fields = ("product_name",)
+    image_extension_fields = {"product_image": {".jpg", ".png"}}
+    rendition_image_fields = ("product_image",)
 
     class Meta:
         verbose_name = "Product"
         verbose_name_plural = "Product"
         ordering = ["-id"]
+        # The primary key, unique and foreign key columns are indexed by their constraints
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["product_id"]),
-            Index(fields=["product_type"]),
-            Index(fields=["barcode"]),
-            Index(fields=["brand"]),
-            Index(fields=["manufacturer"]),
-            Index(fields=["active_status"]),
+            # Product listings by status and type, newest first
+            Index(
+                fields=["active_status", "product_type", "-id"],
+                name="product_status_type_id_idx",
+            ),
+            # Active products newest first, the storefront default
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="product_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "product"
@@ -156,29 +164,23 @@ class Product(DjangoBaseModel):
         Custom validation to ensure product_name is unique.
         Raises a ValidationError if a product with the same name already exists.
         """
-        if self.__class__.objects.filter(product_name=self.product_name).exists():
+        if (
+            self.__class__.objects.filter(product_name=self.product_name)
+            .exclude(pk=self.pk)
+            .exists()
+        ):
             raise ValidationError(
                 _("Product name already exists."),
             )
 
-        if not self.product_id:
-            self.product_id = get_generated_custom_id(
-                id_prefix="PRO",
-                model_class=self.__class__,
-                field="product_id",
-            )
-
         # Validate product_name
         if self.product_name:
-            validate_special_character(self.product_name)
+            validate_special_character(self.product_name, field_name="product_name")
         else:
             raise ValidationError({_("Product name cannot be empty.")})
 
-        # Validate product_image
-        if self.product_image:
-            get_validate_image_extensions(
-                self.product_image, allowed_extensions=[".jpg", ".png"]
-            )
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
 
         # generate barcode
         if not self.barcode:
@@ -187,10 +189,15 @@ class Product(DjangoBaseModel):
                     self.barcode = get_generated_barcode(self.product_id)
 
         if not self.url_slug:
+            # Same slug the bulk import builds from the unit value and attribute name
             self.url_slug = get_generated_slug(
                 self.product_name,
-                self.product_unit,
-                self.product_unit.unit_attribute.attribute_name,
+                self.product_unit.unit_value if self.product_unit else None,
+                (
+                    self.product_unit.unit_attribute.attribute_name
+                    if self.product_unit
+                    else None
+                ),
             )
 
         super().clean()
@@ -200,6 +207,14 @@ class Product(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
+        # Generated before full_clean(), which rejects a blank product_id
+        if not self.product_id:
+            self.product_id = get_generated_custom_id(
+                id_prefix="PRO",
+                model_class=self.__class__,
+                field="product_id",
+            )
+
         self.full_clean()
 
         return super().save(*args, **kwargs)
@@ -0,0 +1,50 @@
+from django.db.models import (
+    CASCADE,
+    DateTimeField,
+    Model,
+    OneToOneField,
+    TextField,
+)
+
+from apps.products.models.product_model import Product
+
+
+# * <<-------------------------------------*** Product Search Document Table ***-------------------------------------->>
+class ProductSearchDocument(Model):
+    """
+    Denormalized, weighted search text of one product.
+
+    The columns follow the PostgreSQL weights: ``name_text`` (A),
+    ``keyword_text`` (B: search keywords, SEO keywords and generic names),
+    ``brand_text`` (C: brand and manufacturer) and ``body_text`` (D). On
+    PostgreSQL the migration adds a generated ``search_vector`` tsvector
+    column with a GIN index plus a trigram index on ``name_text``; the column
+    is not declared here so the model stays portable to SQLite.
+    """
+
+    product = OneToOneField(
+        Product,
+        on_delete=CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    name_text = TextField(blank=True, default="")
+    keyword_text = TextField(blank=True, default="")
+    brand_text = TextField(blank=True, default="")
+    body_text = TextField(blank=True, default="")
+    updated_at = DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Product Search Document"
+        verbose_name_plural = "Product Search Document"
+        ordering = ["-product_id"]
+        app_label = "products"
+        db_table = "product_search_document"
+
+    def __str__(self):
+        return f"{self.name_text}"
+
+    def __repr__(self):
+        return (
+            f"<ProductSearchDocument: {self.name_text}> <product_id: {self.product_id}"
+        )
@@ -1,19 +1,23 @@
-from django.core.exceptions import ValidationError
 from django.db.models import (
     CASCADE,
     CharField,
     Index,
     OneToOneField,
     TextField,
+    UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
 
 from apps.common.functions.validator.name_validator import (
     validate_special_character,
 )
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
 )
 from apps.products.models.product_model import Product
@@ -35,44 +39,38 @@ class ProductSeo(DjangoBaseModel):
     meta_tags = TextField(blank=True, null=True)
     meta_description = TextField(blank=True, null=True)
     seo_description = TextField(blank=True, null=True)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
+
+    special_character_fields = ("seo_title",)
 
     class Meta:
         verbose_name = "Product SEO"
         verbose_name_plural = "Product SEO"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["product_id"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="product_seo_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "product_seo"
+        constraints = [
+            UniqueConstraint(
+                Lower("seo_title"),
+                name="unique_lower_seo_title",
+                violation_error_message=_("A seo with this title already exists."),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure seo_title is unique.
-        Raises a ValidationError if a seo with the same seo_title already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_seo_title constraint.
         """
-        # Check if a seo with the same seo_title already exists
-        if (
-            self.__class__.objects.filter(seo_title__iexact=self.seo_title)
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("A seo with this title already exists."),
-            )
-
         # Validate special characters in seo_title
-        validate_special_character(self.seo_title)
+        validate_special_character(self.seo_title, field_name="seo_title")
 
         super().clean()  # Call the parent's clean method
 
@@ -81,9 +79,11 @@ class ProductSeo(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     # Return a string representation of the model instance
     def __str__(self):
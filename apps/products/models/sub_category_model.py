@@ -1,4 +1,5 @@
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import (
     CASCADE,
     BooleanField,
@@ -7,17 +8,26 @@ from django.db.models import (
     ImageField,
     Index,
     PositiveIntegerField,
+    PositiveSmallIntegerField,
     TextField,
+    UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.functions.validator.name_validator import validate_special_character
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
+    ImageStatusChoices,
+)
+from apps.products.function.category_tree_method import (
+    get_sub_category_parent_tree_path,
+    set_category_tree_path,
+    set_stored_tree_path,
 )
 from apps.products.models.category_model import Category
 
@@ -33,50 +43,67 @@ class SubCategory(DjangoBaseModel):
     )
     sub_category_name = CharField(max_length=255, unique=True)
     parent_id = PositiveIntegerField(default=0, blank=True)
+    # Materialized path below the category, i.e. "c1/s4/s9/". Maintained on save and delete.
+    tree_path = CharField(
+        max_length=255, blank=True, default="", db_index=True, editable=False
+    )
+    tree_depth = PositiveSmallIntegerField(default=0, editable=False)
     sub_category_icon = ImageField(
         upload_to="product/sub_categories", blank=True, null=True
     )
-    is_client_usable = BooleanField(default=False, blank=True)
-    active_status = CharField(
+    image_status = CharField(
         max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
+        choices=ImageStatusChoices.choices,
+        default=ImageStatusChoices.PENDING,
     )
+    is_client_usable = BooleanField(default=False, blank=True)
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("sub_category_name",)
+    image_extension_fields = {"sub_category_icon": {".jpg", ".jpeg", ".png", ".webp"}}
+    rendition_image_fields = ("sub_category_icon",)
+
     class Meta:
         verbose_name = "Sub-Category"
         verbose_name_plural = "Sub-Category"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["sub_category_name"]),
-            Index(fields=["is_client_usable"]),
-            Index(fields=["active_status"]),
+            # The storefront category tree, active client usable sub-categories
+            Index(
+                fields=["is_client_usable"],
+                condition=ACTIVE_CONDITION,
+                name="sub_category_active_client_idx",
+            ),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="sub_category_active_id_idx",
+            ),
+            # Active sub-categories of a category, newest first
+            Index(
+                fields=["category", "-id"],
+                condition=ACTIVE_CONDITION,
+                name="sub_category_active_cat_idx",
+            ),
         ]
         app_label = "products"
         db_table = "sub_category"
+        constraints = [
+            UniqueConstraint(
+                Lower("sub_category_name"),
+                name="unique_lower_sub_category_name",
+                violation_error_message=_(
+                    "A sub-category with this name already exists."
+                ),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure sub_category_name is unique.
-        Raises a ValidationError if a sub-category with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_sub_category_name constraint.
         """
-        # Check if a sub-category with the same name already exists
-        if (
-            self.__class__.objects.filter(
-                sub_category_name__iexact=self.sub_category_name
-            )
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("A sub-category with this name already exists."),
-            )
-
         # Check any special character exist in the sub-category name
         if self.sub_category_name:
             validate_special_character(
@@ -88,14 +115,29 @@ class SubCategory(DjangoBaseModel):
                 _("Sub-category name cannot be empty."),
             )
 
-        # Ensure sub_category_icon is a valid image file
-        if self.sub_category_icon:
-            get_validate_image_extensions(
-                images=[
-                    self.sub_category_icon,
-                ],
-                valid_extensions={".jpg", ".jpeg", ".png", ".webp"},
-            )
+        # Ensure the parent exists, belongs to the same category and is not a descendant
+        if self.parent_id:
+            parent = get_sub_category_parent_tree_path(self.parent_id)
+            if parent is None:
+                raise ValidationError(
+                    _("Parent sub-category does not exist."),
+                )
+            parent_tree_path, parent_category_id = parent
+            if parent_category_id != self.category_id:
+                raise ValidationError(
+                    _("Parent sub-category belongs to another category."),
+                )
+            if self.parent_id == self.id or (
+                self.tree_path and parent_tree_path.startswith(self.tree_path)
+            ):
+                raise ValidationError(
+                    _(
+                        "A sub-category cannot be moved under itself or its descendants."
+                    ),
+                )
+
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
 
         super().clean()  # Call the parent's clean method
 
@@ -104,9 +146,13 @@ class SubCategory(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
-
-        return super().save(*args, **kwargs)
+        with transaction.atomic():
+            set_stored_tree_path(self)
+            # Uniqueness is checked by the database constraints, not by a query up front
+            self.full_clean(validate_unique=False, validate_constraints=False)
+            with unique_violation_as_validation_error(self):
+                super().save(*args, **kwargs)
+            set_category_tree_path(self)
 
     # Return a string representation of the model instance
     def __str__(self):
@@ -7,11 +7,15 @@ from django.db.models import (
     TextField,
     UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.functions.validator.name_validator import validate_special_character
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
 )
 
@@ -23,43 +27,39 @@ class UnitAttribute(DjangoBaseModel):
     """
 
     attribute_name = CharField(max_length=255, unique=True)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("attribute_name",)
+
     class Meta:
         verbose_name = "Unit Attribute"
         verbose_name_plural = "Unit Attribute"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["attribute_name"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="unit_attribute_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "unit_attribute"
+        constraints = [
+            UniqueConstraint(
+                Lower("attribute_name"),
+                name="unique_lower_unit_attribute_name",
+                violation_error_message=_(
+                    "An attribute with this name already exists."
+                ),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure attribute_name is unique.
-        Raises a ValidationError if an attribute with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_unit_attribute_name constraint.
         """
-        # Check if an attribute with the same name already exists
-        if (
-            self.__class__.objects.filter(attribute_name__iexact=self.attribute_name)
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("An attribute with this name already exists."),
-            )
-
         # Check any special character exist in the attribute_name
         if self.attribute_name:
             validate_special_character(
@@ -76,9 +76,11 @@ class UnitAttribute(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     # Return a string representation of the model instance
     def __str__(self):
@@ -103,23 +105,21 @@ class UnitAttributeValue(DjangoBaseModel):
         UnitAttribute, on_delete=CASCADE, related_name="unit_attributes"
     )
     unit_value = CharField(max_length=255)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
     description = TextField(blank=True, null=True)
 
+    special_character_fields = ("unit_value",)
+
     class Meta:
         verbose_name = "Unit Attribute Value"
         verbose_name_plural = "Unit Attribute Value"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
             Index(fields=["unit_value"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="unit_value_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "unit_attribute_value"
@@ -2,18 +2,23 @@ from django.core.exceptions import ValidationError
 from django.db.models import (
     CASCADE,
     CharField,
+    F,
     ForeignKey,
     Index,
     TextField,
     UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.functions.validator.name_validator import (
     validate_special_character,
 )
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
 )
 
@@ -26,45 +31,42 @@ class VariationAttribute(DjangoBaseModel):
 
     attribute_name = CharField(max_length=255, unique=True)
     description = TextField(blank=True, null=True)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
+
+    special_character_fields = ("attribute_name",)
 
     class Meta:
         verbose_name = "Variation Attribute"
         verbose_name_plural = "Variation Attribute"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["attribute_name"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="variation_attr_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "variation_attribute"
+        constraints = [
+            UniqueConstraint(
+                Lower("attribute_name"),
+                name="unique_lower_variation_attribute_name",
+                violation_error_message=_(
+                    "An attribute with this name already exists."
+                ),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure attribute_name is unique.
-        Raises a ValidationError if an attribute with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_variation_attribute_name constraint.
         """
-        # Check if an attribute with the same name already exists
-        if (
-            self.__class__.objects.filter(attribute_name__iexact=self.attribute_name)
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("An attribute with this name already exists."),
-            )
         # Check any special character exist in the attribute_name
         if self.attribute_name:
             validate_special_character(
-                self.attribute_name
+                self.attribute_name, field_name="attribute_name"
             )  # Validate attribute_name for special characters
         else:
             raise ValidationError(
@@ -77,9 +79,11 @@ class VariationAttribute(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.attribute_name}"
@@ -104,26 +108,32 @@ class VariationAttributeValue(DjangoBaseModel):
     )
     attribute_value = CharField(max_length=255)
     description = TextField(blank=True, null=True)
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
+
+    special_character_fields = ("attribute_value",)
 
     class Meta:
         verbose_name = "Variation Attribute Value"
         verbose_name_plural = "Variation Attribute Values"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
             Index(fields=["attribute_value"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="variation_value_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "variation_attribute_value"
         constraints = [
+            UniqueConstraint(
+                Lower("attribute_value"),
+                F("variation_attribute"),
+                name="unique_lower_variation_attribute_value",
+                violation_error_message=_(
+                    "A value with this name already exists for the selected variation attribute."
+                ),
+            ),
             UniqueConstraint(
                 fields=["variation_attribute", "attribute_value"],
                 name="unique_attribute_value",
@@ -134,26 +144,12 @@ class VariationAttributeValue(DjangoBaseModel):
     def clean(self):
         """
         Custom validation to ensure attribute_value is unique for a given variation_attribute.
-        Raises a ValidationError if a value with the same name already exists for the same variation_attribute.
+        Case-insensitive duplicates are rejected on save by the unique_lower_variation_attribute_value constraint.
         """
-        # Check if a value with the same name already exists for the same variation_attribute
-        if (
-            self.__class__.objects.filter(
-                variation_attribute_id=self.variation_attribute_id,
-                attribute_value__iexact=self.attribute_value,
-            )
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _(
-                    "A value with this name already exists for the selected variation attribute."
-                ),
-            )
         # Check any special character exist in the attribute_value
         if self.attribute_value:
             validate_special_character(
-                self.attribute_value
+                self.attribute_value, field_name="attribute_value"
             )  # Validate attribute_value for special characters
         else:
             raise ValidationError(
@@ -166,9 +162,11 @@ class VariationAttributeValue(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.attribute_value}"
@@ -2,20 +2,24 @@ from django.core.exceptions import ValidationError
 from django.db.models import (
     CASCADE,
     CharField,
+    F,
     ForeignKey,
     ImageField,
     Index,
     ManyToManyField,
+    UniqueConstraint,
 )
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
-from apps.common.functions.validator.image_validator import (
-    get_validate_image_extensions,
-)
 from apps.common.functions.validator.name_validator import validate_special_character
+from apps.common.functions.validator.unique_validator import (
+    unique_violation_as_validation_error,
+)
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
+    ImageStatusChoices,
 )
 from apps.products.models.product_model import Product
 from apps.products.models.variation_attribute_model import VariationAttributeValue
@@ -33,45 +37,45 @@ class ProductVariation(DjangoBaseModel):
     )
     variation_name = CharField(max_length=255, unique=True, blank=True, null=True)
     variation_image = ImageField(upload_to="product/", blank=True, null=True)
-    image_alt_name = CharField(max_length=255, blank=True, null=True)
-    active_status = CharField(
+    image_status = CharField(
         max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
+        choices=ImageStatusChoices.choices,
+        default=ImageStatusChoices.PENDING,
     )
+    image_alt_name = CharField(max_length=255, blank=True, null=True)
+
+    special_character_fields = ("variation_name",)
+    image_extension_fields = {"variation_image": {".jpg", ".jpeg", ".png", ".webp"}}
+    rendition_image_fields = ("variation_image",)
 
     class Meta:
         verbose_name = "Product Variation"
         verbose_name_plural = "Product Variations"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
-            Index(fields=["variation_name"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="variation_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "product_variation"
+        constraints = [
+            UniqueConstraint(
+                Lower("variation_name"),
+                F("product"),
+                name="unique_lower_product_variation_name",
+                violation_error_message=_("A variation with this name already exists."),
+            ),
+        ]
 
     # Clean up the instance before saving
     def clean(self):
         """
         Custom validation to ensure variation_name is unique.
-        Raises a ValidationError if a variation with the same name already exists.
+        Case-insensitive duplicates are rejected on save by the unique_lower_product_variation_name constraint.
         """
-        # Check if a variation with the same name already exists
-        if (
-            self.__class__.objects.filter(
-                variation_name__iexact=self.variation_name, product_id=self.product_id
-            )
-            .exclude(id=self.id)
-            .exists()
-        ):
-            raise ValidationError(
-                _("A variation with this name already exists."),
-            )
-
         # Check any special character exist in the variation_name
         if self.variation_name:
             validate_special_character(
@@ -83,14 +87,8 @@ class ProductVariation(DjangoBaseModel):
                 _("Variation name cannot be empty."),
             )
 
-        # Ensure variation_image is a valid image file
-        if self.variation_image:
-            get_validate_image_extensions(
-                images=[
-                    self.variation_image,
-                ],
-                valid_extensions={".jpg", ".jpeg", ".png", ".webp"},
-            )
+        # Sniff the real format and size of a new upload from its header
+        self.validate_image_uploads()
 
         super().clean()  # Call the parent's clean method
 
@@ -99,9 +97,11 @@ class ProductVariation(DjangoBaseModel):
         """
         Call the clean method before saving the model instance.
         """
-        self.full_clean()
+        # Uniqueness is checked by the database constraints, not by a query up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
 
-        return super().save(*args, **kwargs)
+        with unique_violation_as_validation_error(self):
+            return super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.variation_name}"
@@ -12,7 +12,7 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.common.functions.validator.numaric_validator import min_decimal_value
 from apps.common.models import (
-    ActiveStatusChoices,
+    ACTIVE_CONDITION,
     DjangoBaseModel,
 )
 
@@ -49,13 +49,6 @@ class Vat(DjangoBaseModel):
         blank=True,
         null=True,
     )
-    active_status = CharField(
-        max_length=10,
-        choices=ActiveStatusChoices.choices,
-        default=ActiveStatusChoices.ACTIVE,
-        blank=True,
-        null=True,
-    )
     description = TextField(blank=True, null=True)
 
     class Meta:
@@ -63,9 +56,12 @@ class Vat(DjangoBaseModel):
         verbose_name_plural = "VAT"
         ordering = ["-id"]
         indexes = [
-            Index(fields=["id"]),
             Index(fields=["value_type"]),
-            Index(fields=["active_status"]),
+            Index(
+                fields=["-id"],
+                condition=ACTIVE_CONDITION,
+                name="vat_active_id_idx",
+            ),
         ]
         app_label = "products"
         db_table = "vat"
@@ -6,6 +6,7 @@ from apps.common.mixinclass.serializer_mixin import FilterFieldMixin
 
 # Import Models
 from apps.products.models.brand_model import Brand
+from apps.products.serializers.image_rendition_serializer import ImageRenditionField
 
 
 # * <<-------------------------------------*** Brand Serializer ***-------------------------------------->>
@@ -14,6 +15,8 @@ class BrandSerializer(FilterFieldMixin, ModelSerializer):
     Serializer for Brand model.
     """
 
+    brand_logo_renditions = ImageRenditionField(source="brand_logo")
+
     def __init__(self, *args, **kwargs):
         model_field = self.fields
         super().__init__(model_field, *args, **kwargs)
@@ -0,0 +1,18 @@
+from rest_framework.serializers import ReadOnlyField
+
+from apps.products.services.image_rendition_service import get_rendition_urls
+
+
+# * <<-------------------------------------*** Image Rendition Field ***-------------------------------------->>
+class ImageRenditionField(ReadOnlyField):
+    """
+    Read only ``{size: {format: url}}`` links to the downscaled WebP/AVIF copies of an image field.
+
+    Usage: ``product_image_renditions = ImageRenditionField(source="product_image")``
+    """
+
+    # Read from the instance next to the image, projected listings load it too
+    projection_fields = ("image_status",)
+
+    def to_representation(self, value):
+        return get_rendition_urls(value, self.context.get("request"))
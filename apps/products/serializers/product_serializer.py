@@ -0,0 +1,86 @@
+from rest_framework.serializers import (
+    CharField,
+    DecimalField,
+    ModelSerializer,
+)
+from taggit.serializers import TaggitSerializer, TagListSerializerField
+
+from apps.common.mixinclass.serializer_mixin import FilterFieldMixin
+
+# Import Models
+from apps.products.models.product_model import Product
+from apps.products.serializers.image_rendition_serializer import ImageRenditionField
+
+
+# * <<-------------------------------------*** Product Serializer ***-------------------------------------->>
+class ProductSerializer(TaggitSerializer, FilterFieldMixin, ModelSerializer):
+    """
+    Serializer for Product model.
+
+    The related display fields use dotted sources, so ``Product.objects.for_listing()``
+    can derive the exact joins a ``field_list`` needs.
+    """
+
+    purchase_vat_amount = DecimalField(
+        source="purchase_vat.vat_amount",
+        max_digits=19,
+        decimal_places=4,
+        read_only=True,
+    )
+    sales_vat_amount = DecimalField(
+        source="sales_vat.vat_amount",
+        max_digits=19,
+        decimal_places=4,
+        read_only=True,
+    )
+    unit_value = CharField(source="product_unit.unit_value", read_only=True)
+    unit_attribute_name = CharField(
+        source="product_unit.unit_attribute.attribute_name", read_only=True
+    )
+    brand_name = CharField(source="brand.brand_name", read_only=True)
+    manufacturer_name = CharField(
+        source="manufacturer.manufacturer_name", read_only=True
+    )
+    search_keyword = TagListSerializerField(required=False)
+    product_image_renditions = ImageRenditionField(source="product_image")
+
+    def __init__(self, *args, **kwargs):
+        model_field = self.fields
+        super().__init__(model_field, *args, **kwargs)
+
+    class Meta:
+        model = Product
+        fields = (
+            "id",
+            "product_id",
+            "product_name",
+            "sub_category",
+            "product_type",
+            "product_image",
+            "product_image_renditions",
+            "image_alt_name",
+            "barcode_type",
+            "barcode",
+            "purchase_vat",
+            "purchase_vat_amount",
+            "sales_vat",
+            "sales_vat_amount",
+            "product_unit",
+            "unit_value",
+            "unit_attribute_name",
+            "brand",
+            "brand_name",
+            "manufacturer",
+            "manufacturer_name",
+            "url_slug",
+            "search_keyword",
+            "description",
+            "active_status",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = (
+            "product_id",
+            "created_at",
+            "updated_at",
+        )
@@ -0,0 +1,1096 @@
+import io
+import math
+import random
+import time
+from collections import Counter
+from decimal import Decimal
+from itertools import accumulate
+from itertools import product as get_combinations
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.text import slugify
+from loguru import logger
+from PIL import Image
+from taggit.models import Tag, TaggedItem
+
+from apps.common.models import ActiveStatusChoices, ImageStatusChoices, MediaBlob
+from apps.common.storage.content_addressed_storage import ContentAddressedStorage
+from apps.products.dataclasses.catalog_seed_dataclass import CatalogSeedSummary
+from apps.products.function.category_tree_cache_method import (
+    set_category_tree_cache_version,
+)
+from apps.products.function.category_tree_method import (
+    CATEGORY_PATH_PREFIX,
+    CATEGORY_TREE_SEPARATOR,
+    SUB_CATEGORY_PATH_PREFIX,
+    get_tree_depth,
+)
+from apps.products.function.url_slug_method import get_generated_slug
+from apps.products.models import (
+    Brand,
+    Category,
+    Manufacturer,
+    ManufacturerProductCategory,
+    Product,
+    ProductImageGallery,
+    ProductSeo,
+    ProductVariation,
+    SubCategory,
+    UnitAttribute,
+    UnitAttributeValue,
+    VariationAttribute,
+    VariationAttributeValue,
+    Vat,
+)
+from apps.products.models.manufacturer_model import ManufacturerCategoryChoices
+from apps.products.models.product_model import (
+    ProductBarcodeChoices,
+    ProductTypeChoices,
+)
+from apps.products.models.vat_model import VatTypeChoices
+from apps.products.services.image_rendition_service import create_renditions
+from apps.products.services.product_autocomplete_service import (
+    set_autocomplete_cache_version,
+)
+from apps.products.services.product_search_service import (
+    set_product_search_documents,
+)
+
+CATALOG_SEED_CHUNK_SIZE = 5000
+# Seeded products are recognised by it, and never collide with the "PRO" custom IDs
+SEED_PRODUCT_ID_PREFIX = "SEED"
+
+# * <<-------------------------------------*** Catalog Vocabulary ***-------------------------------------->>
+TRADE_NAME_PREFIXES = (
+    "Ace", "Alge", "Amo", "Ato", "Bexi", "Cardi", "Cefu", "Clo", "Dexo", "Dolo",
+    "Esome", "Exi", "Feno", "Flu", "Gaba", "Gluco", "Hista", "Ibu", "Lora", "Losa",
+    "Maxi", "Meto", "Mona", "Napa", "Neo", "Ome", "Panto", "Rani", "Seclo", "Sergi",
+    "Tory", "Vita", "Xeno", "Zima",
+)  # fmt: skip
+TRADE_NAME_SUFFIXES = (
+    "", "cin", "dol", "fen", "lix", "max", "nil", "pro", "ril", "sol", "tac", "tin",
+    "vex", "zol",
+)  # fmt: skip
+BRAND_SUFFIXES = (
+    "Pharma", "Healthcare", "Laboratories", "Life Sciences", "Biotech", "Remedies",
+    "Medica", "Care", "Wellness", "Generics", "Therapeutics", "Labs",
+)  # fmt: skip
+MANUFACTURER_SUFFIXES = (
+    "Pharmaceuticals Ltd", "Laboratories Ltd", "Healthcare PLC", "Industries Ltd",
+    "Life Sciences Ltd",
+)  # fmt: skip
+ORIGIN_COUNTRIES = (
+    "Bangladesh", "India", "Germany", "United Kingdom", "United States",
+    "Switzerland", "Japan", "France",
+)  # fmt: skip
+MANUFACTURER_PRODUCT_CATEGORIES = (
+    "Tablets", "Capsules", "Liquids", "Injectables", "Topicals", "Ophthalmics",
+    "Inhalers", "Medical Devices", "Nutraceuticals", "Cosmetics",
+)  # fmt: skip
+VAT_RATES = (
+    (Decimal("0"), VatTypeChoices.PERCENTAGE),
+    (Decimal("5"), VatTypeChoices.PERCENTAGE),
+    (Decimal("7.5"), VatTypeChoices.PERCENTAGE),
+    (Decimal("10"), VatTypeChoices.PERCENTAGE),
+    (Decimal("15"), VatTypeChoices.PERCENTAGE),
+    (Decimal("2.5"), VatTypeChoices.FLAT_RATE),
+)
+VARIATION_ATTRIBUTES = {
+    "Pack Size": ("10s", "20s", "30s", "100s"),
+    "Flavour": ("Orange", "Mint", "Strawberry", "Unflavoured"),
+    "Size": ("Small", "Medium", "Large"),
+    "Color": ("White", "Blue", "Black"),
+}
+# Dosage form, unit and the strengths it comes in
+MEDICINE_FORMS = (
+    ("Tablet", "mg", ("5", "10", "20", "40", "50", "100", "250", "500")),
+    ("Capsule", "mg", ("10", "20", "40", "250", "500")),
+    ("Syrup", "ml", ("60", "100", "200")),
+    ("Suspension", "ml", ("60", "100")),
+    ("Injection", "mg", ("250", "500", "1000")),
+    ("Cream", "g", ("10", "25", "50")),
+    ("Eye Drops", "ml", ("5", "10")),
+    ("Inhaler", "mcg", ("50", "100", "200")),
+    ("Softgel", "IU", ("400", "1000", "5000")),
+)
+DEVICE_NAMES = (
+    "Blood Pressure Monitor", "Glucometer", "Digital Thermometer", "Nebulizer",
+    "Pulse Oximeter", "Test Strips", "Insulin Syringe", "Hot Water Bag",
+)  # fmt: skip
+GENERAL_PRODUCTS = (
+    ("Face Wash", "ml", ("50", "100")),
+    ("Body Lotion", "ml", ("100", "200", "500")),
+    ("Shampoo", "ml", ("100", "200", "500")),
+    ("Toothpaste", "g", ("50", "100")),
+    ("Baby Diapers", "pcs", ("10", "30", "100")),
+    ("Protein Powder", "g", ("250",)),
+    ("Multivitamin", "pcs", ("30", "100")),
+    ("Hand Sanitizer", "ml", ("30", "100", "500")),
+)
+OTHER_PRODUCTS = {
+    ProductTypeChoices.BOOK: ("Pharmacology Handbook", "First Aid Guide"),
+    ProductTypeChoices.SERVICE: ("Home Sample Collection", "Doctor Consultation"),
+    ProductTypeChoices.OTHER: ("Gift Card", "Health Checkup Package"),
+}
+PRODUCT_TYPE_WEIGHTS = {
+    ProductTypeChoices.MEDICINE: 55,
+    ProductTypeChoices.GENERAL: 30,
+    ProductTypeChoices.DEVICE: 12,
+    ProductTypeChoices.BOOK: 1,
+    ProductTypeChoices.SERVICE: 1,
+    ProductTypeChoices.OTHER: 1,
+}
+# Root category -> child category -> sub-category -> child sub-categories
+CATEGORY_TREE = {
+    "Medicine": {
+        "Prescription Medicine": {
+            "Antibiotics": ("Penicillins", "Cephalosporins", "Macrolides"),
+            "Cardiovascular": ("Antihypertensives", "Statins", "Anticoagulants"),
+            "Diabetes Care": ("Insulins", "Oral Antidiabetics"),
+        },
+        "OTC Medicine": {
+            "Pain Relief": ("Headache", "Muscle and Joint Pain", "Fever"),
+            "Cold and Flu": ("Cough Syrups", "Decongestants", "Antihistamines"),
+            "Digestive Health": ("Antacids", "Laxatives", "Oral Rehydration"),
+        },
+    },
+    "Personal Care": {
+        "Skin and Body": {
+            "Skin Care": ("Face Wash", "Moisturizers", "Sunscreens"),
+            "Body Care": ("Body Lotions", "Soaps", "Deodorants"),
+        },
+        "Hair and Oral Care": {
+            "Hair Care": ("Shampoos", "Conditioners", "Hair Oils"),
+            "Oral Care": ("Toothpastes", "Toothbrushes", "Mouthwashes"),
+        },
+    },
+    "Mother and Baby": {
+        "Baby Care": {
+            "Diapering": ("Diapers", "Wipes", "Rash Creams"),
+            "Baby Food": ("Infant Formula", "Cereals"),
+        },
+        "Maternity Care": {
+            "Pregnancy": ("Prenatal Vitamins", "Pregnancy Tests"),
+        },
+    },
+    "Medical Devices": {
+        "Monitoring Devices": {
+            "Diabetes Devices": ("Glucometers", "Test Strips", "Lancets"),
+            "Heart Health": ("Blood Pressure Monitors", "Pulse Oximeters"),
+        },
+        "Respiratory Care": {
+            "Respiratory Devices": ("Nebulizers", "Spacers"),
+        },
+    },
+    "Vitamins and Supplements": {
+        "Nutrition": {
+            "Vitamins": ("Multivitamins", "Vitamin D", "Vitamin C"),
+            "Protein": ("Whey Protein", "Plant Protein"),
+        },
+    },
+}
+ROOT_CATEGORY_PRODUCT_TYPES = {
+    "Medicine": ProductTypeChoices.MEDICINE,
+    "Personal Care": ProductTypeChoices.GENERAL,
+    "Mother and Baby": ProductTypeChoices.GENERAL,
+    "Medical Devices": ProductTypeChoices.DEVICE,
+    "Vitamins and Supplements": ProductTypeChoices.GENERAL,
+}
+TAG_NAMES = (
+    "pain", "fever", "headache", "antibiotic", "infection", "allergy", "cough",
+    "cold", "flu", "diabetes", "blood sugar", "heart", "blood pressure",
+    "cholesterol", "stomach", "acidity", "vitamin", "immunity", "skin", "hair",
+    "baby", "pregnancy", "protein", "fitness", "monitor", "device", "eye",
+    "asthma", "oral care", "hygiene", "bestseller", "new arrival", "prescription",
+    "otc", "imported", "local",
+)  # fmt: skip
+GENERIC_NAME_STEMS = (
+    "Paracetamol", "Ibuprofen", "Diclofenac", "Naproxen", "Aspirin", "Amoxicillin",
+    "Azithromycin", "Cefuroxime", "Ciprofloxacin", "Doxycycline", "Metronidazole",
+    "Omeprazole", "Esomeprazole", "Pantoprazole", "Ranitidine", "Domperidone",
+    "Metformin", "Gliclazide", "Sitagliptin", "Amlodipine", "Losartan",
+    "Atenolol", "Bisoprolol", "Atorvastatin", "Rosuvastatin", "Clopidogrel",
+    "Cetirizine", "Fexofenadine", "Loratadine", "Montelukast", "Salbutamol",
+    "Fluticasone", "Levothyroxine", "Prednisolone", "Calcium Carbonate",
+    "Cholecalciferol", "Folic Acid", "Ferrous Fumarate", "Zinc", "Ascorbic Acid",
+)  # fmt: skip
+GENERIC_NAME_SALTS = (
+    "", "Hydrochloride", "Sodium", "Potassium", "Sulfate", "Maleate", "Citrate",
+    "Phosphate",
+)  # fmt: skip
+DRUG_CATEGORIES = (
+    "Analgesic", "Antibiotic", "Antacid", "Antidiabetic", "Antihypertensive",
+    "Antihistamine", "Bronchodilator", "Supplement", "Corticosteroid",
+)  # fmt: skip
+DESCRIPTION_TEMPLATES = (
+    "{name} by {brand} is a trusted choice for everyday care.",
+    "{name} from {brand}. Store in a cool and dry place, away from children.",
+    "Original {name}, sourced directly from {brand} and quality checked.",
+)
+PLACEHOLDER_COLORS = (
+    (230, 57, 70), (241, 250, 238), (168, 218, 220), (69, 123, 157),
+    (29, 53, 87), (244, 162, 97), (42, 157, 143), (233, 196, 106),
+)  # fmt: skip
+# Under IMAGE_MIN_DIMENSIONS the rendition job would reject them
+PLACEHOLDER_SIZE = (100, 100)
+
+
+def get_unique_names(
+    rng: random.Random, count: int, parts: tuple[tuple[str, ...], ...], template: str
+) -> list[str]:
+    """
+    Returns ``count`` distinct names combining one word of each part, in random order.
+
+    Once every combination is used the names repeat with a series number,
+    i.e. "Napacin Pharma 2".
+    """
+    total = math.prod(len(part) for part in parts)
+    names = []
+    for index in rng.sample(range(total), min(count, total)):
+        words = []
+        for part in reversed(parts):
+            index, position = divmod(index, len(part))
+            words.append(part[position])
+        names.append(" ".join(template.format(*reversed(words)).split()))
+    for index in range(len(names), count):
+        names.append(f"{names[index % total]} {index // total + 1}")
+    return names
+
+
+def get_unit_values() -> dict[str, list[str]]:
+    """
+    Returns the unit values the generated product names use, by unit attribute.
+    """
+    unit_values: dict[str, list[str]] = {"pcs": ["1"]}
+    for _, unit, values in (*MEDICINE_FORMS, *GENERAL_PRODUCTS):
+        unit_values.setdefault(unit, [])
+        unit_values[unit].extend(
+            value for value in values if value not in unit_values[unit]
+        )
+    return unit_values
+
+
+def get_skewed_cum_weights(count: int) -> list[float]:
+    """
+    Returns ``random.choices()`` cumulative weights where the n-th item is picked 1/n as often as the first.
+
+    Real catalogs are dominated by a few large brands and manufacturers.
+    """
+    return list(accumulate(1 / rank for rank in range(1, count + 1)))
+
+
+def get_ean13_barcode(number: int) -> str:
+    """
+    Returns an EAN-13 in the "2" in-store prefix range, which never collides with a GS1 barcode.
+    """
+    digits = f"2{number:011d}"
+    checksum = sum(
+        int(digit) * (3 if position % 2 else 1) for position, digit in enumerate(digits)
+    )
+    return f"{digits}{(10 - checksum % 10) % 10}"
+
+
+def get_bulk_ids(
+    model_class,
+    instances: list,
+    key_fields: tuple[str, ...],
+    batch_size: int,
+) -> tuple[dict, int]:
+    """
+    Returns the ``{key: pk}`` of the instances, inserting the ones missing from the database.
+
+    Rows already stored under the same key are reused, so the reference data
+    of a seed can be loaded next to existing data.
+
+    Returns:
+        tuple[dict, int]: The ids by key, and the number of inserted rows.
+    """
+
+    def get_key(values):
+        return values[0] if len(key_fields) == 1 else tuple(values)
+
+    ids = {
+        get_key(row[:-1]): row[-1]
+        for row in model_class._base_manager.filter(
+            **{
+                f"{key_fields[0]}__in": {
+                    getattr(instance, key_fields[0]) for instance in instances
+                }
+            }
+        ).values_list(*key_fields, "id")
+    }
+    missing = [
+        instance
+        for instance in instances
+        if get_key([getattr(instance, field) for field in key_fields]) not in ids
+    ]
+    model_class.objects.bulk_create(missing, batch_size=batch_size)
+    for instance in missing:
+        ids[get_key([getattr(instance, field) for field in key_fields])] = instance.pk
+    return ids, len(missing)
+
+
+def get_medicine_models():
+    # The medicines app depends on products and not the other way
+    if apps.is_installed("apps.medicines"):
+        return (
+            apps.get_model("medicines", "MedicineInfo"),
+            apps.get_model("medicines", "GenericNameInformation"),
+        )
+    return None, None
+
+
+# * <<-------------------------------------*** Catalog Seed Service ***-------------------------------------->>
+class CatalogSeedService:
+    """
+    Generates a realistic synthetic catalog for load and scale testing.
+
+    Everything is drawn from one ``random.Random(seed)``, so a seed always
+    produces the same catalog. The reference tables (brands, manufacturers,
+    VAT, units, variation attributes, the category tree, tags and generic
+    names) are sized from the product count and written first. Products are
+    then written chunk by chunk with their sub-category links, tags, SEO row,
+    gallery images, variations and medicine info, one ``executemany()`` per
+    table and one transaction per chunk. ``save()`` and its signals are never
+    called, the search documents, media references, category tree and
+    autocomplete versions are maintained here instead.
+    """
+
+    def __init__(
+        self,
+        products: int,
+        seed: int = 0,
+        chunk_size: int = CATALOG_SEED_CHUNK_SIZE,
+        with_images: bool = True,
+        with_search_index: bool = True,
+    ):
+        self.products = products
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.with_images = with_images
+        self.with_search_index = with_search_index
+        self.rng = random.Random(seed)
+        self.MedicineInfo, self.GenericNameInformation = get_medicine_models()
+
+    def seed_catalog(self) -> CatalogSeedSummary:
+        """
+        Writes the reference data, then the products chunk by chunk.
+
+        Raises:
+            ValueError: If the database cannot return bulk inserted keys, or the catalog is already seeded.
+        """
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise ValueError(
+                f"{connection.vendor} cannot return bulk inserted keys, seed SQLite 3.35+ or PostgreSQL"
+            )
+        if Product._base_manager.filter(
+            product_id__startswith=SEED_PRODUCT_ID_PREFIX
+        ).exists():
+            raise ValueError("The catalog is already seeded, seed an empty database")
+
+        started_at = time.perf_counter()
+        self.summary = CatalogSeedSummary(seed=self.seed)
+        with transaction.atomic():
+            self._seed_reference_data()
+
+        for start in range(0, self.products, self.chunk_size):
+            stop = min(start + self.chunk_size, self.products)
+            with transaction.atomic():
+                self._seed_products(start, stop)
+            logger.info(
+                f"INFO(CatalogSeedService):---->> {stop} of {self.products} products seeded"
+            )
+
+        # What the category tree and autocomplete signals do after a save
+        set_category_tree_cache_version()
+        set_autocomplete_cache_version()
+        self.summary.elapsed_seconds = time.perf_counter() - started_at
+        return self.summary
+
+    def _add_rows(self, model_class, count: int) -> None:
+        table = model_class._meta.db_table
+        self.summary.rows[table] = self.summary.rows.get(table, 0) + count
+
+    # Load every reference table the products point at, sized from the product count
+    def _seed_reference_data(self) -> None:
+        rng, batch_size = self.rng, self.chunk_size
+
+        self.vat_ids = list(
+            self._get_ids(
+                Vat,
+                [
+                    Vat(vat_amount=amount, value_type=value_type)
+                    for amount, value_type in VAT_RATES
+                ],
+                ("vat_amount",),
+            ).values()
+        )
+
+        unit_values = get_unit_values()
+        unit_attribute_ids = self._get_ids(
+            UnitAttribute,
+            [UnitAttribute(attribute_name=name) for name in unit_values],
+            ("attribute_name",),
+        )
+        self.unit_ids = self._get_ids(
+            UnitAttributeValue,
+            [
+                UnitAttributeValue(
+                    unit_attribute_id=unit_attribute_ids[attribute_name],
+                    unit_value=unit_value,
+                )
+                for attribute_name, unit_values in unit_values.items()
+                for unit_value in unit_values
+            ],
+            ("unit_attribute_id", "unit_value"),
+        )
+        # Keyed by attribute name instead of id
+        self.unit_ids = {
+            (attribute_name, unit_value): self.unit_ids[
+                (unit_attribute_ids[attribute_name], unit_value)
+            ]
+            for attribute_name, unit_values in unit_values.items()
+            for unit_value in unit_values
+        }
+
+        variation_attribute_ids = self._get_ids(
+            VariationAttribute,
+            [VariationAttribute(attribute_name=name) for name in VARIATION_ATTRIBUTES],
+            ("attribute_name",),
+        )
+        variation_value_ids = self._get_ids(
+            VariationAttributeValue,
+            [
+                VariationAttributeValue(
+                    variation_attribute_id=variation_attribute_ids[attribute_name],
+                    attribute_value=value,
+                )
+                for attribute_name, values in VARIATION_ATTRIBUTES.items()
+                for value in values
+            ],
+            ("variation_attribute_id", "attribute_value"),
+        )
+        self.variation_value_ids = {
+            (attribute_name, value): variation_value_ids[
+                (variation_attribute_ids[attribute_name], value)
+            ]
+            for attribute_name, values in VARIATION_ATTRIBUTES.items()
+            for value in values
+        }
+
+        brand_names = get_unique_names(
+            rng,
+            min(max(self.products // 200, 20), 5000),
+            (TRADE_NAME_PREFIXES, TRADE_NAME_SUFFIXES, BRAND_SUFFIXES),
+            "{}{} {}",
+        )
+        brand_ids = self._get_ids(
+            Brand,
+            [
+                Brand(
+                    brand_name=name,
+                    origin_country=rng.choice(ORIGIN_COUNTRIES),
+                    brand_email=f"contact@{slugify(name)}.example.com",
+                )
+                for name in brand_names
+            ],
+            ("brand_name",),
+        )
+        self.brands = [(brand_ids[name], name) for name in brand_names]
+        self.brand_cum_weights = get_skewed_cum_weights(len(self.brands))
+
+        product_category_ids = list(
+            self._get_ids(
+                ManufacturerProductCategory,
+                [
+                    ManufacturerProductCategory(product_category=name)
+                    for name in MANUFACTURER_PRODUCT_CATEGORIES
+                ],
+                ("product_category",),
+            ).values()
+        )
+        manufacturer_names = get_unique_names(
+            rng,
+            min(max(self.products // 1000, 10), 1000),
+            (TRADE_NAME_PREFIXES, TRADE_NAME_SUFFIXES, MANUFACTURER_SUFFIXES),
+            "{}{} {}",
+        )
+        manufacturers = [
+            Manufacturer(
+                manufacturer_name=name,
+                manufacturer_email=f"info@{slugify(name)}.example.com",
+                manufacturer_category=(
+                    ManufacturerCategoryChoices.LOCAL
+                    if rng.random() < 0.7
+                    else ManufacturerCategoryChoices.FOREIGN
+                ),
+            )
+            for name in manufacturer_names
+        ]
+        existing_manufacturers = set(
+            Manufacturer._base_manager.filter(
+                manufacturer_name__in=manufacturer_names
+            ).values_list("manufacturer_name", flat=True)
+        )
+        manufacturer_ids = self._get_ids(
+            Manufacturer, manufacturers, ("manufacturer_name",)
+        )
+        self.manufacturer_ids = [manufacturer_ids[name] for name in manufacturer_names]
+        self.manufacturer_cum_weights = get_skewed_cum_weights(
+            len(self.manufacturer_ids)
+        )
+        ManufacturerCategoryLink = Manufacturer.product_category.through
+        manufacturer_links = [
+            ManufacturerCategoryLink(
+                manufacturer_id=manufacturer_ids[name],
+                manufacturerproductcategory_id=product_category_id,
+            )
+            for name in manufacturer_names
+            for product_category_id in rng.sample(
+                product_category_ids, rng.randint(1, 3)
+            )
+            if name not in existing_manufacturers
+        ]
+        ManufacturerCategoryLink.objects.bulk_create(
+            manufacturer_links, batch_size=batch_size
+        )
+        self._add_rows(ManufacturerCategoryLink, len(manufacturer_links))
+
+        self._seed_category_tree()
+
+        tag_ids = self._get_ids(
+            Tag, [Tag(name=name, slug=slugify(name)) for name in TAG_NAMES], ("name",)
+        )
+        self.tag_ids = [tag_ids[name] for name in TAG_NAMES]
+        self.product_content_type_id = ContentType.objects.get_for_model(Product).id
+        self.seo_content_type_id = ContentType.objects.get_for_model(ProductSeo).id
+
+        self.generic_names = []
+        if self.GenericNameInformation is not None:
+            generic_names = get_unique_names(
+                rng,
+                min(max(self.products // 400, 30), 3000),
+                (GENERIC_NAME_STEMS, GENERIC_NAME_SALTS),
+                "{} {}",
+            )
+            generic_name_ids = self._get_ids(
+                self.GenericNameInformation,
+                [
+                    self.GenericNameInformation(
+                        generic_name=name,
+                        drug_category=rng.choice(DRUG_CATEGORIES),
+                        active_ingredients=name,
+                    )
+                    for name in generic_names
+                ],
+                ("generic_name",),
+            )
+            self.generic_names = [
+                (generic_name_ids[name], name) for name in generic_names
+            ]
+
+        self.placeholder_names = (
+            self._get_placeholder_names() if self.with_images else []
+        )
+
+    def _get_ids(self, model_class, instances: list, key_fields: tuple[str, ...]):
+        ids, created = get_bulk_ids(model_class, instances, key_fields, self.chunk_size)
+        self._add_rows(model_class, created)
+        return ids
+
+    def _seed_category_tree(self) -> None:
+        root_ids = self._get_ids(
+            Category,
+            [
+                Category(category_name=name, is_client_usable=True)
+                for name in CATEGORY_TREE
+            ],
+            ("category_name",),
+        )
+        root_paths = self._set_tree_paths(
+            Category, "category_name", root_ids, dict.fromkeys(root_ids, "")
+        )
+
+        child_parents = {
+            child_name: root_name
+            for root_name, children in CATEGORY_TREE.items()
+            for child_name in children
+        }
+        child_ids = self._get_ids(
+            Category,
+            [
+                Category(
+                    category_name=child_name,
+                    parent_id=root_ids[root_name],
+                    is_client_usable=True,
+                )
+                for child_name, root_name in child_parents.items()
+            ],
+            ("category_name",),
+        )
+        child_paths = self._set_tree_paths(
+            Category,
+            "category_name",
+            child_ids,
+            {name: root_paths[root] for name, root in child_parents.items()},
+        )
+
+        sub_category_parents = {
+            sub_category_name: child_name
+            for children in CATEGORY_TREE.values()
+            for child_name, sub_categories in children.items()
+            for sub_category_name in sub_categories
+        }
+        sub_category_ids = self._get_ids(
+            SubCategory,
+            [
+                SubCategory(
+                    category_id=child_ids[child_name],
+                    sub_category_name=sub_category_name,
+                    is_client_usable=True,
+                )
+                for sub_category_name, child_name in sub_category_parents.items()
+            ],
+            ("sub_category_name",),
+        )
+        sub_category_paths = self._set_tree_paths(
+            SubCategory,
+            "sub_category_name",
+            sub_category_ids,
+            {
+                name: child_paths[child_name]
+                for name, child_name in sub_category_parents.items()
+            },
+        )
+
+        leaf_parents = {
+            leaf_name: (sub_category_name, child_name, root_name)
+            for root_name, children in CATEGORY_TREE.items()
+            for child_name, sub_categories in children.items()
+            for sub_category_name, leaves in sub_categories.items()
+            for leaf_name in leaves
+        }
+        leaf_ids = self._get_ids(
+            SubCategory,
+            [
+                SubCategory(
+                    category_id=child_ids[child_name],
+                    sub_category_name=leaf_name,
+                    parent_id=sub_category_ids[sub_category_name],
+                    is_client_usable=True,
+                )
+                for leaf_name, (
+                    sub_category_name,
+                    child_name,
+                    _,
+                ) in leaf_parents.items()
+            ],
+            ("sub_category_name",),
+        )
+        self._set_tree_paths(
+            SubCategory,
+            "sub_category_name",
+            leaf_ids,
+            {
+                name: sub_category_paths[parents[0]]
+                for name, parents in leaf_parents.items()
+            },
+        )
+
+        # Products are linked to the leaves under the root matching their type
+        self.leaf_ids: dict[str, list[int]] = {}
+        for leaf_name, (_, _, root_name) in leaf_parents.items():
+            product_type = ROOT_CATEGORY_PRODUCT_TYPES.get(root_name)
+            self.leaf_ids.setdefault(product_type, []).append(leaf_ids[leaf_name])
+        self.all_leaf_ids = list(leaf_ids.values())
+
+    def _set_tree_paths(
+        self,
+        model_class,
+        name_field: str,
+        ids: dict[str, int],
+        parent_paths: dict[str, str],
+    ) -> dict[str, str]:
+        """
+        Stores the tree path of the new nodes and returns the path of every node by name.
+        """
+        prefix = (
+            CATEGORY_PATH_PREFIX
+            if model_class is Category
+            else SUB_CATEGORY_PATH_PREFIX
+        )
+        nodes = model_class._base_manager.filter(id__in=ids.values()).only(
+            "id", name_field, "tree_path"
+        )
+        new_nodes = []
+        for node in nodes:
+            if node.tree_path:
+                continue
+            node.tree_path = f"{parent_paths[getattr(node, name_field)]}{prefix}{node.id}{CATEGORY_TREE_SEPARATOR}"
+            node.tree_depth = get_tree_depth(node.tree_path)
+            new_nodes.append(node)
+        model_class.objects.bulk_update(new_nodes, ["tree_path", "tree_depth"])
+        return {getattr(node, name_field): node.tree_path for node in nodes}
+
+    def _get_placeholder_names(self) -> list[str]:
+        """
+        Stores the placeholder images once, the content-addressed storage dedupes every later run.
+        """
+        names = []
+        for index, color in enumerate(PLACEHOLDER_COLORS):
+            buffer = io.BytesIO()
+            Image.new("RGB", PLACEHOLDER_SIZE, color).save(buffer, "JPEG", quality=60)
+            name = default_storage.save(
+                f"product/seed-placeholder-{index}.jpg", ContentFile(buffer.getvalue())
+            )
+            # Rendered here once, instead of one background job per gallery row
+            create_renditions(default_storage, name)
+            names.append(name)
+        return names
+
+    def _get_product_name(self, product_type: str) -> tuple[str, tuple[str, str]]:
+        rng = self.rng
+        trade_name = rng.choice(TRADE_NAME_PREFIXES) + rng.choice(TRADE_NAME_SUFFIXES)
+        if product_type == ProductTypeChoices.MEDICINE:
+            form, unit, strengths = rng.choice(MEDICINE_FORMS)
+            strength = rng.choice(strengths)
+            return f"{trade_name} {strength} {unit} {form}", (unit, strength)
+        if product_type == ProductTypeChoices.GENERAL:
+            noun, unit, sizes = rng.choice(GENERAL_PRODUCTS)
+            size = rng.choice(sizes)
+            return f"{trade_name} {noun} {size} {unit}", (unit, size)
+        if product_type == ProductTypeChoices.DEVICE:
+            return f"{trade_name} {rng.choice(DEVICE_NAMES)}", ("pcs", "1")
+        return f"{trade_name} {rng.choice(OTHER_PRODUCTS[product_type])}", ("pcs", "1")
+
+    # Draw every value of a chunk first, then write it with one executemany() per table
+    def _seed_products(self, start: int, stop: int) -> None:
+        rng = self.rng
+        product_types = list(PRODUCT_TYPE_WEIGHTS)
+        product_type_weights = list(PRODUCT_TYPE_WEIGHTS.values())
+
+        products, plans = [], []
+        for index in range(start, stop):
+            product_type = rng.choices(product_types, product_type_weights)[0]
+            product_name, unit = self._get_product_name(product_type)
+            brand_id, brand_name = rng.choices(
+                self.brands, cum_weights=self.brand_cum_weights
+            )[0]
+            product_id = f"{SEED_PRODUCT_ID_PREFIX}{index:09d}"
+            vat_id = rng.choice(self.vat_ids)
+            active_status = (
+                ActiveStatusChoices.ACTIVE
+                if rng.random() < 0.95
+                else ActiveStatusChoices.INACTIVE
+            ).value
+            products.append(
+                {
+                    "product_id": product_id,
+                    "product_name": product_name,
+                    "product_type": product_type.value,
+                    "product_image": (
+                        rng.choice(self.placeholder_names)
+                        if self.placeholder_names and rng.random() < 0.8
+                        else None
+                    ),
+                    # The placeholders are rendered once up front
+                    "image_status": ImageStatusChoices.READY.value,
+                    "image_alt_name": product_name,
+                    "barcode_type": ProductBarcodeChoices.AUTO.value,
+                    "barcode": get_ean13_barcode(index),
+                    "purchase_vat": vat_id,
+                    "sales_vat": vat_id,
+                    "product_unit": self.unit_ids[unit],
+                    "brand": brand_id,
+                    "manufacturer": rng.choices(
+                        self.manufacturer_ids,
+                        cum_weights=self.manufacturer_cum_weights,
+                    )[0],
+                    "url_slug": f"{get_generated_slug(product_name)}-{product_id.lower()}",
+                    "description": rng.choice(DESCRIPTION_TEMPLATES).format(
+                        name=product_name, brand=brand_name
+                    ),
+                    "active_status": active_status,
+                }
+            )
+
+            leaf_ids = self.leaf_ids.get(product_type, self.all_leaf_ids)
+            variations = []
+            if product_type != ProductTypeChoices.MEDICINE and rng.random() < 0.2:
+                attribute_names = rng.sample(
+                    list(VARIATION_ATTRIBUTES), rng.randint(1, 2)
+                )
+                variations = list(
+                    get_combinations(
+                        *(
+                            [
+                                (name, value)
+                                for value in rng.sample(VARIATION_ATTRIBUTES[name], 2)
+                            ]
+                            for name in attribute_names
+                        )
+                    )
+                )
+            plans.append(
+                {
+                    "sub_category_ids": rng.sample(leaf_ids, rng.randint(1, 2)),
+                    "tag_ids": rng.sample(self.tag_ids, rng.randint(2, 4)),
+                    "seo_tag_ids": rng.sample(self.tag_ids, 2),
+                    "gallery_images": (
+                        [
+                            rng.choice(self.placeholder_names)
+                            for _ in range(rng.choices((0, 1, 2, 3), (2, 4, 3, 1))[0])
+                        ]
+                        if self.placeholder_names
+                        else []
+                    ),
+                    "variations": variations,
+                    "generic_names": (
+                        rng.sample(self.generic_names, 1 if rng.random() < 0.85 else 2)
+                        if product_type == ProductTypeChoices.MEDICINE
+                        and self.generic_names
+                        else []
+                    ),
+                    "is_required_prescription": rng.random() < 0.4,
+                }
+            )
+
+        self._insert_rows(
+            Product,
+            tuple(products[0]),
+            [tuple(product.values()) for product in products],
+        )
+        # The keys come back through the unique product IDs
+        product_pks = dict(
+            Product.objects.filter(
+                product_id__in=[product["product_id"] for product in products]
+            ).values_list("product_id", "id")
+        )
+        for product in products:
+            product["pk"] = product_pks[product["product_id"]]
+
+        SubCategoryLink = Product.sub_category.through
+        self._insert_rows(
+            SubCategoryLink,
+            ("product", "subcategory"),
+            [
+                (product["pk"], sub_category_id)
+                for product, plan in zip(products, plans)
+                for sub_category_id in plan["sub_category_ids"]
+            ],
+        )
+
+        self._insert_rows(
+            ProductSeo,
+            (
+                "product",
+                "seo_title",
+                "meta_tags",
+                "meta_description",
+                "seo_description",
+                "active_status",
+            ),
+            [
+                (
+                    product["pk"],
+                    f"Buy {product['product_name']} Online | {product['product_id']}",
+                    product["product_name"],
+                    product["description"],
+                    product["description"],
+                    product["active_status"],
+                )
+                for product in products
+            ],
+        )
+        seo_pks = self._get_product_keys(ProductSeo, "product_id", product_pks)
+        self._insert_rows(
+            TaggedItem,
+            ("tag", "content_type", "object_id"),
+            [
+                (tag_id, self.product_content_type_id, product["pk"])
+                for product, plan in zip(products, plans)
+                for tag_id in plan["tag_ids"]
+            ]
+            + [
+                (tag_id, self.seo_content_type_id, seo_pks[product["pk"]])
+                for product, plan in zip(products, plans)
+                for tag_id in plan["seo_tag_ids"]
+            ],
+        )
+
+        gallery_rows = [
+            (
+                product["pk"],
+                image_name,
+                f"{product['product_name']} image {position}",
+                ImageStatusChoices.READY.value,
+                product["active_status"],
+            )
+            for product, plan in zip(products, plans)
+            for position, image_name in enumerate(plan["gallery_images"], start=1)
+        ]
+        self._insert_rows(
+            ProductImageGallery,
+            (
+                "product",
+                "product_image",
+                "image_alt_name",
+                "image_status",
+                "active_status",
+            ),
+            gallery_rows,
+        )
+        self._add_media_references(
+            [product["product_image"] for product in products]
+            + [image_name for _, image_name, *_ in gallery_rows]
+        )
+
+        variation_plans = [
+            (
+                f"{product['product_id']} {' / '.join(value for _, value in values)}",
+                product,
+                values,
+            )
+            for product, plan in zip(products, plans)
+            for values in plan["variations"]
+        ]
+        self._insert_rows(
+            ProductVariation,
+            ("product", "variation_name", "active_status"),
+            [
+                (product["pk"], variation_name, product["active_status"])
+                for variation_name, product, _ in variation_plans
+            ],
+        )
+        variation_pks = self._get_product_keys(
+            ProductVariation, "variation_name", product_pks
+        )
+        VariationLink = ProductVariation.variation_attribute.through
+        self._insert_rows(
+            VariationLink,
+            ("productvariation", "variationattributevalue"),
+            [
+                (variation_pks[variation_name], self.variation_value_ids[value])
+                for variation_name, _, values in variation_plans
+                for value in values
+            ],
+        )
+
+        if self.MedicineInfo is not None:
+            medicine_plans = [
+                (product, plan)
+                for product, plan in zip(products, plans)
+                if plan["generic_names"]
+            ]
+            self._insert_rows(
+                self.MedicineInfo,
+                (
+                    "product",
+                    "is_required_prescription",
+                    "composition",
+                    "indication",
+                    "dosage_details",
+                    "storage_condition",
+                    "active_status",
+                ),
+                [
+                    (
+                        product["pk"],
+                        plan["is_required_prescription"],
+                        " + ".join(name for _, name in plan["generic_names"]),
+                        f"See the leaflet of {product['product_name']}.",
+                        "As directed by the registered physician.",
+                        "Store below 30°C, protected from light and moisture.",
+                        product["active_status"],
+                    )
+                    for product, plan in medicine_plans
+                ],
+            )
+            medicine_pks = self._get_product_keys(
+                self.MedicineInfo, "product_id", product_pks
+            )
+            GenericNameLink = self.MedicineInfo.generic_name.through
+            self._insert_rows(
+                GenericNameLink,
+                ("medicineinfo", "genericnameinformation"),
+                [
+                    (medicine_pks[product["pk"]], generic_name_id)
+                    for product, plan in medicine_plans
+                    for generic_name_id, _ in plan["generic_names"]
+                ],
+            )
+
+        if self.with_search_index:
+            set_product_search_documents(list(product_pks.values()))
+
+    @staticmethod
+    def _get_product_keys(model_class, key_field: str, product_pks: dict) -> dict:
+        """
+        Reads back the keys of the rows just written for the chunk products, by a unique column.
+        """
+        return dict(
+            model_class.objects.filter(
+                product_id__in=list(product_pks.values())
+            ).values_list(key_field, "id")
+        )
+
+    def _insert_rows(
+        self, model_class, field_names: tuple[str, ...], rows: list[tuple]
+    ) -> None:
+        """
+        Inserts tuples of database values with one ``executemany()``.
+
+        A model instance per row and the ``bulk_create()`` value preparation
+        cost several times the INSERT itself. The fields left out get their
+        default, the ``auto_now`` ones the current time, prepared once per call.
+        """
+        if not rows:
+            return
+        now = timezone.now()
+        fields = [model_class._meta.get_field(field_name) for field_name in field_names]
+        other_fields = [
+            field
+            for field in model_class._meta.concrete_fields
+            if field not in fields and not field.primary_key
+        ]
+        other_values = tuple(
+            field.get_db_prep_save(
+                (
+                    now
+                    if getattr(field, "auto_now", False)
+                    or getattr(field, "auto_now_add", False)
+                    else field.get_default()
+                ),
+                connection,
+            )
+            for field in other_fields
+        )
+
+        quote_name = connection.ops.quote_name
+        columns = [quote_name(field.column) for field in fields + other_fields]
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {quote_name(model_class._meta.db_table)} "
+                f"({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})",
+                [row + other_values for row in rows] if other_values else rows,
+            )
+        self._add_rows(model_class, len(rows))
+
+    @staticmethod
+    def _add_media_references(names: list[str | None]) -> None:
+        """
+        Counts the new file field values in ``MediaBlob``, what the media blob signals do on save.
+        """
+        if not isinstance(default_storage, ContentAddressedStorage):
+            return
+        for name, count in Counter(filter(None, names)).items():
+            if not MediaBlob.objects.filter(name=name).update(
+                reference_count=F("reference_count") + count
+            ):
+                MediaBlob.objects.create(name=name, reference_count=count)
@@ -0,0 +1,339 @@
+import io
+import posixpath
+from functools import cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.urls import reverse
+from PIL import Image, ImageOps, features
+
+from apps.common.functions.background_job import (
+    enqueue_background_job,
+    get_task_path,
+)
+from apps.common.functions.validator.image_validator import (
+    get_image_header_errors,
+    get_validate_image_dimensions,
+)
+from apps.common.models import (
+    BackgroundJob,
+    BackgroundJobStatusChoices,
+    ImageStatusChoices,
+)
+
+# Pillow save format of each rendition format
+PILLOW_FORMATS = {"webp": "WEBP", "avif": "AVIF"}
+
+
+@cache
+def get_rendition_formats() -> dict[str, int]:
+    """
+    Returns the configured ``{format: quality}`` the installed Pillow can encode.
+    """
+    return {
+        file_format: quality
+        for file_format, quality in settings.IMAGE_RENDITION_FORMATS.items()
+        if file_format in PILLOW_FORMATS and features.check(file_format)
+    }
+
+
+def get_rendition_sizes() -> list[tuple[str, tuple[int, int]]]:
+    """
+    Returns the configured sizes, largest first so each one is scaled from the previous.
+    """
+    return sorted(
+        settings.IMAGE_RENDITION_SIZES.items(),
+        key=lambda item: item[1][0] * item[1][1],
+        reverse=True,
+    )
+
+
+def get_rendition_storage():
+    return storages["renditions"]
+
+
+def get_rendition_name(name: str, size: str, file_format: str) -> str:
+    """
+    Returns the storage name of a rendition, i.e. "product/napa.jpg" -> "renditions/thumbnail/product/napa.webp".
+    """
+    return posixpath.join(
+        settings.IMAGE_RENDITION_ROOT,
+        size,
+        f"{posixpath.splitext(name)[0]}.{file_format}",
+    )
+
+
+def get_last_rendition_name(name: str) -> str | None:
+    """
+    Returns the rendition written last for an image, its presence means all of them exist.
+    """
+    sizes = get_rendition_sizes()
+    formats = get_rendition_formats()
+    if not sizes or not formats:
+        return None
+    return get_rendition_name(name, sizes[-1][0], list(formats)[-1])
+
+
+@cache
+def get_rendition_source_prefixes() -> tuple[str, ...]:
+    """
+    Returns the ``upload_to`` directories of every image field that has renditions.
+    """
+    prefixes = set()
+    for model_class in apps.get_models():
+        for field_name in getattr(model_class, "rendition_image_fields", ()):
+            upload_to = model_class._meta.get_field(field_name).upload_to
+            if isinstance(upload_to, str):
+                prefixes.add(upload_to.rstrip("/") + "/")
+    return tuple(sorted(prefixes))
+
+
+def is_rendition_source(name: str) -> bool:
+    """
+    Tells if a storage name can be rendered, an upload of an image field with renditions.
+    """
+    normalized_name = posixpath.normpath(name)
+    return (
+        normalized_name == name
+        and not name.startswith(("/", "../"))
+        and name.startswith(get_rendition_source_prefixes())
+    )
+
+
+# * <<-------------------------------------*** Rendition Generation ***-------------------------------------->>
+def get_rgb_image(image: Image.Image) -> Image.Image:
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ("RGB", "RGBA"):
+        return image
+    has_alpha = "A" in image.mode or "transparency" in image.info
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def create_renditions(storage, name: str, force: bool = False) -> list[str]:
+    """
+    Writes every size and format of an uploaded image to the renditions storage.
+
+    The original is decoded once. JPEG originals are decoded straight at a
+    reduced scale through ``draft()``, and every size is scaled down from the
+    previous one instead of the full original.
+
+    Args:
+        storage: The storage holding the original image.
+        name (str): The storage name of the image.
+        force (bool): Overwrite the existing renditions.
+
+    Returns:
+        list[str]: The storage names of the written renditions.
+    """
+    last_name = get_last_rendition_name(name)
+    rendition_storage = get_rendition_storage()
+    if last_name is None or (not force and rendition_storage.exists(last_name)):
+        return []
+
+    sizes = get_rendition_sizes()
+    formats = get_rendition_formats()
+    written = []
+    with storage.open(name, "rb") as source:
+        # Refuse a decompression bomb from its header before Pillow decodes it
+        header_errors = get_image_header_errors(
+            [source], max_pixels=settings.IMAGE_MAX_PIXELS
+        )
+        if header_errors:
+            raise ValueError(f"{name}: {header_errors[0]}")
+        with Image.open(source) as original:
+            original.draft("RGB", sizes[0][1])
+            image = get_rgb_image(original)
+            for size, box in sizes:
+                # In place, the next size is scaled from this one
+                image.thumbnail(box, Image.Resampling.LANCZOS)
+                for file_format, quality in formats.items():
+                    buffer = io.BytesIO()
+                    image.save(buffer, PILLOW_FORMATS[file_format], quality=quality)
+                    rendition_name = get_rendition_name(name, size, file_format)
+                    written.append(
+                        rendition_storage.save(
+                            rendition_name, ContentFile(buffer.getvalue())
+                        )
+                    )
+    return written
+
+
+def get_rejected_image_names(images: list) -> list[str] | None:
+    """
+    Returns the names of the images the image job refuses to render, judged from their headers.
+
+    Images outside ``IMAGE_MIN_DIMENSIONS``/``IMAGE_MAX_DIMENSIONS``, above
+    ``IMAGE_MAX_PIXELS`` or unreadable are rejected.
+    """
+    min_width, min_height = settings.IMAGE_MIN_DIMENSIONS
+    max_width, max_height = settings.IMAGE_MAX_DIMENSIONS
+    return get_validate_image_dimensions(
+        images,
+        max_width=max_width,
+        max_height=max_height,
+        min_width=min_width,
+        min_height=min_height,
+        max_pixels=settings.IMAGE_MAX_PIXELS,
+    )
+
+
+def has_renditions(field_file) -> bool:
+    last_name = get_last_rendition_name(field_file.name)
+    return last_name is None or get_rendition_storage().exists(last_name)
+
+
+def process_instance_images(model: str, pk: int, force: bool = False) -> None:
+    """
+    Background job validating and rendering the ``rendition_image_fields`` of a saved instance.
+
+    Images outside ``IMAGE_MIN_DIMENSIONS``/``IMAGE_MAX_DIMENSIONS`` or above
+    ``IMAGE_MAX_PIXELS``, judged from their headers only, are not rendered.
+    Models with an ``image_status`` field get it set to ready, rejected, or
+    failed when the job raises; a failed job is retried.
+
+    Args:
+        model (str): The model label, i.e. "products.ProductImageGallery".
+        pk (int): The primary key of the instance.
+        force (bool): Render again images that already have renditions.
+    """
+    model_class = apps.get_model(model)
+    instance = model_class._base_manager.filter(pk=pk).first()
+    if instance is None:
+        # Deleted before the job ran
+        return
+
+    has_image_status = any(
+        field.name == "image_status" for field in model_class._meta.concrete_fields
+    )
+    image_status = ImageStatusChoices.READY
+    try:
+        for field_name in model_class.rendition_image_fields:
+            field_file = getattr(instance, field_name)
+            if not field_file:
+                continue
+            if get_rejected_image_names([field_file]):
+                image_status = ImageStatusChoices.REJECTED
+                continue
+            create_renditions(field_file.storage, field_file.name, force=force)
+    except Exception:
+        if has_image_status:
+            model_class._base_manager.filter(pk=pk).update(
+                image_status=ImageStatusChoices.FAILED
+            )
+        raise
+
+    if has_image_status:
+        model_class._base_manager.filter(pk=pk).update(image_status=image_status)
+
+
+def schedule_instance_images(instance, using=None) -> None:
+    """
+    Queues the image job of a saved instance whose images have no renditions yet.
+
+    The save itself only costs a storage lookup per image and a job row, the
+    decoding and resizing happen in the ``run_background_jobs`` worker. An
+    upload deduplicated onto an already rendered file still gets the job while
+    its ``image_status`` is pending, the job then only checks the header.
+    """
+    field_files = [
+        getattr(instance, field_name)
+        for field_name in instance.rendition_image_fields
+        if getattr(instance, field_name)
+    ]
+    is_pending = getattr(instance, "image_status", None) == ImageStatusChoices.PENDING
+    if not field_files or (
+        not is_pending and all(has_renditions(field_file) for field_file in field_files)
+    ):
+        return
+
+    if getattr(instance, "image_status", None) not in (
+        None,
+        ImageStatusChoices.PENDING,
+    ):
+        instance.image_status = ImageStatusChoices.PENDING
+        instance.__class__._base_manager.using(using).filter(pk=instance.pk).update(
+            image_status=ImageStatusChoices.PENDING
+        )
+    enqueue_background_job(
+        process_instance_images,
+        model=instance._meta.label,
+        pk=instance.pk,
+        using=using,
+    )
+
+
+def process_stored_image(name: str) -> None:
+    """
+    Background job rendering a stored image no saved instance queued, requested through the rendition endpoint.
+    """
+    storage = storages["default"]
+    with storage.open(name, "rb") as image:
+        if get_rejected_image_names([image]):
+            return
+    create_renditions(storage, name)
+
+
+def schedule_stored_image(name: str) -> None:
+    """
+    Queues ``process_stored_image`` unless the image already has a job.
+
+    A failed job is not queued again by a request, only ``generate_image_renditions --force`` retries it.
+    """
+    if BackgroundJob.objects.filter(
+        task=get_task_path(process_stored_image),
+        payload={"name": name},
+        status__in=[
+            BackgroundJobStatusChoices.PENDING,
+            BackgroundJobStatusChoices.RUNNING,
+            BackgroundJobStatusChoices.FAILED,
+        ],
+    ).exists():
+        return
+    enqueue_background_job(process_stored_image, name=name)
+
+
+# * <<-------------------------------------*** Rendition URLs ***-------------------------------------->>
+def get_rendition_urls(field_file, request=None) -> dict[str, dict[str, str]] | None:
+    """
+    Returns ``{size: {format: url}}`` of an image, or None without an image.
+
+    Once the image job marked the instance's ``image_status`` ready, the
+    renditions are linked directly, without asking the storage. Until then
+    the links point to the rendition endpoint, which redirects to the
+    original meanwhile.
+
+    Args:
+        field_file: The ``FieldFile`` of the image.
+        request: Makes the URLs absolute, like DRF's ``ImageField``.
+
+    Returns:
+        dict[str, dict[str, str]] | None: The rendition URLs.
+    """
+    if not field_file:
+        return None
+
+    name = field_file.name
+    if get_last_rendition_name(name) is None:
+        return None
+    is_rendered = (
+        getattr(field_file.instance, "image_status", None) == ImageStatusChoices.READY
+    )
+    rendition_storage = get_rendition_storage()
+
+    urls: dict[str, dict[str, str]] = {}
+    for size, _ in get_rendition_sizes():
+        urls[size] = {}
+        for file_format in get_rendition_formats():
+            if is_rendered:
+                url = rendition_storage.url(get_rendition_name(name, size, file_format))
+            else:
+                url = reverse(
+                    "image_rendition",
+                    kwargs={"size": size, "file_format": file_format, "name": name},
+                )
+            urls[size][file_format] = (
+                request.build_absolute_uri(url) if request is not None else url
+            )
+    return urls
@@ -0,0 +1,351 @@
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from enum import StrEnum
+from uuid import uuid4
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from loguru import logger
+
+from apps.common.models import ActiveStatusChoices
+from apps.common.routers.replica_router import use_primary
+from apps.products.models import Product
+
+PRODUCT_AUTOCOMPLETE_VERSION_KEY = "products:autocomplete:version"
+PRODUCT_AUTOCOMPLETE_BATCH_SIZE = 5000
+# Word starts indexed per name besides the name itself, i.e. "Extra" of "Napa Extra"
+MAX_WORD_KEYS = 2
+# Entries inspected past the bisect point before ranking
+MAX_SCANNED_ENTRIES = 256
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+class AutocompleteTypeChoices(StrEnum):
+    PRODUCT = "product"
+    GENERIC_NAME = "generic_name"
+
+
+def get_normalized_name(name: str | None) -> str:
+    """
+    Case folds a name and collapses punctuation and spaces, i.e. "Napa-Extra  500" -> "napa extra 500".
+    """
+    if not name:
+        return ""
+    return NON_WORD_PATTERN.sub(" ", name.casefold()).strip()
+
+
+def get_name_keys(name: str) -> list[str]:
+    """
+    Returns the index keys of a normalized name, the name and its next word starts.
+    """
+    keys = [name]
+    start = name.find(" ")
+    while start != -1 and len(keys) <= MAX_WORD_KEYS:
+        keys.append(name[start + 1 :])
+        start = name.find(" ", start + 1)
+    return keys
+
+
+# * <<-------------------------------------*** Prefix Index ***-------------------------------------->>
+class PrefixIndex:
+    """
+    Sorted ``(key, type, id)`` array searched with ``bisect``.
+
+    A lookup is one binary search plus a short scan of the matching range, so
+    it stays well under a millisecond for millions of keys. Single item
+    updates insert and remove in place.
+    """
+
+    def __init__(self):
+        self.entries: list[tuple[str, str, int]] = []
+        # (type, id) -> (display name, normalized name length)
+        self.names: dict[tuple[str, int], tuple[str, int]] = {}
+
+    @classmethod
+    def from_items(cls, items) -> "PrefixIndex":
+        """
+        Builds an index from ``(type, id, name)`` items with one sort.
+        """
+        index = cls()
+        for item_type, item_id, name in items:
+            normalized_name = get_normalized_name(name)
+            if not normalized_name:
+                continue
+            index.names[(item_type, item_id)] = (name, len(normalized_name))
+            index.entries.extend(
+                (key, item_type, item_id) for key in get_name_keys(normalized_name)
+            )
+        index.entries.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def remove(self, item_type: str, item_id: int) -> None:
+        name, _ = self.names.pop((item_type, item_id), (None, 0))
+        if name is None:
+            return
+
+        for key in get_name_keys(get_normalized_name(name)):
+            entry = (key, item_type, item_id)
+            position = bisect_left(self.entries, entry)
+            if position < len(self.entries) and self.entries[position] == entry:
+                del self.entries[position]
+
+    def add(self, item_type: str, item_id: int, name: str) -> None:
+        self.remove(item_type, item_id)
+        normalized_name = get_normalized_name(name)
+        if not normalized_name:
+            return
+
+        self.names[(item_type, item_id)] = (name, len(normalized_name))
+        for key in get_name_keys(normalized_name):
+            insort(self.entries, (key, item_type, item_id))
+
+    def search(
+        self, prefix: str, limit: int, item_type: str | None = None
+    ) -> list[dict]:
+        """
+        Returns the items whose name, or a word of it, starts with ``prefix``.
+
+        Name prefix matches rank before word matches, shorter names first.
+        """
+        prefix = get_normalized_name(prefix)
+        if not prefix:
+            return []
+
+        matches: dict[tuple[str, int], tuple[int, int, str]] = {}
+        position = bisect_left(self.entries, (prefix,))
+        for key, entry_type, entry_id in self.entries[
+            position : position + MAX_SCANNED_ENTRIES
+        ]:
+            if not key.startswith(prefix):
+                break
+            if item_type and entry_type != item_type:
+                continue
+
+            name, normalized_length = self.names[(entry_type, entry_id)]
+            is_word_match = int(len(key) != normalized_length)
+            rank = (is_word_match, len(name), name.casefold())
+            matches[(entry_type, entry_id)] = min(
+                rank, matches.get((entry_type, entry_id), rank)
+            )
+
+        ranked = sorted(matches.items(), key=lambda item: item[1])[:limit]
+        return [
+            {
+                "id": entry_id,
+                "type": entry_type,
+                "name": self.names[(entry_type, entry_id)][0],
+            }
+            for (entry_type, entry_id), _ in ranked
+        ]
+
+
+# * <<-------------------------------------*** Autocomplete Source Rows ***-------------------------------------->>
+def get_generic_name_model():
+    # The medicines app depends on products and not the other way
+    if apps.is_installed("apps.medicines"):
+        return apps.get_model("medicines", "GenericNameInformation")
+    return None
+
+
+def get_autocomplete_querysets(updated_since=None):
+    """
+    Returns ``(type, queryset)`` pairs of ``(id, name, active_status, updated_at)`` rows.
+    """
+    querysets = [
+        (
+            AutocompleteTypeChoices.PRODUCT,
+            Product.objects.values_list(
+                "id", "product_name", "active_status", "updated_at"
+            ),
+        )
+    ]
+    GenericNameInformation = get_generic_name_model()
+    if GenericNameInformation is not None:
+        querysets.append(
+            (
+                AutocompleteTypeChoices.GENERIC_NAME,
+                GenericNameInformation.objects.values_list(
+                    "id", "generic_name", "active_status", "updated_at"
+                ),
+            )
+        )
+
+    if updated_since is None:
+        return [(item_type, queryset.active()) for item_type, queryset in querysets]
+    # Deactivated rows are needed too, to drop them from the index
+    return [
+        (item_type, queryset.filter(updated_at__gte=updated_since))
+        for item_type, queryset in querysets
+    ]
+
+
+def set_autocomplete_cache_version() -> str:
+    """
+    Tells every worker that the autocomplete source rows changed.
+    """
+    version = uuid4().hex
+    cache.set(PRODUCT_AUTOCOMPLETE_VERSION_KEY, version, timeout=None)
+    return version
+
+
+# * <<-------------------------------------*** Product Autocomplete Index ***-------------------------------------->>
+class ProductAutocompleteIndex:
+    """
+    Process-local typeahead index over active product and generic names.
+
+    Saves in this process are applied by signals as soon as they commit and
+    bump a cache version token. Other workers compare that token at most once
+    per ``PRODUCT_AUTOCOMPLETE_SYNC_INTERVAL`` and pull the rows changed since
+    their last sync through ``updated_at``. Deletes made elsewhere leave no
+    row to sync from, so the index is also rebuilt in a background thread
+    every ``PRODUCT_AUTOCOMPLETE_REBUILD_INTERVAL`` and swapped in whole. The
+    first build runs in that thread too, started with the server.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        # A new lock as well, a forked child could inherit it held
+        self._lock = threading.RLock()
+        self.index: PrefixIndex | None = None
+        self.version = None
+        self.synced_at = None
+        self.checked_at = 0.0
+        self.built_at = 0.0
+        self.is_rebuilding = False
+        self.rebuild_thread: threading.Thread | None = None
+        # set_item() calls made while a build loads, None when no build runs
+        self.pending_items: list[tuple[str, int, str | None]] | None = None
+
+    def load_items(self) -> tuple[list[tuple[str, int, str]], object]:
+        """
+        Reads the ``(type, id, name)`` of every active item and the latest ``updated_at``.
+        """
+        synced_at = None
+        items = []
+        # Tagged with the current version, a lagging replica could miss the rows behind it
+        with use_primary():
+            for item_type, queryset in get_autocomplete_querysets():
+                for item_id, name, _, updated_at in queryset.iterator(
+                    chunk_size=PRODUCT_AUTOCOMPLETE_BATCH_SIZE
+                ):
+                    items.append((item_type, item_id, name))
+                    synced_at = max(synced_at or updated_at, updated_at)
+        return items, synced_at
+
+    def build(self) -> None:
+        """
+        Loads a new index and swaps it in.
+
+        Changes applied while the rows load are replayed onto the new index,
+        it may have read a row a committed delete already removed.
+        """
+        with self._lock:
+            self.pending_items = []
+        try:
+            version = cache.get(PRODUCT_AUTOCOMPLETE_VERSION_KEY)
+            items, synced_at = self.load_items()
+            index = PrefixIndex.from_items(items)
+            with self._lock:
+                for item_type, item_id, name in self.pending_items:
+                    if name:
+                        index.add(item_type, item_id, name)
+                    else:
+                        index.remove(item_type, item_id)
+                self.index = index
+                self.version = version
+                self.synced_at = synced_at
+                self.built_at = self.checked_at = time.monotonic()
+        finally:
+            with self._lock:
+                self.pending_items = None
+
+    def sync(self) -> None:
+        """
+        Applies the rows changed since the last sync.
+        """
+        for item_type, queryset in get_autocomplete_querysets(self.synced_at):
+            for item_id, name, active_status, updated_at in queryset:
+                self.set_item(
+                    item_type,
+                    item_id,
+                    name if active_status == ActiveStatusChoices.ACTIVE else None,
+                )
+                self.synced_at = max(self.synced_at or updated_at, updated_at)
+
+    def rebuild_in_background(self) -> None:
+        with self._lock:
+            if self.is_rebuilding:
+                return
+            self.is_rebuilding = True
+
+        def rebuild():
+            try:
+                self.build()
+            except Exception as e:
+                logger.error(f"ERROR(ProductAutocompleteIndex):---->> {e}")
+            finally:
+                self.is_rebuilding = False
+                # The connections of this thread are never reused, give them back
+                connections.close_all()
+
+        self.rebuild_thread = threading.Thread(target=rebuild, daemon=True)
+        self.rebuild_thread.start()
+
+    def get_index(self) -> PrefixIndex:
+        if self.index is None:
+            # Built off the request path, nothing matches until it is swapped in
+            self.rebuild_in_background()
+            return EMPTY_PREFIX_INDEX
+
+        now = time.monotonic()
+        if now - self.checked_at < settings.PRODUCT_AUTOCOMPLETE_SYNC_INTERVAL:
+            return self.index
+
+        with self._lock:
+            self.checked_at = now
+            version = cache.get(PRODUCT_AUTOCOMPLETE_VERSION_KEY)
+            if version != self.version:
+                self.version = version
+                with use_primary():
+                    self.sync()
+
+        if now - self.built_at >= settings.PRODUCT_AUTOCOMPLETE_REBUILD_INTERVAL:
+            self.rebuild_in_background()
+        return self.index
+
+    def set_item(self, item_type: str, item_id: int, name: str | None) -> None:
+        """
+        Adds or renames an item, or removes it when ``name`` is None.
+        """
+        with self._lock:
+            if self.pending_items is not None:
+                self.pending_items.append((item_type, item_id, name))
+            if self.index is None:
+                return
+            if name:
+                self.index.add(item_type, item_id, name)
+            else:
+                self.index.remove(item_type, item_id)
+
+    def search(
+        self, prefix: str, limit: int = 10, item_type: str | None = None
+    ) -> list[dict]:
+        index = self.get_index()
+        with self._lock:
+            return index.search(prefix, limit, item_type)
+
+
+EMPTY_PREFIX_INDEX = PrefixIndex.from_items([])
+product_autocomplete_index = ProductAutocompleteIndex()
+# A forked worker must not share the parent's index state
+os.register_at_fork(after_in_child=product_autocomplete_index.reset)
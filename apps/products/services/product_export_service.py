@@ -0,0 +1,227 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.db.models import Prefetch, QuerySet
+
+from apps.products.models import Product, ProductSeo, SubCategory
+
+PRODUCT_EXPORT_CHUNK_SIZE = 2000
+PRODUCT_EXPORT_FORMATS = ("csv", "jsonl")
+# The import columns first, so an export can be fed back to import_products
+PRODUCT_EXPORT_COLUMNS = (
+    "product_id",
+    "product_name",
+    "product_type",
+    "image_alt_name",
+    "barcode_type",
+    "barcode",
+    "purchase_vat",
+    "sales_vat",
+    "unit_value",
+    "unit_attribute",
+    "brand",
+    "manufacturer",
+    "sub_categories",
+    "description",
+    "active_status",
+    "url_slug",
+    "search_keywords",
+    "seo_title",
+    "seo_keywords",
+    "meta_description",
+    "generic_names",
+    "therapeutic_class",
+    "is_required_prescription",
+)
+# Multi-valued columns are '|' separated in CSV files, like the import
+CSV_LIST_SEPARATOR = "|"
+GZIP_WBITS = 31
+
+
+def get_export_content_type(file_format: str, compress: bool) -> str:
+    if compress:
+        return "application/gzip"
+    return "text/csv" if file_format == "csv" else "application/x-ndjson"
+
+
+def get_export_file_name(file_format: str, compress: bool) -> str:
+    return f"catalog.{file_format}{'.gz' if compress else ''}"
+
+
+# * <<-------------------------------------*** Product Export Service ***-------------------------------------->>
+class ProductExportService:
+    """
+    Streams the full catalog as CSV or JSONL, optionally gzip compressed.
+
+    Products are read with ``.iterator(chunk_size=...)``, a server-side
+    cursor on PostgreSQL, and their sub-categories, tags, SEO and medicine
+    info are prefetched per chunk. Every chunk is encoded and, when
+    compressing, deflated before the next one is read, so memory stays
+    bounded by the chunk size whatever the catalog size.
+    """
+
+    def __init__(
+        self,
+        file_format: str = "csv",
+        compress: bool = False,
+        chunk_size: int = PRODUCT_EXPORT_CHUNK_SIZE,
+    ):
+        if file_format not in PRODUCT_EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported export format: {file_format}. Only allowed: {PRODUCT_EXPORT_FORMATS}"
+            )
+        self.file_format = file_format
+        self.compress = compress
+        self.chunk_size = chunk_size
+        self.has_medicine_info = apps.is_installed("apps.medicines")
+
+    def get_queryset(self) -> QuerySet:
+        related = [
+            "brand",
+            "manufacturer",
+            "purchase_vat",
+            "sales_vat",
+            "product_unit__unit_attribute",
+            "product_seo",
+        ]
+        prefetches = [
+            Prefetch(
+                "sub_category",
+                queryset=SubCategory.objects.only("id", "sub_category_name"),
+            ),
+            "search_keyword",
+            "product_seo__seo_keyword",
+        ]
+        if self.has_medicine_info:
+            related.append("medicine_info")
+            prefetches.append("medicine_info__generic_name")
+
+        return (
+            Product.objects.select_related(*related)
+            .prefetch_related(*prefetches)
+            .order_by("id")
+        )
+
+    def get_row(self, product: Product) -> dict:
+        unit = product.product_unit
+        seo: ProductSeo | None = getattr(product, "product_seo", None)
+        medicine_info = (
+            getattr(product, "medicine_info", None) if self.has_medicine_info else None
+        )
+
+        return {
+            "product_id": product.product_id,
+            "product_name": product.product_name,
+            "product_type": product.product_type,
+            "image_alt_name": product.image_alt_name,
+            "barcode_type": product.barcode_type,
+            "barcode": product.barcode,
+            "purchase_vat": (
+                str(product.purchase_vat.vat_amount) if product.purchase_vat else None
+            ),
+            "sales_vat": (
+                str(product.sales_vat.vat_amount) if product.sales_vat else None
+            ),
+            "unit_value": unit.unit_value if unit else None,
+            "unit_attribute": unit.unit_attribute.attribute_name if unit else None,
+            "brand": product.brand.brand_name if product.brand else None,
+            "manufacturer": (
+                product.manufacturer.manufacturer_name if product.manufacturer else None
+            ),
+            "sub_categories": [
+                sub_category.sub_category_name
+                for sub_category in product.sub_category.all()
+            ],
+            "description": product.description,
+            "active_status": product.active_status,
+            "url_slug": product.url_slug,
+            "search_keywords": [tag.name for tag in product.search_keyword.all()],
+            "seo_title": seo.seo_title if seo else None,
+            "seo_keywords": [tag.name for tag in seo.seo_keyword.all()] if seo else [],
+            "meta_description": seo.meta_description if seo else None,
+            "generic_names": (
+                [generic.generic_name for generic in medicine_info.generic_name.all()]
+                if medicine_info
+                else []
+            ),
+            "therapeutic_class": (
+                medicine_info.therapeutic_class if medicine_info else None
+            ),
+            "is_required_prescription": (
+                medicine_info.is_required_prescription if medicine_info else None
+            ),
+        }
+
+    def get_row_chunks(self) -> Iterator[list[dict]]:
+        chunk: list[dict] = []
+        # The prefetches run once per chunk of the server-side cursor
+        for product in self.get_queryset().iterator(chunk_size=self.chunk_size):
+            chunk.append(self.get_row(product))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def get_encoded_chunks(self) -> Iterator[bytes]:
+        if self.file_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=PRODUCT_EXPORT_COLUMNS)
+            writer.writeheader()
+            for rows in self.get_row_chunks():
+                writer.writerows(
+                    {
+                        key: (
+                            CSV_LIST_SEPARATOR.join(value)
+                            if isinstance(value, list)
+                            else value
+                        )
+                        for key, value in row.items()
+                    }
+                    for row in rows
+                )
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            # A header only export still yields its header
+            if buffer.tell():
+                yield buffer.getvalue().encode()
+        else:
+            for rows in self.get_row_chunks():
+                yield "".join(
+                    json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n"
+                    for row in rows
+                ).encode()
+
+    def stream(self) -> Iterator[bytes]:
+        """
+        Yields the export file piece by piece, one piece per chunk of products.
+        """
+        if not self.compress:
+            yield from self.get_encoded_chunks()
+            return
+
+        compressor = zlib.compressobj(wbits=GZIP_WBITS)
+        for data in self.get_encoded_chunks():
+            compressed = compressor.compress(data)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    async def astream(self) -> AsyncIterator[bytes]:
+        """
+        ``stream()`` for ASGI, one ``sync_to_async`` call per piece.
+
+        Django hands a sync iterator to ``sync_to_async(list)`` under ASGI,
+        which would buffer the whole export. Every piece runs in the same
+        thread, the one holding the server-side cursor.
+        """
+        pieces = self.stream()
+        get_next_piece = sync_to_async(next, thread_sensitive=True)
+        while (data := await get_next_piece(pieces, None)) is not None:
+            yield data
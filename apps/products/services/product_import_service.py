@@ -0,0 +1,451 @@
+import csv
+import json
+import time
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from loguru import logger
+from pydantic import ValidationError as PydanticError
+
+from apps.common.functions.barcode_methods import get_generated_barcode
+from apps.common.functions.custom_id import get_generated_custom_ids
+from apps.common.functions.validator.name_validator import validate_special_character
+from apps.products.dataclasses.product_import_dataclass import (
+    ProductImportRowError,
+    ProductImportRowModel,
+    ProductImportSummary,
+)
+from apps.products.function.url_slug_method import get_generated_slug
+from apps.products.models import (
+    Brand,
+    Manufacturer,
+    Product,
+    SubCategory,
+    UnitAttributeValue,
+    Vat,
+)
+from apps.products.models.product_model import ProductBarcodeChoices
+from apps.products.services.product_search_service import (
+    set_product_search_documents,
+)
+
+PRODUCT_IMPORT_CHUNK_SIZE = 1000
+PRODUCT_IMPORT_FORMATS = ("csv", "jsonl")
+
+
+def get_import_rows(
+    file_path: str | Path,
+    file_format: str | None = None,
+) -> Iterator[tuple[int, dict | str]]:
+    """
+    Streams ``(line_number, row)`` pairs from a CSV or JSONL file.
+
+    A JSONL line that does not parse is yielded as its error message, so the
+    import reports it as a failed row and goes on with the next lines.
+
+    Args:
+        file_path (str | Path): The import file.
+        file_format (str | None): "csv" or "jsonl". Detected from the suffix if None.
+
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    file_path = Path(file_path)
+    file_format = (file_format or file_path.suffix.lstrip(".")).lower()
+    if file_format == "json":
+        file_format = "jsonl"
+
+    if file_format not in PRODUCT_IMPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported import format: {file_format}. Only allowed: {PRODUCT_IMPORT_FORMATS}"
+        )
+
+    with file_path.open(newline="", encoding="utf-8-sig") as import_file:
+        if file_format == "csv":
+            reader = csv.DictReader(import_file)
+            for row in reader:
+                # Empty CSV cells mean "not provided"
+                yield reader.line_num, {
+                    key: value.strip() or None if isinstance(value, str) else value
+                    for key, value in row.items()
+                }
+        else:
+            for line_number, line in enumerate(import_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as error:
+                    row = f"Invalid JSON: {error.msg} (column {error.colno})."
+                yield line_number, row
+
+
+def get_vat_key(vat_amount: Decimal) -> Decimal:
+    """
+    Normalizes a VAT amount so 5, 5.0 and 5.0000 resolve to the same Vat row.
+    """
+    return vat_amount.quantize(Decimal("0.0001"))
+
+
+# * <<-------------------------------------*** Product Import Service ***-------------------------------------->>
+class ProductImportService:
+    """
+    Streams a product catalog file into the database in chunks.
+
+    Rows are validated in memory against name/barcode/slug sets and lookup
+    dictionaries that are loaded once per import, then written with one
+    ``bulk_create`` per chunk plus one bulk insert into the sub-category
+    through table. ``Product.save()`` and its per-row ``full_clean()`` are
+    never called.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = PRODUCT_IMPORT_CHUNK_SIZE,
+        dry_run: bool = False,
+    ):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self._is_loaded = False
+
+    # Load every lookup the row validation needs with one query per table
+    def load_lookups(self) -> None:
+        self.existing_names: set[str] = set(
+            Product.objects.values_list("product_name", flat=True).iterator(
+                chunk_size=self.chunk_size * 10
+            )
+        )
+        self.existing_barcodes: set[str] = set(
+            Product.objects.exclude(barcode__isnull=True)
+            .values_list("barcode", flat=True)
+            .iterator(chunk_size=self.chunk_size * 10)
+        )
+        self.existing_slugs: set[str] = set(
+            Product.objects.exclude(url_slug__isnull=True)
+            .values_list("url_slug", flat=True)
+            .iterator(chunk_size=self.chunk_size * 10)
+        )
+        self.brand_ids: dict[str, int] = {
+            name.lower(): brand_id
+            for brand_id, name in Brand.objects.values_list("id", "brand_name")
+        }
+        self.manufacturer_ids: dict[str, int] = {
+            name.lower(): manufacturer_id
+            for manufacturer_id, name in Manufacturer.objects.values_list(
+                "id", "manufacturer_name"
+            )
+        }
+        self.vat_ids: dict[Decimal, int] = {
+            get_vat_key(amount): vat_id
+            for vat_id, amount in Vat.objects.exclude(
+                vat_amount__isnull=True
+            ).values_list("id", "vat_amount")
+        }
+        self.unit_ids: dict[tuple[str, str], int] = {
+            (attribute_name.lower(), unit_value.lower()): unit_id
+            for unit_id, unit_value, attribute_name in UnitAttributeValue.objects.values_list(
+                "id", "unit_value", "unit_attribute__attribute_name"
+            )
+        }
+        self.sub_category_ids: dict[str, int] = {
+            name.lower(): sub_category_id
+            for sub_category_id, name in SubCategory.objects.values_list(
+                "id", "sub_category_name"
+            )
+        }
+        self._is_loaded = True
+
+    def import_file(
+        self,
+        file_path: str | Path,
+        file_format: str | None = None,
+    ) -> ProductImportSummary:
+        """
+        Imports every row of a CSV or JSONL file and returns the import summary.
+        """
+        return self.import_rows(get_import_rows(file_path, file_format))
+
+    def import_rows(
+        self, rows: Iterable[tuple[int, dict | str]]
+    ) -> ProductImportSummary:
+        """
+        Imports ``(line_number, row)`` pairs chunk by chunk.
+        """
+        started_at = time.perf_counter()
+        summary = ProductImportSummary(dry_run=self.dry_run)
+
+        if not self._is_loaded:
+            self.load_lookups()
+
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_size)):
+            products, sub_category_links, line_numbers = self._get_validated_chunk(
+                chunk, summary
+            )
+            summary.total_rows += len(chunk)
+
+            if products and not self.dry_run:
+                summary.imported_rows += self._write_chunk(
+                    products, sub_category_links, line_numbers, summary
+                )
+            else:
+                summary.imported_rows += len(products)
+
+            logger.info(
+                f"INFO(ProductImportService):---->> {summary.total_rows} rows read, "
+                f"{summary.imported_rows} imported, {summary.failed_rows} failed"
+            )
+
+        summary.elapsed_seconds = time.perf_counter() - started_at
+        return summary
+
+    def _get_validated_chunk(
+        self,
+        chunk: list[tuple[int, dict | str]],
+        summary: ProductImportSummary,
+    ) -> tuple[list[Product], list[list[int]], list[int]]:
+        products: list[Product] = []
+        sub_category_links: list[list[int]] = []
+        line_numbers: list[int] = []
+
+        for line_number, raw_row in chunk:
+            if isinstance(raw_row, str):
+                self._add_error(summary, line_number, [raw_row])
+                continue
+            if not isinstance(raw_row, dict):
+                self._add_error(summary, line_number, ["A row must be a JSON object."])
+                continue
+
+            try:
+                # Missing values fall back to the row model defaults
+                row = ProductImportRowModel.model_validate(
+                    {key: value for key, value in raw_row.items() if value is not None}
+                )
+            except PydanticError as error:
+                self._add_error(
+                    summary,
+                    line_number,
+                    [
+                        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}"
+                        for item in error.errors()
+                    ],
+                )
+                continue
+
+            product, sub_category_ids, errors = self._get_product(row)
+            if errors:
+                self._add_error(summary, line_number, errors)
+                continue
+
+            # Reserve the unique values so later rows of the same file see them
+            self.existing_names.add(product.product_name)
+            if product.barcode:
+                self.existing_barcodes.add(product.barcode)
+            self.existing_slugs.add(product.url_slug)
+
+            products.append(product)
+            sub_category_links.append(sub_category_ids)
+            line_numbers.append(line_number)
+
+        return products, sub_category_links, line_numbers
+
+    def _get_product(
+        self, row: ProductImportRowModel
+    ) -> tuple[Product | None, list[int], list[str]]:
+        errors: list[str] = []
+
+        try:
+            validate_special_character(row.product_name, field_name="product_name")
+        except ValidationError as error:
+            errors.extend(error.messages)
+
+        if row.product_name in self.existing_names:
+            errors.append("Product name already exists.")
+
+        if row.barcode and row.barcode in self.existing_barcodes:
+            errors.append(f"Barcode {row.barcode} already exists.")
+
+        brand_id = self._get_lookup_id(self.brand_ids, row.brand, "Brand", errors)
+        manufacturer_id = self._get_lookup_id(
+            self.manufacturer_ids, row.manufacturer, "Manufacturer", errors
+        )
+        purchase_vat_id = self._get_vat_id(row.purchase_vat, errors)
+        sales_vat_id = self._get_vat_id(row.sales_vat, errors)
+
+        unit_id = None
+        if row.unit_value or row.unit_attribute:
+            unit_id = self.unit_ids.get(
+                ((row.unit_attribute or "").lower(), (row.unit_value or "").lower())
+            )
+            if unit_id is None:
+                errors.append(
+                    f"Unit {row.unit_value} {row.unit_attribute} does not exist."
+                )
+
+        sub_category_ids = []
+        for name in row.sub_categories:
+            sub_category_id = self._get_lookup_id(
+                self.sub_category_ids, name, "Sub-category", errors
+            )
+            if sub_category_id and sub_category_id not in sub_category_ids:
+                sub_category_ids.append(sub_category_id)
+
+        if errors:
+            return None, [], errors
+
+        product = Product(
+            product_name=row.product_name,
+            product_type=row.product_type,
+            image_alt_name=row.image_alt_name or row.product_name,
+            barcode_type=row.barcode_type,
+            barcode=row.barcode,
+            purchase_vat_id=purchase_vat_id,
+            sales_vat_id=sales_vat_id,
+            product_unit_id=unit_id,
+            brand_id=brand_id,
+            manufacturer_id=manufacturer_id,
+            url_slug=self._get_unique_slug(row),
+            description=row.description,
+            active_status=row.active_status,
+        )
+        return product, sub_category_ids, errors
+
+    @staticmethod
+    def _get_lookup_id(
+        lookup: dict[str, int],
+        name: str | None,
+        label: str,
+        errors: list[str],
+    ) -> int | None:
+        if not name:
+            return None
+
+        lookup_id = lookup.get(name.lower())
+        if lookup_id is None:
+            errors.append(f"{label} {name} does not exist.")
+        return lookup_id
+
+    def _get_vat_id(self, vat_amount: Decimal | None, errors: list[str]) -> int | None:
+        if vat_amount is None:
+            return None
+
+        vat_id = self.vat_ids.get(get_vat_key(vat_amount))
+        if vat_id is None:
+            errors.append(f"VAT {vat_amount} does not exist.")
+        return vat_id
+
+    def _get_unique_slug(self, row: ProductImportRowModel) -> str:
+        slug = get_generated_slug(row.product_name, row.unit_value, row.unit_attribute)
+        unique_slug, counter = slug, 1
+        while unique_slug in self.existing_slugs:
+            counter += 1
+            unique_slug = f"{slug}-{counter}"
+        return unique_slug
+
+    @staticmethod
+    def _add_error(
+        summary: ProductImportSummary,
+        line_number: int,
+        errors: list[str],
+    ) -> None:
+        summary.failed_rows += 1
+        summary.errors.append(
+            ProductImportRowError(line_number=line_number, errors=errors)
+        )
+
+    def _release_unique_values(self, product: Product) -> None:
+        # A row that is not written frees its name and slug for later rows
+        self.existing_names.discard(product.product_name)
+        self.existing_slugs.discard(product.url_slug)
+
+    def _write_chunk(
+        self,
+        products: list[Product],
+        sub_category_links: list[list[int]],
+        line_numbers: list[int],
+        summary: ProductImportSummary,
+    ) -> int:
+        """
+        Writes a validated chunk and returns the number of rows written.
+
+        A generated barcode that is already taken rejects its row, and a chunk
+        the database refuses is rolled back and reported row by row.
+        """
+        product_ids = get_generated_custom_ids(
+            id_prefix="PRO",
+            field="product_id",
+            model_class=Product,
+            count=len(products),
+        )
+        rows = []
+        for product, sub_category_ids, line_number, product_id in zip(
+            products, sub_category_links, line_numbers, product_ids
+        ):
+            product.product_id = product_id
+            if (
+                not product.barcode
+                and product.barcode_type == ProductBarcodeChoices.AUTO
+            ):
+                barcode = get_generated_barcode(product_id)
+                if barcode in self.existing_barcodes:
+                    self._add_error(
+                        summary,
+                        line_number,
+                        [f"Generated barcode {barcode} already exists."],
+                    )
+                    self._release_unique_values(product)
+                    continue
+                product.barcode = barcode
+                self.existing_barcodes.add(barcode)
+            rows.append((product, sub_category_ids, line_number))
+
+        if not rows:
+            return 0
+        products = [product for product, _, _ in rows]
+        sub_category_links = [sub_category_ids for _, sub_category_ids, _ in rows]
+
+        try:
+            self._insert_chunk(products, sub_category_links)
+        except IntegrityError as error:
+            # i.e. a barcode stored by another writer since the lookups were loaded
+            logger.error(f"ERROR(ProductImportService):---->> {error}")
+            for product, _, line_number in rows:
+                self._add_error(summary, line_number, [f"Not imported: {error}"])
+                self._release_unique_values(product)
+            return 0
+        return len(products)
+
+    def _insert_chunk(
+        self,
+        products: list[Product],
+        sub_category_links: list[list[int]],
+    ) -> None:
+        with transaction.atomic():
+            Product.objects.bulk_create(products, batch_size=self.chunk_size)
+
+            # Backends that cannot return bulk inserted keys need one lookup query
+            if any(product.pk is None for product in products):
+                pk_by_product_id = dict(
+                    Product.objects.filter(
+                        product_id__in=[product.product_id for product in products]
+                    ).values_list("product_id", "id")
+                )
+                for product in products:
+                    product.pk = pk_by_product_id[product.product_id]
+
+            SubCategoryLink = Product.sub_category.through
+            SubCategoryLink.objects.bulk_create(
+                [
+                    SubCategoryLink(
+                        product_id=product.pk, subcategory_id=sub_category_id
+                    )
+                    for product, sub_category_ids in zip(products, sub_category_links)
+                    for sub_category_id in sub_category_ids
+                ],
+                batch_size=self.chunk_size,
+            )
+            set_product_search_documents([product.pk for product in products])
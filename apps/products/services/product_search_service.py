@@ -0,0 +1,460 @@
+import heapq
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from functools import partial
+from math import log
+from uuid import uuid4
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from apps.common.models import ActiveStatusChoices
+from apps.products.models import Product, ProductSearchDocument, ProductSeo
+
+PRODUCT_SEARCH_CONFIG = "english"
+PRODUCT_SEARCH_DELETE_VERSION_KEY = "products:search:delete_version"
+PRODUCT_SEARCH_BATCH_SIZE = 1000
+PRODUCT_SEARCH_FIELDS = ("name_text", "keyword_text", "brand_text", "body_text")
+# Same ratios as the PostgreSQL default ts_rank weights {D, C, B, A}
+PRODUCT_SEARCH_WEIGHTS = {
+    "name_text": 1.0,
+    "keyword_text": 0.4,
+    "brand_text": 0.2,
+    "body_text": 0.1,
+}
+PRODUCT_SEARCH_STOP_WORDS = frozenset(
+    {"a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "is"}
+    | {"it", "of", "on", "or", "the", "this", "to", "with"}
+)
+STEM_SUFFIXES = (
+    "ations",
+    "ation",
+    "ments",
+    "ment",
+    "ings",
+    "ing",
+    "ness",
+    "ers",
+    "ed",
+    "er",
+    "es",
+    "ly",
+    "s",
+)
+TERM_PATTERN = re.compile(r"[^\W_]+")
+
+
+# * <<-------------------------------------*** Search Text Analysis ***-------------------------------------->>
+def get_stem(word: str) -> str:
+    """
+    Light English suffix stripping, i.e. "tablets" -> "tablet", "cooling" -> "cool".
+    """
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        return f"{word[:-3]}y"
+
+    for suffix in STEM_SUFFIXES:
+        if suffix == "s" and word.endswith("ss"):
+            break
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)]
+            break
+
+    # "capsule" and "capsules" share one stem
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def get_search_terms(text: str | None) -> list[str]:
+    """
+    Lower-cases, tokenizes and stems a text, dropping stop words.
+    """
+    if not text:
+        return []
+    return [
+        get_stem(word)
+        for word in TERM_PATTERN.findall(text.lower())
+        if word not in PRODUCT_SEARCH_STOP_WORDS
+    ]
+
+
+def get_edit_distance(source: str, target: str) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions).
+    """
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+    for i, source_char in enumerate(source, start=1):
+        current = [i] + [0] * len(target)
+        for j, target_char in enumerate(target, start=1):
+            cost = source_char != target_char
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if (
+                previous_previous is not None
+                and i > 1
+                and j > 1
+                and source_char == target[j - 2]
+                and source[i - 2] == target_char
+            ):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def get_max_edit_distance(term: str) -> int:
+    if len(term) <= 3:
+        return 0
+    if len(term) <= 7:
+        return 1
+    return 2
+
+
+def get_deletion_variants(term: str) -> set[str]:
+    # Single character deletions, the candidate keys of the typo index
+    return {term[:index] + term[index + 1 :] for index in range(len(term))}
+
+
+# * <<-------------------------------------*** Search Document Builder ***-------------------------------------->>
+def get_product_search_documents(
+    product_ids: Iterable[int],
+) -> list[ProductSearchDocument]:
+    """
+    Builds the search documents of a batch of products.
+
+    The query count is fixed per batch: products with brand and manufacturer
+    names, search keyword tags, SEO keyword tags and, when the medicines app
+    is installed, generic names.
+    """
+    product_ids = list(product_ids)
+    products = Product.objects.filter(id__in=product_ids).values_list(
+        "id",
+        "product_name",
+        "description",
+        "brand__brand_name",
+        "manufacturer__manufacturer_name",
+    )
+
+    keywords: dict[int, list[str]] = defaultdict(list)
+    TaggedItem = Product.search_keyword.through
+    for product_id, tag_name in TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Product),
+        object_id__in=product_ids,
+    ).values_list("object_id", "tag__name"):
+        keywords[product_id].append(tag_name)
+
+    product_id_by_seo_id = dict(
+        ProductSeo.objects.filter(product_id__in=product_ids).values_list(
+            "id", "product_id"
+        )
+    )
+    if product_id_by_seo_id:
+        for seo_id, tag_name in TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(ProductSeo),
+            object_id__in=list(product_id_by_seo_id),
+        ).values_list("object_id", "tag__name"):
+            keywords[product_id_by_seo_id[seo_id]].append(tag_name)
+
+    # Generic names are optional, the medicines app depends on products and not the other way
+    if apps.is_installed("apps.medicines"):
+        MedicineInfo = apps.get_model("medicines", "MedicineInfo")
+        for (
+            product_id,
+            generic_name,
+        ) in MedicineInfo.generic_name.through.objects.filter(
+            medicineinfo__product_id__in=product_ids
+        ).values_list(
+            "medicineinfo__product_id", "genericnameinformation__generic_name"
+        ):
+            keywords[product_id].append(generic_name)
+
+    return [
+        ProductSearchDocument(
+            product_id=product_id,
+            name_text=product_name or "",
+            keyword_text=" ".join(dict.fromkeys(keywords[product_id])),
+            brand_text=" ".join(filter(None, (brand_name, manufacturer_name))),
+            body_text=description or "",
+        )
+        for product_id, product_name, description, brand_name, manufacturer_name in products
+    ]
+
+
+def set_product_search_documents(product_ids: Iterable[int]) -> int:
+    """
+    Upserts the search documents of the given products in batches.
+
+    Returns:
+        int: The number of documents written.
+    """
+    product_ids = list(dict.fromkeys(product_ids))
+    written = 0
+    for start in range(0, len(product_ids), PRODUCT_SEARCH_BATCH_SIZE):
+        documents = get_product_search_documents(
+            product_ids[start : start + PRODUCT_SEARCH_BATCH_SIZE]
+        )
+        ProductSearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=["product"],
+            update_fields=[*PRODUCT_SEARCH_FIELDS, "updated_at"],
+        )
+        written += len(documents)
+    return written
+
+
+def schedule_product_search_refresh(
+    product_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Refreshes the search documents once the current transaction commits.
+    """
+    product_ids = [product_id for product_id in product_ids if product_id]
+    if product_ids:
+        transaction.on_commit(
+            partial(set_product_search_documents, product_ids), using=using
+        )
+
+
+def set_product_search_delete_version() -> str:
+    """
+    Tells every worker that search documents were deleted.
+    """
+    version = uuid4().hex
+    cache.set(PRODUCT_SEARCH_DELETE_VERSION_KEY, version, timeout=None)
+    return version
+
+
+# * <<-------------------------------------*** In-Process Search Index ***-------------------------------------->>
+class ProductSearchIndex:
+    """
+    In-memory inverted index over ``ProductSearchDocument`` for backends
+    without full-text search (SQLite).
+
+    Postings map a stemmed term to ``{product_id: weight}``; a single-deletion
+    neighbourhood of every term backs typo-tolerant lookups. At most once per
+    ``PRODUCT_SEARCH_SYNC_INTERVAL`` a search pulls the documents changed
+    since the last sync with one indexed query on ``updated_at``. Deletes
+    leave no row to sync from, they bump a cache version token instead and
+    a changed token reloads the index.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.postings: dict[str, dict[int, float]] = {}
+        self.document_terms: dict[int, tuple[str, ...]] = {}
+        self.variants: dict[str, set[str]] = defaultdict(set)
+        self.synced_at = None
+        self.delete_version = None
+        self.checked_at: float | None = None
+
+    def add_document(self, document: ProductSearchDocument) -> None:
+        self.remove_document(document.product_id)
+
+        weights: Counter = Counter()
+        for field in PRODUCT_SEARCH_FIELDS:
+            for term in get_search_terms(getattr(document, field)):
+                weights[term] += PRODUCT_SEARCH_WEIGHTS[field]
+
+        for term, weight in weights.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                for variant in get_deletion_variants(term):
+                    self.variants[variant].add(term)
+            self.postings[term][document.product_id] = weight
+        self.document_terms[document.product_id] = tuple(weights)
+
+    def remove_document(self, product_id: int) -> None:
+        for term in self.document_terms.pop(product_id, ()):
+            postings = self.postings[term]
+            postings.pop(product_id, None)
+            if not postings:
+                del self.postings[term]
+                for variant in get_deletion_variants(term):
+                    self.variants[variant].discard(term)
+
+    def sync(self) -> None:
+        now = time.monotonic()
+        if (
+            self.checked_at is not None
+            and now - self.checked_at < settings.PRODUCT_SEARCH_SYNC_INTERVAL
+        ):
+            return
+
+        # Read before the documents, a delete committed meanwhile reloads again
+        delete_version = cache.get(PRODUCT_SEARCH_DELETE_VERSION_KEY)
+        if delete_version != self.delete_version:
+            self.reset()
+            self.delete_version = delete_version
+        self.checked_at = now
+
+        documents = ProductSearchDocument.objects.order_by("updated_at")
+        if self.synced_at is not None:
+            # >= so rows sharing the last timestamp are never missed
+            documents = documents.filter(updated_at__gte=self.synced_at)
+
+        for document in documents.iterator(chunk_size=PRODUCT_SEARCH_BATCH_SIZE):
+            self.add_document(document)
+            self.synced_at = document.updated_at
+
+    def get_term_matches(self, term: str) -> dict[str, float]:
+        """
+        Returns the indexed terms matching a query term with their score factor.
+        """
+        matches = {term: 1.0} if term in self.postings else {}
+        max_distance = get_max_edit_distance(term)
+        if not max_distance:
+            return matches
+
+        candidates = set(self.variants.get(term, ()))
+        for variant in get_deletion_variants(term) | {term}:
+            candidates.update(self.variants.get(variant, ()))
+            if variant in self.postings:
+                candidates.add(variant)
+
+        for candidate in candidates - matches.keys():
+            distance = get_edit_distance(term, candidate)
+            if distance <= max_distance:
+                matches[candidate] = 1 / (1 + distance)
+        return matches
+
+    def search(self, query: str, limit: int) -> list[tuple[int, float]]:
+        """
+        Ranks documents matching every query term (exactly or within the typo budget).
+        """
+        terms = list(dict.fromkeys(get_search_terms(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            self.sync()
+            document_count = len(self.document_terms) or 1
+
+            scores: dict[int, float] | None = None
+            for term in terms:
+                term_scores: dict[int, float] = defaultdict(float)
+                for match, factor in self.get_term_matches(term).items():
+                    postings = self.postings[match]
+                    idf = log(1 + document_count / len(postings))
+                    for product_id, weight in postings.items():
+                        term_scores[product_id] = max(
+                            term_scores[product_id], weight * idf * factor
+                        )
+
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {
+                        product_id: score + term_scores[product_id]
+                        for product_id, score in scores.items()
+                        if product_id in term_scores
+                    }
+                if not scores:
+                    return []
+
+        return heapq.nlargest(
+            limit, scores.items(), key=lambda item: (item[1], item[0])
+        )
+
+
+product_search_index = ProductSearchIndex()
+# A forked worker must not share the parent's index state
+os.register_at_fork(after_in_child=product_search_index.reset)
+
+
+# * <<-------------------------------------*** Product Search ***-------------------------------------->>
+def get_postgres_search_results(
+    query: str, limit: int, using: str, active_only: bool = False
+) -> list[tuple[int, float]]:
+    # Full-text rank over the weighted tsvector plus trigram similarity on the
+    # name for misspelled queries; both predicates are served by GIN indexes.
+    active_join = (
+        "JOIN product ON product.id = document.product_id AND product.active_status = %s"
+        if active_only
+        else ""
+    )
+    sql = f"""
+        SELECT document.product_id,
+               ts_rank_cd(document.search_vector, search.query)
+               + similarity(document.name_text, %s) AS rank
+        FROM product_search_document AS document
+        {active_join}
+        CROSS JOIN websearch_to_tsquery(%s, %s) AS search(query)
+        WHERE document.search_vector @@ search.query
+           OR document.name_text %% %s
+        ORDER BY rank DESC, document.product_id DESC
+        LIMIT %s
+    """
+    params = [query, *([ActiveStatusChoices.ACTIVE.value] if active_only else [])]
+    params += [PRODUCT_SEARCH_CONFIG, query, query, limit]
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        return [(product_id, float(rank)) for product_id, rank in cursor.fetchall()]
+
+
+def get_active_index_search_results(
+    query: str, limit: int, using: str
+) -> list[tuple[int, float]]:
+    """
+    Searches the in-process index, fetching more hits until ``limit`` of them are active.
+    """
+    fetch_limit = limit
+    while True:
+        results = product_search_index.search(query, fetch_limit)
+        active_ids = set(
+            Product.objects.using(using)
+            .active()
+            .filter(id__in=[product_id for product_id, _ in results])
+            .values_list("id", flat=True)
+        )
+        active_results = [result for result in results if result[0] in active_ids]
+        if len(active_results) >= limit or len(results) < fetch_limit:
+            return active_results[:limit]
+        fetch_limit *= 2
+
+
+def search_products(
+    query: str,
+    limit: int = 20,
+    using: str = DEFAULT_DB_ALIAS,
+    active_only: bool = False,
+) -> list[tuple[int, float]]:
+    """
+    Searches the product search documents.
+
+    Uses PostgreSQL full-text search when available and the in-process
+    inverted index otherwise.
+
+    Args:
+        query (str): The user query, i.e. "napa extra 500".
+        limit (int): The maximum number of results.
+        using (str): The database alias.
+        active_only (bool): Only return active products, still up to ``limit`` of them.
+
+    Returns:
+        list[tuple[int, float]]: ``(product_id, rank)`` pairs, best match first.
+    """
+    query = query.strip()
+    if not query:
+        return []
+
+    if connections[using].vendor == "postgresql":
+        return get_postgres_search_results(query, limit, using, active_only)
+    if active_only:
+        return get_active_index_search_results(query, limit, using)
+    return product_search_index.search(query, limit)
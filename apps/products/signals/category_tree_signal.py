@@ -0,0 +1,37 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.products.function.category_tree_cache_method import (
+    set_category_tree_cache_version,
+)
+from apps.products.function.category_tree_method import set_deleted_node_children
+from apps.products.models import Category, SubCategory
+
+
+# * <<-------------------------------------*** Category Tree Delete Signal ***------------------------------------->>
+@receiver(pre_delete, sender=Category, dispatch_uid="category_tree_pre_delete")
+@receiver(pre_delete, sender=SubCategory, dispatch_uid="sub_category_tree_pre_delete")
+def category_tree_pre_delete(sender, instance, **kwargs):
+    """
+    Moves the children of a deleted category or sub-category up one level.
+    """
+    set_deleted_node_children(instance)
+
+
+# * <<-------------------------------------*** Category Tree Cache Signal ***------------------------------------->>
+@receiver(post_save, sender=Category, dispatch_uid="category_tree_cache_post_save")
+@receiver(
+    post_save, sender=SubCategory, dispatch_uid="sub_category_tree_cache_post_save"
+)
+@receiver(post_delete, sender=Category, dispatch_uid="category_tree_cache_post_delete")
+@receiver(
+    post_delete,
+    sender=SubCategory,
+    dispatch_uid="sub_category_tree_cache_post_delete",
+)
+def category_tree_cache_invalidate(sender, instance, **kwargs):
+    """
+    Invalidates the cached category tree once the change is committed.
+    """
+    transaction.on_commit(set_category_tree_cache_version)
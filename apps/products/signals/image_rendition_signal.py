@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.products.services.image_rendition_service import (
+    schedule_instance_images,
+)
+
+
+# * <<-------------------------------------*** Image Rendition Signal ***------------------------------------->>
+@receiver(post_save, dispatch_uid="image_rendition_post_save")
+def image_rendition_post_save(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Queues the validation and rendering of a saved model's ``rendition_image_fields``.
+
+    Images that already have their renditions are skipped with one storage lookup.
+    """
+    if raw or not getattr(sender, "rendition_image_fields", ()):
+        return
+    schedule_instance_images(instance, using=using)
@@ -0,0 +1,64 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common.models import ActiveStatusChoices
+from apps.products.models import Product
+from apps.products.services.product_autocomplete_service import (
+    AutocompleteTypeChoices,
+    product_autocomplete_index,
+    set_autocomplete_cache_version,
+)
+
+
+def set_autocomplete_item(item_type: str, item_id: int, name: str | None) -> None:
+    product_autocomplete_index.set_item(item_type, item_id, name)
+    set_autocomplete_cache_version()
+
+
+# * <<-------------------------------------*** Product Autocomplete Signal ***------------------------------------->>
+@receiver(post_save, sender=Product, dispatch_uid="product_autocomplete_post_save")
+@receiver(
+    post_save,
+    sender="medicines.GenericNameInformation",
+    dispatch_uid="generic_name_autocomplete_post_save",
+)
+def autocomplete_post_save(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Adds, renames or drops a product or generic name once the save commits.
+    """
+    if raw:
+        return
+
+    if sender is Product:
+        item_type, name = AutocompleteTypeChoices.PRODUCT, instance.product_name
+    else:
+        item_type, name = AutocompleteTypeChoices.GENERIC_NAME, instance.generic_name
+    if instance.active_status != ActiveStatusChoices.ACTIVE:
+        name = None
+
+    transaction.on_commit(
+        partial(set_autocomplete_item, item_type, instance.pk, name), using=using
+    )
+
+
+@receiver(post_delete, sender=Product, dispatch_uid="product_autocomplete_post_delete")
+@receiver(
+    post_delete,
+    sender="medicines.GenericNameInformation",
+    dispatch_uid="generic_name_autocomplete_post_delete",
+)
+def autocomplete_post_delete(sender, instance, using=None, **kwargs):
+    """
+    Drops a deleted product or generic name once the delete commits.
+    """
+    item_type = (
+        AutocompleteTypeChoices.PRODUCT
+        if sender is Product
+        else AutocompleteTypeChoices.GENERIC_NAME
+    )
+    transaction.on_commit(
+        partial(set_autocomplete_item, item_type, instance.pk, None), using=using
+    )
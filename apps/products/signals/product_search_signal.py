@@ -0,0 +1,138 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.products.models import Brand, Manufacturer, Product, ProductSeo
+from apps.products.services.product_search_service import (
+    schedule_product_search_refresh,
+    set_product_search_delete_version,
+)
+
+M2M_CHANGED_ACTIONS = ("post_add", "post_remove", "post_clear")
+TaggedItem = Product.search_keyword.through
+
+
+# * <<-------------------------------------*** Product Search Document Signal ***------------------------------------->>
+@receiver(post_save, sender=Product, dispatch_uid="product_search_post_save")
+def product_search_post_save(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Refreshes the search document of a saved product.
+    """
+    if not raw:
+        schedule_product_search_refresh([instance.pk], using=using)
+
+
+@receiver(post_delete, sender=Product, dispatch_uid="product_search_post_delete")
+def product_search_post_delete(sender, instance, using=None, **kwargs):
+    """
+    Drops the deleted product from every search index once the delete commits.
+    """
+    transaction.on_commit(set_product_search_delete_version, using=using)
+
+
+@receiver(post_save, sender=ProductSeo, dispatch_uid="product_seo_search_post_save")
+@receiver(post_delete, sender=ProductSeo, dispatch_uid="product_seo_search_post_delete")
+@receiver(
+    post_save,
+    sender="medicines.MedicineInfo",
+    dispatch_uid="medicine_info_search_post_save",
+)
+@receiver(
+    post_delete,
+    sender="medicines.MedicineInfo",
+    dispatch_uid="medicine_info_search_post_delete",
+)
+def product_relation_search_changed(sender, instance, raw=False, using=None, **kwargs):
+    """
+    Refreshes the search document of the product an SEO or medicine record belongs to.
+    """
+    if not raw:
+        schedule_product_search_refresh([instance.product_id], using=using)
+
+
+@receiver(m2m_changed, sender=TaggedItem, dispatch_uid="product_search_tags_changed")
+def product_search_tags_changed(sender, instance, action, using=None, **kwargs):
+    """
+    Refreshes the search document when product or SEO keywords change.
+    """
+    if action not in M2M_CHANGED_ACTIONS:
+        return
+
+    if isinstance(instance, Product):
+        schedule_product_search_refresh([instance.pk], using=using)
+    elif isinstance(instance, ProductSeo):
+        schedule_product_search_refresh([instance.product_id], using=using)
+
+
+@receiver(post_save, sender=Brand, dispatch_uid="brand_search_post_save")
+@receiver(post_save, sender=Manufacturer, dispatch_uid="manufacturer_search_post_save")
+def product_search_owner_post_save(
+    sender, instance, created, raw=False, using=None, **kwargs
+):
+    """
+    Refreshes the search documents of every product of a renamed brand or manufacturer.
+    """
+    if created or raw:
+        return
+
+    relation = "brand" if sender is Brand else "manufacturer"
+    schedule_product_search_refresh(
+        Product.objects.filter(**{relation: instance}).values_list("id", flat=True),
+        using=using,
+    )
+
+
+# * <<-------------------------------------*** Generic Name Search Signal ***------------------------------------->>
+@receiver(
+    m2m_changed,
+    sender="medicines.MedicineInfo_generic_name",
+    dispatch_uid="medicine_generic_name_search_changed",
+)
+def medicine_generic_name_search_changed(
+    sender, instance, action, reverse, pk_set, using=None, **kwargs
+):
+    """
+    Refreshes the search documents when generic names are linked or unlinked.
+    """
+    if not reverse:
+        if action in M2M_CHANGED_ACTIONS:
+            schedule_product_search_refresh([instance.product_id], using=using)
+        return
+
+    # Changed from the generic name side, pk_set holds medicine ids
+    MedicineInfo = apps.get_model("medicines", "MedicineInfo")
+    if action == "pre_clear":
+        # The links are gone after the clear, collect the affected products first
+        medicines = MedicineInfo.objects.filter(generic_name=instance)
+    elif action in ("post_add", "post_remove"):
+        medicines = MedicineInfo.objects.filter(id__in=pk_set)
+    else:
+        return
+
+    schedule_product_search_refresh(
+        medicines.values_list("product_id", flat=True), using=using
+    )
+
+
+@receiver(
+    post_save,
+    sender="medicines.GenericNameInformation",
+    dispatch_uid="generic_name_search_post_save",
+)
+def generic_name_search_post_save(
+    sender, instance, created, raw=False, using=None, **kwargs
+):
+    """
+    Refreshes the search documents of every product of a renamed generic name.
+    """
+    if created or raw:
+        return
+
+    MedicineInfo = apps.get_model("medicines", "MedicineInfo")
+    schedule_product_search_refresh(
+        MedicineInfo.objects.filter(generic_name=instance).values_list(
+            "product_id", flat=True
+        ),
+        using=using,
+    )
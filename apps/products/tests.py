@@ -1,2 +1,883 @@
+import io
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.http import StreamingHttpResponse
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from apps.common.functions.background_job import (
+    get_task_path,
+    run_background_job,
+)
+from apps.common.functions.barcode_methods import get_generated_barcode
+from apps.common.functions.custom_id import (
+    CUSTOM_ID_DATE_FORMAT,
+    custom_id_allocator,
+)
+from apps.common.models import (
+    ActiveStatusChoices,
+    BackgroundJob,
+    BackgroundJobStatusChoices,
+    ImageStatusChoices,
+)
+from apps.products.models import (
+    Brand,
+    Category,
+    Manufacturer,
+    Product,
+    ProductImageGallery,
+    ProductSeo,
+    SubCategory,
+    UnitAttribute,
+    UnitAttributeValue,
+    VariationAttribute,
+    VariationAttributeValue,
+    Vat,
+)
+from apps.products.models.product_model import ProductBarcodeChoices
+from apps.products.serializers.product_serializer import ProductSerializer
+from apps.products.services.catalog_seed_service import CatalogSeedService
+from apps.products.services.image_rendition_service import (
+    get_last_rendition_name,
+    get_rendition_formats,
+    get_rendition_name,
+    get_rendition_storage,
+    process_stored_image,
+)
+from apps.products.services.product_autocomplete_service import (
+    AutocompleteTypeChoices,
+    PrefixIndex,
+    ProductAutocompleteIndex,
+    set_autocomplete_cache_version,
+)
+from apps.products.services.product_export_service import ProductExportService
+from apps.products.services.product_import_service import ProductImportService
+from apps.products.services.product_search_service import (
+    product_search_index,
+    search_products,
+    set_product_search_documents,
+)
+
+
+# * <<-------------------------------------*** Product Listing Query Count Test ***-------------------------------------->>
+class ProductListingQueryCountTest(TestCase):
+    """
+    A product page must cost a fixed number of queries whatever its size.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        brand = Brand.objects.bulk_create([Brand(brand_name="Square")])[0]
+        manufacturer = Manufacturer.objects.bulk_create(
+            [Manufacturer(manufacturer_name="Square Pharmaceuticals")]
+        )[0]
+        purchase_vat, sales_vat = Vat.objects.bulk_create(
+            [Vat(vat_amount=Decimal("5")), Vat(vat_amount=Decimal("7.5"))]
+        )
+        unit_attribute = UnitAttribute.objects.bulk_create(
+            [UnitAttribute(attribute_name="mg")]
+        )[0]
+        product_unit = UnitAttributeValue.objects.bulk_create(
+            [UnitAttributeValue(unit_attribute=unit_attribute, unit_value="500")]
+        )[0]
+        category = Category.objects.create(category_name="Medicine")
+        sub_categories = [
+            SubCategory.objects.create(category=category, sub_category_name=name)
+            for name in ("Pain Relief", "Fever")
+        ]
+
+        Product.objects.bulk_create(
+            [
+                Product(
+                    product_id=f"PRO{index:04d}",
+                    product_name=f"Napa {index}",
+                    image_alt_name=f"Napa {index}",
+                    purchase_vat=purchase_vat,
+                    sales_vat=sales_vat,
+                    product_unit=product_unit,
+                    brand=brand,
+                    manufacturer=manufacturer,
+                    description="Paracetamol " * 50,
+                )
+                for index in range(50)
+            ]
+        )
+        products = Product.objects.order_by("id")
+        SubCategoryLink = Product.sub_category.through
+        SubCategoryLink.objects.bulk_create(
+            [
+                SubCategoryLink(product_id=product.id, subcategory_id=sub_category.id)
+                for product in products
+                for sub_category in sub_categories
+            ]
+        )
+        for product in products:
+            product.search_keyword.add("fever", "pain")
+
+    def get_page_data(self, size, fields=None):
+        queryset = Product.objects.for_listing(fields)[:size]
+        return ProductSerializer(queryset, many=True, fields=fields).data
+
+    def test_listing_query_count_does_not_depend_on_page_size(self):
+        # One joined SELECT plus the sub-category and search keyword prefetches
+        with self.assertNumQueries(3):
+            small_page = self.get_page_data(5)
+        with self.assertNumQueries(3):
+            full_page = self.get_page_data(50)
+
+        self.assertEqual(len(small_page), 5)
+        self.assertEqual(len(full_page), 50)
+        self.assertEqual(full_page[0]["brand_name"], "Square")
+        self.assertEqual(full_page[0]["unit_attribute_name"], "mg")
+        self.assertEqual(len(full_page[0]["sub_category"]), 2)
+        self.assertEqual(sorted(full_page[0]["search_keyword"]), ["fever", "pain"])
+
+    def test_listing_projection_reads_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            page = self.get_page_data(50, fields="id,product_name,brand_name")
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("description", queries[0]["sql"])
+        self.assertEqual(set(page[0]), {"id", "product_name", "brand_name"})
+
+    def test_rendition_links_come_from_the_image_status(self):
+        ready_ids = list(
+            Product.objects.order_by("id").values_list("id", flat=True)[:25]
+        )
+        Product.objects.update(product_image="product/napa.png")
+        Product.objects.filter(id__in=ready_ids).update(
+            image_status=ImageStatusChoices.READY
+        )
+
+        # No file is stored, the links are built without asking the storage
+        with self.assertNumQueries(1):
+            page = self.get_page_data(50, fields="id,product_image_renditions")
+
+        size = next(iter(settings.IMAGE_RENDITION_SIZES))
+        file_format = next(iter(get_rendition_formats()))
+        for row in page:
+            url = row["product_image_renditions"][size][file_format]
+            if row["id"] in ready_ids:
+                self.assertEqual(
+                    url,
+                    get_rendition_storage().url(
+                        get_rendition_name("product/napa.png", size, file_format)
+                    ),
+                )
+            else:
+                self.assertEqual(
+                    url,
+                    reverse(
+                        "image_rendition",
+                        kwargs={
+                            "size": size,
+                            "file_format": file_format,
+                            "name": "product/napa.png",
+                        },
+                    ),
+                )
+
+    def test_active_listing_skips_inactive_products(self):
+        inactive_ids = list(
+            Product.objects.order_by("id").values_list("id", flat=True)[:10]
+        )
+        Product.objects.filter(id__in=inactive_ids).update(
+            active_status=ActiveStatusChoices.INACTIVE
+        )
+
+        active_ids = set(
+            Product.objects.for_listing("id").active().values_list("id", flat=True)
+        )
+
+        self.assertEqual(len(active_ids), 40)
+        self.assertFalse(active_ids & set(inactive_ids))
+
+
+# * <<-------------------------------------*** Unique Name Constraint Test ***-------------------------------------->>
+class UniqueNameConstraintTest(TestCase):
+    """
+    A name differing only by case is reported on its field, from the database constraint.
+    """
+
+    def test_case_variant_name_is_a_field_error(self):
+        Brand(brand_name="Napa").save()
+
+        with self.assertRaises(ValidationError) as context:
+            Brand(brand_name="napa").save()
+        self.assertEqual(
+            context.exception.message_dict,
+            {"brand_name": ["A brand with this name already exists."]},
+        )
+
+    def test_case_variant_is_unique_within_its_scope(self):
+        color, size = VariationAttribute.objects.bulk_create(
+            [
+                VariationAttribute(attribute_name="Color"),
+                VariationAttribute(attribute_name="Size"),
+            ]
+        )
+        VariationAttributeValue(variation_attribute=color, attribute_value="Red").save()
+        # The same value under another attribute is not a duplicate
+        VariationAttributeValue(variation_attribute=size, attribute_value="red").save()
+
+        with self.assertRaises(ValidationError) as context:
+            VariationAttributeValue(
+                variation_attribute=color, attribute_value="RED"
+            ).save()
+        self.assertEqual(list(context.exception.message_dict), ["attribute_value"])
+
+
+# * <<-------------------------------------*** Batch Validation Test ***-------------------------------------->>
+class BatchValidationTest(TestCase):
+    """
+    A batch is validated with a query per rule, and agrees with the database constraints.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.color = VariationAttribute.objects.bulk_create(
+            [VariationAttribute(attribute_name="Color")]
+        )[0]
+        VariationAttributeValue.objects.bulk_create(
+            [
+                VariationAttributeValue(
+                    variation_attribute=cls.color, attribute_value="Blue"
+                )
+            ]
+        )
+
+    def get_values(self, *names: str, attribute_id=None) -> list:
+        return [
+            VariationAttributeValue(
+                variation_attribute_id=attribute_id or self.color.id,
+                attribute_value=name,
+            )
+            for name in names
+        ]
+
+    def test_one_query_per_rule_whatever_the_batch_size(self):
+        names = [f"Shade {index}" for index in range(50)]
+        # The foreign key, then lowering the batch and the case-insensitive lookup
+        with self.assertNumQueries(3):
+            errors = VariationAttributeValue.validate_many(self.get_values(*names))
+        self.assertEqual(errors, {})
+
+    def test_duplicates_in_the_batch_and_in_the_table(self):
+        stored = VariationAttributeValue.objects.get(attribute_value="Blue")
+        stored.attribute_value = "BLUE"
+
+        errors = VariationAttributeValue.validate_many(
+            [stored, *self.get_values("Red", "RED", "Gr@y")]
+        )
+
+        # A stored row renamed in the batch is not its own duplicate
+        self.assertEqual(sorted(errors), [2, 3])
+        self.assertIn(NON_FIELD_ERRORS, errors[2])
+        self.assertEqual(list(errors[3]), ["attribute_value"])
+        self.assertEqual(
+            list(VariationAttributeValue.validate_many(self.get_values("blue"))), [0]
+        )
+
+    def test_missing_foreign_key_and_exclude(self):
+        values = self.get_values("Red", attribute_id=999_999)
+
+        errors = VariationAttributeValue.validate_many(values)
+        self.assertEqual(list(errors[0]), ["variation_attribute"])
+        self.assertEqual(
+            VariationAttributeValue.validate_many(
+                values, exclude={"variation_attribute"}
+            ),
+            {},
+        )
+
+    def test_case_folding_matches_the_constraint(self):
+        VariationAttributeValue.objects.bulk_create(self.get_values("ÜBER"))
+
+        # Whatever the database folds, the batch check and the constraint agree
+        for name in ("Über", "über", "ÜBER"):
+            with self.subTest(name=name):
+                has_error = bool(
+                    VariationAttributeValue.validate_many(self.get_values(name))
+                )
+                try:
+                    with transaction.atomic():
+                        VariationAttributeValue.objects.bulk_create(
+                            self.get_values(name)
+                        )
+                        transaction.set_rollback(True)
+                    is_rejected = False
+                except IntegrityError:
+                    is_rejected = True
+                self.assertEqual(has_error, is_rejected)
+
+
+# * <<-------------------------------------*** Catalog Seed Service Test ***-------------------------------------->>
+class CatalogSeedServiceTest(TestCase):
+    """
+    The seeded rows must link up as if they were written through the ORM.
+    """
+
+    def test_seeded_products_are_linked_and_deterministic(self):
+        summary = CatalogSeedService(
+            products=120, seed=7, chunk_size=50, with_images=False
+        ).seed_catalog()
+        names = list(
+            Product.objects.order_by("product_id").values_list(
+                "product_name", flat=True
+            )
+        )
+
+        self.assertEqual(summary.rows["product"], 120)
+        self.assertEqual(ProductSeo.objects.count(), 120)
+        self.assertFalse(Product.objects.filter(sub_category=None).exists())
+        self.assertFalse(Product.objects.filter(created_at=None).exists())
+        with self.assertRaises(ValueError):
+            CatalogSeedService(products=1).seed_catalog()
+
+        Product.objects.all().delete()
+        CatalogSeedService(products=120, seed=7, with_images=False).seed_catalog()
+        self.assertEqual(
+            list(
+                Product.objects.order_by("product_id").values_list(
+                    "product_name", flat=True
+                )
+            ),
+            names,
+        )
+
+
+# * <<-------------------------------------*** Category Tree Path Test ***-------------------------------------->>
+class CategoryTreePathTest(TestCase):
+    """
+    Moving or deleting a node must keep the paths and depths of its subtree in step.
+    """
+
+    def setUp(self):
+        self.a = Category.objects.create(category_name="A")
+        self.b = Category.objects.create(category_name="B", parent_id=self.a.id)
+        self.c = Category.objects.create(category_name="C", parent_id=self.b.id)
+        self.s1 = SubCategory.objects.create(category=self.c, sub_category_name="S1")
+        self.s2 = SubCategory.objects.create(
+            category=self.c, sub_category_name="S2", parent_id=self.s1.id
+        )
+
+    def get_node(self, node):
+        node.refresh_from_db()
+        return node.tree_path, node.tree_depth
+
+    def test_moving_a_category_moves_its_subtree(self):
+        self.b.parent_id = 0
+        self.b.save()
+
+        self.assertEqual(self.get_node(self.b), (f"c{self.b.id}/", 0))
+        self.assertEqual(self.get_node(self.c), (f"c{self.b.id}/c{self.c.id}/", 1))
+        self.assertEqual(
+            self.get_node(self.s2),
+            (f"c{self.b.id}/c{self.c.id}/s{self.s1.id}/s{self.s2.id}/", 3),
+        )
+
+    def test_deleting_a_sub_category_re_parents_its_children(self):
+        self.s1.delete()
+
+        self.s2.refresh_from_db()
+        self.assertEqual(self.s2.parent_id, 0)
+        self.assertEqual(
+            self.get_node(self.s2),
+            (f"c{self.a.id}/c{self.b.id}/c{self.c.id}/s{self.s2.id}/", 3),
+        )
+
+    def test_deleting_a_root_category_moves_its_children_up(self):
+        # A stale in-memory parent must not be written to the children
+        stale = Category.objects.get(id=self.b.id)
+        stale.parent_id = self.c.id
+        Category.objects.get(id=self.a.id).delete()
+        self.assertEqual(self.get_node(self.b), (f"c{self.b.id}/", 0))
+        stale.delete()
+
+        self.c.refresh_from_db()
+        self.assertEqual(self.c.parent_id, 0)
+        self.assertEqual(self.get_node(self.c), (f"c{self.c.id}/", 0))
+        self.assertEqual(
+            self.get_node(self.s2), (f"c{self.c.id}/s{self.s1.id}/s{self.s2.id}/", 2)
+        )
+
+
+# * <<-------------------------------------*** Image Rendition Job Test ***-------------------------------------->>
+@override_settings(BACKGROUND_JOBS_EAGER=True)
+class ImageRenditionJobTest(TestCase):
+    """
+    Every gallery upload must leave the pending status, deduplicated or not.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.product = Product.objects.bulk_create(
+            [Product(product_id="PROIMG", product_name="Napa", image_alt_name="Napa")]
+        )[0]
+
+    def get_upload(self, size: tuple[int, int] = (200, 200)) -> SimpleUploadedFile:
+        buffer = io.BytesIO()
+        Image.new("RGB", size, "teal").save(buffer, "PNG")
+        return SimpleUploadedFile("napa.png", buffer.getvalue())
+
+    def get_rendition(self, size: tuple[int, int]):
+        name = default_storage.save("product/napa.png", self.get_upload(size))
+        url = reverse(
+            "image_rendition",
+            kwargs={
+                "size": next(iter(settings.IMAGE_RENDITION_SIZES)),
+                "file_format": next(iter(get_rendition_formats())),
+                "name": name,
+            },
+        )
+        return name, self.client.get(url)
+
+    def create_gallery_image(self) -> ProductImageGallery:
+        with self.captureOnCommitCallbacks(execute=True):
+            gallery = ProductImageGallery.objects.create(
+                product=self.product, product_image=self.get_upload()
+            )
+        gallery.refresh_from_db()
+        return gallery
+
+    def test_deduplicated_upload_is_marked_ready(self):
+        first = self.create_gallery_image()
+        second = self.create_gallery_image()
+
+        self.assertEqual(first.product_image.name, second.product_image.name)
+        self.assertEqual(first.image_status, ImageStatusChoices.READY)
+        self.assertEqual(second.image_status, ImageStatusChoices.READY)
+
+    def test_missing_rendition_is_queued_not_rendered(self):
+        name, response = self.get_rendition((200, 200))
+        self.get_rendition((200, 200))
+
+        self.assertRedirects(
+            response, default_storage.url(name), fetch_redirect_response=False
+        )
+        last_rendition_name = get_last_rendition_name(name)
+        self.assertFalse(get_rendition_storage().exists(last_rendition_name))
+        jobs = BackgroundJob.objects.filter(
+            task=get_task_path(process_stored_image), payload={"name": name}
+        )
+        self.assertEqual(jobs.count(), 1)
+
+        run_background_job(jobs.get().id)
+        self.assertTrue(get_rendition_storage().exists(last_rendition_name))
+
+    def test_failed_image_is_only_retried_by_force(self):
+        name, _ = self.get_rendition((200, 200))
+        jobs = BackgroundJob.objects.filter(
+            task=get_task_path(process_stored_image), payload={"name": name}
+        )
+        jobs.update(status=BackgroundJobStatusChoices.FAILED)
+
+        self.get_rendition((200, 200))
+        self.assertEqual(jobs.count(), 1)
+
+        call_command("generate_image_renditions", "--force", stdout=io.StringIO())
+        self.assertFalse(jobs.exists())
+        self.assertTrue(get_rendition_storage().exists(get_last_rendition_name(name)))
+
+    def test_rejected_image_has_no_rendition(self):
+        _, response = self.get_rendition((20, 20))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(BackgroundJob.objects.exists())
+
+
+# * <<-------------------------------------*** Product Save Test ***-------------------------------------->>
+@override_settings(BACKGROUND_JOBS_EAGER=True)
+class ProductSaveTest(TestCase):
+    """
+    A product saved through the ORM runs its validation, upload sniffing and image job.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def test_product_is_saved_through_save(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (200, 200), "teal").save(buffer, "PNG")
+        product = Product(
+            product_name="Napa Extra",
+            image_alt_name="Napa Extra",
+            barcode_type=ProductBarcodeChoices.AUTO,
+            product_image=SimpleUploadedFile("napa.png", buffer.getvalue()),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+        product.refresh_from_db()
+        self.assertTrue(product.product_id.startswith("PRO"))
+        self.assertEqual(product.url_slug, "napa-extra")
+        self.assertIsNotNone(product.barcode)
+        self.assertTrue(
+            get_rendition_storage().exists(
+                get_last_rendition_name(product.product_image.name)
+            )
+        )
+        # Saving again is an update, not a duplicate name
+        product.description = "Paracetamol"
+        product.save()
+
+        spoofed = Product(
+            product_name="Ace",
+            image_alt_name="Ace",
+            product_image=SimpleUploadedFile("ace.png", b"not an image"),
+        )
+        with self.assertRaises(ValidationError) as context:
+            spoofed.save()
+        self.assertIn("product_image", context.exception.message_dict)
+
+
+# * <<-------------------------------------*** Product Export Stream Test ***-------------------------------------->>
+class ProductExportStreamTest(TestCase):
+    """
+    Under ASGI the export must reach the client piece by piece, never buffered whole.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Product.objects.bulk_create(
+            [
+                Product(
+                    product_id=f"PROEXP{index}",
+                    product_name=f"Export {index}",
+                    image_alt_name="",
+                )
+                for index in range(5)
+            ]
+        )
+        cls.admin = get_user_model().objects.create_user(
+            username="exporter", is_staff=True
+        )
+
+    async def test_async_stream_yields_one_piece_per_chunk(self):
+        pieces = await sync_to_async(list)(
+            ProductExportService(file_format="jsonl", chunk_size=2).stream()
+        )
+        response = StreamingHttpResponse(
+            ProductExportService(file_format="jsonl", chunk_size=2).astream()
+        )
+
+        self.assertTrue(response.is_async)
+        self.assertEqual([piece async for piece in response], pieces)
+        self.assertEqual(len(pieces), 3)
+
+    async def test_asgi_export_is_async_streamed(self):
+        await self.async_client.aforce_login(self.admin)
+        response = await self.async_client.get(
+            reverse("product_export"), {"file_format": "jsonl"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        content = b"".join([piece async for piece in response.streaming_content])
+        self.assertEqual(content.count(b"\n"), 5)
+
+
+# * <<-------------------------------------*** Product Autocomplete Index Test ***-------------------------------------->>
+class PrefixIndexTest(SimpleTestCase):
+    """
+    Names match by their start or a word start, whole name matches first.
+    """
+
+    def setUp(self):
+        self.index = PrefixIndex.from_items(
+            [
+                ("product", 1, "Napa Extra"),
+                ("product", 2, "Napa"),
+                ("product", 3, "Ace Napa-Plus"),
+                ("generic_name", 4, "Naproxen"),
+                ("product", 5, "Seclo 20 mg Capsule"),
+            ]
+        )
+
+    def get_names(self, prefix: str, **kwargs) -> list[str]:
+        return [item["name"] for item in self.index.search(prefix, 10, **kwargs)]
+
+    def test_name_matches_rank_before_word_matches(self):
+        self.assertEqual(
+            self.get_names("NAP"), ["Napa", "Naproxen", "Napa Extra", "Ace Napa-Plus"]
+        )
+        self.assertEqual(self.get_names("napa plus"), ["Ace Napa-Plus"])
+        self.assertEqual(
+            self.index.search("nap", 2)[0], {"id": 2, "type": "product", "name": "Napa"}
+        )
+
+    def test_only_the_first_word_starts_are_keys(self):
+        self.assertEqual(self.get_names("20 mg"), ["Seclo 20 mg Capsule"])
+        self.assertEqual(self.get_names("mg"), ["Seclo 20 mg Capsule"])
+        # Past MAX_WORD_KEYS word starts
+        self.assertEqual(self.get_names("capsule"), [])
+
+    def test_type_filter(self):
+        self.assertEqual(self.get_names("nap", item_type="generic_name"), ["Naproxen"])
+
+    def test_add_renames_and_remove_drops(self):
+        self.index.add("product", 2, "Paracetamol")
+        self.index.remove("product", 1)
+        self.index.remove("product", 99)
+
+        self.assertEqual(self.get_names("nap"), ["Naproxen", "Ace Napa-Plus"])
+        self.assertEqual(self.get_names("para"), ["Paracetamol"])
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(len(self.index.entries), len(set(self.index.entries)))
+
+
+# * <<-------------------------------------*** Product Autocomplete Index Test ***-------------------------------------->>
+@override_settings(PRODUCT_AUTOCOMPLETE_SYNC_INTERVAL=0)
+class ProductAutocompleteIndexTest(TransactionTestCase):
+    """
+    The index is built off the request path and follows the changes committed since.
+    """
+
+    def create_product(self, product_id: str, product_name: str) -> Product:
+        return Product.objects.bulk_create(
+            [
+                Product(
+                    product_id=product_id, product_name=product_name, image_alt_name=""
+                )
+            ]
+        )[0]
+
+    def test_first_search_does_not_wait_for_the_build(self):
+        Product.objects.bulk_create(
+            [
+                Product(
+                    product_id="PRONAPA", product_name="Napa Extra", image_alt_name=""
+                )
+            ]
+        )
+        index = ProductAutocompleteIndex()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(index.search("nap"), [])
+        index.rebuild_thread.join(timeout=10)
+
+        self.assertEqual([item["name"] for item in index.search("nap")], ["Napa Extra"])
+
+    def test_sync_applies_rows_changed_elsewhere(self):
+        napa = self.create_product("PRONAPA", "Napa")
+        ace = self.create_product("PROACE", "Ace")
+        index = ProductAutocompleteIndex()
+        index.build()
+
+        # Saved by another worker, update() leaves updated_at to the caller
+        changed_at = timezone.now() + timedelta(seconds=1)
+        Product.objects.filter(id=napa.id).update(
+            product_name="Napa Extra", updated_at=changed_at
+        )
+        Product.objects.filter(id=ace.id).update(
+            active_status=ActiveStatusChoices.INACTIVE, updated_at=changed_at
+        )
+        set_autocomplete_cache_version()
+
+        self.assertEqual(
+            [item["name"] for item in index.search("napa")], ["Napa Extra"]
+        )
+        self.assertEqual(index.search("ace"), [])
+
+    def test_delete_committed_during_a_build_is_kept(self):
+        napa = self.create_product("PRONAPA", "Napa")
+
+        class DeleteDuringBuildIndex(ProductAutocompleteIndex):
+            def load_items(self):
+                items = super().load_items()
+                # The delete commits after the rows were read, before the swap,
+                # its signal reaches this index like the process-wide one
+                Product.objects.filter(id=napa.id).delete()
+                self.set_item(AutocompleteTypeChoices.PRODUCT, napa.id, None)
+                return items
+
+        index = DeleteDuringBuildIndex()
+        index.build()
+
+        self.assertEqual(index.search("napa"), [])
+        self.assertIsNone(index.pending_items)
+
+
+# * <<-------------------------------------*** Product Import Test ***-------------------------------------->>
+class ProductImportServiceTest(TestCase):
+    """
+    A broken row is reported with its line number, it never stops the import.
+    """
+
+    def test_malformed_jsonl_lines_are_row_errors(self):
+        lines = [
+            '{"product_name": "Napa"}',
+            '{"product_name": "Broken',
+            "[1, 2]",
+            '{"product_name": "Ace"}',
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl") as import_file:
+            import_file.write("\n".join(lines))
+            import_file.flush()
+            summary = ProductImportService(chunk_size=1).import_file(import_file.name)
+
+        self.assertEqual((summary.imported_rows, summary.failed_rows), (2, 2))
+        self.assertEqual([error.line_number for error in summary.errors], [2, 3])
+        self.assertEqual(
+            set(Product.objects.values_list("product_name", flat=True)),
+            {"Napa", "Ace"},
+        )
+
+    def test_generated_barcode_is_checked_against_stored_ones(self):
+        # No block cached by earlier tests, the import starts at the first counter
+        custom_id_allocator.reset()
+        product_id = f"PRO{date.today().strftime(CUSTOM_ID_DATE_FORMAT)}0001"
+        Product.objects.bulk_create(
+            [
+                Product(
+                    product_id="PROSTORED",
+                    product_name="Stored",
+                    image_alt_name="",
+                    barcode_type=ProductBarcodeChoices.MANUAL,
+                    barcode=get_generated_barcode(product_id),
+                )
+            ]
+        )
+
+        summary = ProductImportService(chunk_size=1).import_rows(
+            [
+                (1, {"product_name": "Napa", "barcode_type": "auto"}),
+                (2, {"product_name": "Ace", "barcode_type": "auto"}),
+            ]
+        )
+
+        self.assertEqual((summary.imported_rows, summary.failed_rows), (1, 1))
+        self.assertEqual(summary.errors[0].line_number, 1)
+        self.assertEqual(Product.objects.filter(product_name="Ace").count(), 1)
+
+    def test_rejected_chunk_is_reported_as_row_errors(self):
+        service = ProductImportService(chunk_size=2)
+        service.load_lookups()
+        # Stored by another writer after the lookups were loaded
+        Product.objects.bulk_create(
+            [
+                Product(
+                    product_id="PROSTORED",
+                    product_name="Stored",
+                    image_alt_name="",
+                    barcode_type=ProductBarcodeChoices.MANUAL,
+                    barcode="8901234567890",
+                )
+            ]
+        )
+
+        summary = service.import_rows(
+            [
+                (1, {"product_name": "Napa", "barcode": "8901234567890"}),
+                (2, {"product_name": "Ace"}),
+                (3, {"product_name": "Seclo"}),
+            ]
+        )
+
+        self.assertEqual((summary.imported_rows, summary.failed_rows), (1, 2))
+        self.assertEqual([error.line_number for error in summary.errors], [1, 2])
+        self.assertEqual(
+            set(Product.objects.values_list("product_name", flat=True)),
+            {"Stored", "Seclo"},
+        )
+
+
+# * <<-------------------------------------*** Product Search Test ***-------------------------------------->>
+@override_settings(PRODUCT_SEARCH_SYNC_INTERVAL=0)
+class ProductSearchTest(TestCase):
+    """
+    Inactive products ranking first must not cut a page of active results short.
+    """
+
+    def setUp(self):
+        # Documents of earlier tests were rolled back without a delete
+        product_search_index.reset()
+
+    def test_active_search_fills_the_limit(self):
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    product_id=f"PROSRC{index}",
+                    product_name=f"Searchable Tablet {index}",
+                    image_alt_name="",
+                )
+                for index in range(6)
+            ]
+        )
+        set_product_search_documents([product.pk for product in products])
+        top_ids = [product_id for product_id, _ in search_products("searchable", 3)]
+        Product.objects.filter(id__in=top_ids).update(
+            active_status=ActiveStatusChoices.INACTIVE
+        )
+
+        results = search_products("searchable", 3, active_only=True)
+
+        self.assertEqual(len(results), 3)
+        self.assertFalse({product_id for product_id, _ in results} & set(top_ids))
+
+    def test_deleted_products_leave_the_index(self):
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    product_id=f"PROSRC{index}",
+                    product_name=f"Searchable Tablet {index}",
+                    image_alt_name="",
+                )
+                for index in range(2)
+            ]
+        )
+        set_product_search_documents([product.pk for product in products])
+        self.assertEqual(len(search_products("searchable")), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            products[0].delete()
+
+        self.assertEqual(
+            [product_id for product_id, _ in search_products("searchable")],
+            [products[1].pk],
+        )
+
+    def test_deleted_medicine_info_drops_its_generic_names(self):
+        MedicineInfo = apps.get_model("medicines", "MedicineInfo")
+        GenericNameInformation = apps.get_model("medicines", "GenericNameInformation")
+        product = Product.objects.bulk_create(
+            [Product(product_id="PROSRC", product_name="Napa", image_alt_name="")]
+        )[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            medicine_info = MedicineInfo.objects.create(product=product)
+            medicine_info.generic_name.add(
+                GenericNameInformation.objects.create(generic_name="Paracetamol")
+            )
+        self.assertEqual(len(search_products("paracetamol")), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            medicine_info.delete()
+
+        self.assertEqual(search_products("paracetamol"), [])
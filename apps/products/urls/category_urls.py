@@ -0,0 +1,7 @@
+from django.urls import path
+
+from apps.products.apis.category_tree_api import CategoryTreeAPIView
+
+urlpatterns = [
+    path("tree/", CategoryTreeAPIView.as_view(), name="category_tree"),
+]
@@ -0,0 +1,21 @@
+from django.urls import path
+
+from apps.products.apis.image_rendition_api import ImageRenditionAPIView
+from apps.products.apis.product_autocomplete_api import ProductAutocompleteAPIView
+from apps.products.apis.product_export_api import ProductExportAPIView
+from apps.products.apis.product_search_api import ProductSearchAPIView
+
+urlpatterns = [
+    path(
+        "autocomplete/",
+        ProductAutocompleteAPIView.as_view(),
+        name="product_autocomplete",
+    ),
+    path(
+        "image-renditions/<str:size>/<str:file_format>/<path:name>",
+        ImageRenditionAPIView.as_view(),
+        name="image_rendition",
+    ),
+    path("export/", ProductExportAPIView.as_view(), name="product_export"),
+    path("search/", ProductSearchAPIView.as_view(), name="product_search"),
+]
@@ -8,12 +8,14 @@ from pydantic import ValidationError as PydanticError
 from pydantic_settings import BaseSettings
 
 from config.django.auth import auth_config
+from config.django.background_job import background_job_config
 from config.django.cache import cache_config
 from config.django.channel import channel_config
 from config.django.database import db_config
 from config.django.general import general_config
 from config.django.installed_apps import installed_apps_config
 from config.django.location import location_config
+from config.django.metrics import metrics_config
 from config.django.middlware import middleware_config
 from config.django.rest_framework import drf_config
 from config.django.schema import schema_config
@@ -57,6 +59,8 @@ try:
     to_django(db_config)
     to_django(channel_config)
     to_django(cache_config)
+    to_django(background_job_config)
+    to_django(metrics_config)
     to_django(session_config)
     to_django(static_config)
     to_django(drf_config)
@@ -0,0 +1,29 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.env import env_config
+
+
+class BackgroundJobSettings(BaseSettings):
+    """
+    This class defines the setting configuration for the background job queue
+    """
+
+    # Run jobs in the enqueueing process once its transaction commits, for tests and development without a worker
+    BACKGROUND_JOBS_EAGER: bool = False
+    BACKGROUND_JOB_MAX_ATTEMPTS: int = 3
+    # Seconds before the first retry, doubled on every further attempt
+    BACKGROUND_JOB_RETRY_DELAY: float = 30
+    # Seconds after which a running job is considered abandoned by a crashed worker and claimed again
+    BACKGROUND_JOB_LEASE_TIMEOUT: int = 60 * 10
+    BACKGROUND_JOB_POLL_INTERVAL: float = 1
+    # Processes of the run_background_jobs pool
+    BACKGROUND_JOB_WORKERS: int = 2
+
+    model_config = SettingsConfigDict(
+        env_file=env_config.env_file,
+        extra="ignore",
+        case_sensitive=True,
+    )
+
+
+background_job_config = BackgroundJobSettings()
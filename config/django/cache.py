@@ -19,8 +19,16 @@ class CacheSettings(BaseSettings):
     """
 
     CACHE_TTL: int = 60 * 1500
+    # The category tree blob is invalidated by version, it never needs to expire
+    CATEGORY_TREE_CACHE_TIMEOUT: int | None = None
+    CATEGORY_TREE_REBUILD_LOCK_TIMEOUT: int = 30
+    # Seconds between version checks and full rebuilds of the in-memory typeahead index
+    PRODUCT_AUTOCOMPLETE_SYNC_INTERVAL: float = 2
+    PRODUCT_AUTOCOMPLETE_REBUILD_INTERVAL: float = 60 * 15
+    # Seconds between checks of the in-process search index for changed documents
+    PRODUCT_SEARCH_SYNC_INTERVAL: float = 2
     REDIS_CACHE_BACKEND: str = Field(
-        default="django.core.cache.backends.redis.RedisCache",
+        default="apps.common.cache.instrumented_cache.InstrumentedRedisCache",
         frozen=True,
         repr=False,
     )
@@ -56,7 +64,7 @@ class CacheSettings(BaseSettings):
         if self.CACHE_BACKEND_CHOICES == "memcached":
             return {
                 "default": {
-                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                    "BACKEND": "apps.common.cache.instrumented_cache.InstrumentedLocMemCache",
                     "LOCATION": "127.0.0.1:11211",
                 }
             }
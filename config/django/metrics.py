@@ -0,0 +1,41 @@
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from config.env import env_config
+
+
+class MetricsSettings(BaseSettings):
+    """
+    This class defines the setting configuration for the /metrics endpoint
+    """
+
+    METRICS_ENABLED: bool = True
+    # Directory shared by the server worker processes, each one writes its values there. Clear it on deploy.
+    # Unset, /metrics only reports the process serving the scrape.
+    METRICS_MULTIPROCESS_DIR: str | None = None
+    # Seconds between writes of a process' values to METRICS_MULTIPROCESS_DIR
+    METRICS_FLUSH_INTERVAL: float = 5
+    METRICS_LATENCY_BUCKETS: list[float] = [
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+    ]
+    # Bearer token the scraper must send. Unset, /metrics is only served with DEBUG on
+    METRICS_AUTH_TOKEN: SecretStr | None = Field(default=None, repr=False)
+
+    model_config = SettingsConfigDict(
+        env_file=env_config.env_file,
+        extra="ignore",
+        case_sensitive=True,
+    )
+
+
+metrics_config = MetricsSettings()
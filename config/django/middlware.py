@@ -6,14 +6,30 @@ from config.env import EnvironmentChoices, env_config
 
 
 class MiddlewareSettings(BaseSettings):
+    REQUEST_TIMING_ENABLED: bool = True
+    # The Server-Timing header, only ever sent to staff users or with DEBUG on
+    REQUEST_TIMING_HEADER_ENABLED: bool = True
+    # Share of requests written to the log, slow requests are always logged
+    REQUEST_TIMING_LOG_SAMPLE_RATE: float = 0.01
+    # Requests at least this slow are logged with their queries
+    REQUEST_TIMING_SLOW_THRESHOLD_MS: float = 500
+    REQUEST_TIMING_MAX_LOGGED_QUERIES: int = 50
+    # Entries of the resolved and the unresolved URL path caches of UrlValidationMiddleware
+    URL_RESOLVE_CACHE_SIZE: int = 2048
+    URL_RESOLVE_NEGATIVE_CACHE_SIZE: int = 1024
     CUSTOM_MIDDLEWARE: list[str] = [
-        "apps.common.middleware.url_validation_middleware.UrlValidationMiddleware",
+        "apps.common.middleware.request_timing_middleware.RequestTimingMiddleware",
+        "apps.common.middleware.replica_pinning_middleware.ReplicaPinningMiddleware",
     ]
     THIRD_PARTY_PACKAGE_MIDDLEWARE: list[str] = [
         "corsheaders.middleware.CorsMiddleware",
         "whitenoise.middleware.WhiteNoiseMiddleware",
     ]
     MIDDLEWARE: list[str] = [
+        # First, so /metrics counts page cache hits too
+        "apps.common.middleware.metrics_middleware.MetricsMiddleware",
+        # Ahead of the session, cache and CSRF middleware, invalid URLs skip them
+        "apps.common.middleware.url_validation_middleware.UrlValidationMiddleware",
         "django.middleware.security.SecurityMiddleware",
         "django.contrib.sessions.middleware.SessionMiddleware",
         "django.middleware.cache.UpdateCacheMiddleware",
@@ -61,5 +77,7 @@ class MiddlewareSettings(BaseSettings):
             case EnvironmentChoices.PRODUCTION:
                 pass
 
+        return value
+
 
 middleware_config = MiddlewareSettings()
@@ -17,8 +17,14 @@ class StaticSettings(BaseSettings):
     # STATICFILES_STORAGE: str = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
     STORAGES: dict[str, dict[str, Any]] = {
+        # Uploads are stored by content hash and deduplicated
         "default": {
+            "BACKEND": "apps.common.storage.content_addressed_storage.ContentAddressedStorage",
+        },
+        # Renditions keep the name derived from their source image
+        "renditions": {
             "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"allow_overwrite": True},
         },
         "staticfiles": {
             "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
@@ -28,5 +34,21 @@ class StaticSettings(BaseSettings):
     MEDIA_URL: str = "/media/"
     MEDIA_ROOT: PosixPath = os.path.join(general_config.BASE_DIR, "media")
 
+    # Bounds checked by the background image job, uploads outside them are rejected
+    IMAGE_MIN_DIMENSIONS: tuple[int, int] = (100, 100)
+    IMAGE_MAX_DIMENSIONS: tuple[int, int] = (8000, 8000)
+    # Decompression bomb limit, width * height read from the header before any decode
+    IMAGE_MAX_PIXELS: int = 40_000_000
+    # Downscaled copies of uploaded images, stored under IMAGE_RENDITION_ROOT in the renditions storage
+    IMAGE_RENDITION_ROOT: str = "renditions"
+    # Rendition name -> bounding box, the aspect ratio is kept and images are never upscaled
+    IMAGE_RENDITION_SIZES: dict[str, tuple[int, int]] = {
+        "thumbnail": (160, 160),
+        "small": (320, 320),
+        "medium": (640, 640),
+    }
+    # Rendition format -> encoder quality, formats the installed Pillow cannot encode are skipped
+    IMAGE_RENDITION_FORMATS: dict[str, int] = {"webp": 80, "avif": 60}
+
 
 static_config = StaticSettings()
@@ -1,10 +1,12 @@
 import os
 import sys
 
-from django.core.asgi import get_asgi_application
+import django
 from loguru import logger
 from pydantic import ValidationError as PydanticError
 
+from config.server.handlers import CachedResolverASGIHandler
+
 
 def shutdown():
     # Sending a shutdown signal to uvicorn
@@ -14,7 +16,15 @@ def shutdown():
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django")
 
 try:
-    application = get_asgi_application()
+    # get_asgi_application() with the handler reusing the URL validation match
+    django.setup(set_prefix=False)
+    application = CachedResolverASGIHandler()
+    # Built in the background at startup, not by the first typeahead request
+    from apps.products.services.product_autocomplete_service import (
+        product_autocomplete_index,
+    )
+
+    product_autocomplete_index.rebuild_in_background()
 except PydanticError as error:
     logger.error(error.errors())
     shutdown()
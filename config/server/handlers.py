@@ -0,0 +1,23 @@
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+
+
+class CachedResolverHandlerMixin:
+    """
+    Reuses the ``ResolverMatch`` found by ``UrlValidationMiddleware`` instead of resolving the path again.
+    """
+
+    def resolve_request(self, request):
+        resolver_match = request.resolver_match
+        # A middleware setting request.urlconf afterwards asks for a fresh resolve
+        if resolver_match is None or hasattr(request, "urlconf"):
+            return super().resolve_request(request)
+        return resolver_match
+
+
+class CachedResolverASGIHandler(CachedResolverHandlerMixin, ASGIHandler):
+    pass
+
+
+class CachedResolverWSGIHandler(CachedResolverHandlerMixin, WSGIHandler):
+    pass
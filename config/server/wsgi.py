@@ -1,7 +1,18 @@
 import os
 
-from django.core.wsgi import get_wsgi_application
+import django
+
+from config.server.handlers import CachedResolverWSGIHandler
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django")
 
-application = get_wsgi_application()
+# get_wsgi_application() with the handler reusing the URL validation match
+django.setup(set_prefix=False)
+application = CachedResolverWSGIHandler()
+
+# Built in the background at startup, not by the first typeahead request
+from apps.products.services.product_autocomplete_service import (
+    product_autocomplete_index,
+)
+
+product_autocomplete_index.rebuild_in_background()
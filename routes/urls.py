@@ -10,10 +10,14 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from apps.common.views import metrics_view
+
 # PRE_URL = "auth-service/"
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/v1/products/", include("apps.products.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 